@@ -7,7 +7,14 @@ from sqlalchemy import create_engine
 
 from app.config import settings
 from app.infrastructure.persistence.database import Base
-from app.infrastructure.persistence.models import AlarmORM, DeviceStatusORM, ScreenORM  # noqa: F401
+from app.infrastructure.persistence.models import (  # noqa: F401
+    AlarmORM,
+    DeviceStatusORM,
+    OutboxMessageORM,
+    ScreenORM,
+    TelemetryRollupORM,
+    TelemetrySegmentORM,
+)
 
 config = context.config
 
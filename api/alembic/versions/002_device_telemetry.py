@@ -0,0 +1,54 @@
+"""Device telemetry history — encoded day segments and hourly/daily rollups.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE device_telemetry_segments (
+            id UUID PRIMARY KEY,
+            device_id VARCHAR(100) NOT NULL,
+            day DATE NOT NULL,
+            start_at TIMESTAMP NOT NULL,
+            end_at TIMESTAMP NOT NULL,
+            sample_count INTEGER NOT NULL,
+            compacted BOOLEAN NOT NULL DEFAULT false,
+            payload BYTEA NOT NULL
+        )
+    """)
+    op.execute(
+        "CREATE INDEX ix_device_telemetry_segments_device_day "
+        "ON device_telemetry_segments (device_id, day)"
+    )
+    op.execute("CREATE INDEX ix_device_telemetry_segments_day ON device_telemetry_segments (day)")
+
+    op.execute("""
+        CREATE TABLE device_telemetry_rollups (
+            device_id VARCHAR(100) NOT NULL,
+            resolution VARCHAR(10) NOT NULL,
+            bucket_start TIMESTAMP NOT NULL,
+            samples INTEGER NOT NULL,
+            battery_min SMALLINT,
+            battery_max SMALLINT,
+            battery_avg DOUBLE PRECISION,
+            max_gap_seconds INTEGER NOT NULL,
+            PRIMARY KEY (device_id, resolution, bucket_start)
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("device_telemetry_rollups")
+    op.drop_table("device_telemetry_segments")
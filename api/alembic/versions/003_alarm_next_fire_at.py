@@ -0,0 +1,31 @@
+"""Alarm next_fire_at — denormalized next occurrence with a partial index on active alarms.
+
+Existing rows start with NULL; the application fills them in when it loads the
+alarm schedule at startup.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE alarms ADD COLUMN next_fire_at TIMESTAMP")
+    op.execute(
+        "CREATE INDEX ix_alarms_next_fire_at_active "
+        "ON alarms (next_fire_at) WHERE status = 'active'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_alarms_next_fire_at_active")
+    op.execute("ALTER TABLE alarms DROP COLUMN next_fire_at")
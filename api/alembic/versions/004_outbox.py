@@ -0,0 +1,34 @@
+"""Transactional outbox — committed events awaiting delivery, one row per async subscriber.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE outbox (
+            id BIGSERIAL PRIMARY KEY,
+            event_type VARCHAR(200) NOT NULL,
+            subscriber VARCHAR(200) NOT NULL,
+            payload TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL,
+            available_at TIMESTAMP,
+            attempts INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    op.execute("CREATE INDEX ix_outbox_available_at ON outbox (available_at)")
+
+
+def downgrade() -> None:
+    op.drop_table("outbox")
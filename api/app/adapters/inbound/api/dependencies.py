@@ -1,8 +1,18 @@
-"""FastAPI dependencies — provides CommandBus to routers."""
+"""FastAPI dependencies — provides CommandBus (plus change streams)."""
 
 from app.infrastructure.command_bus import CommandBus, SimpleCommandBus
 from app.infrastructure.container import get_container
+from app.infrastructure.streaming.change_feed import ChangeFeed
+from app.infrastructure.streaming.topic_hub import TopicHub
 
 
 def get_command_bus() -> CommandBus:
     return SimpleCommandBus(get_container())
+
+
+def get_change_feed() -> ChangeFeed:
+    return get_container().change_feed
+
+
+def get_topic_hub() -> TopicHub:
+    return get_container().topic_hub
@@ -0,0 +1,35 @@
+"""ASGI middleware of the API."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.persistence.read_routing import current_client
+
+
+class ClientMiddleware:
+    """Sets `current_client` for the request, for read-your-writes routing.
+
+    The client is the X-Client-ID header if sent, else the X-Real-IP set by nginx,
+    else the peer address. Plain ASGI, so streamed responses are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        token = current_client.set(_client(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_client.reset(token)
+
+
+def _client(scope: Scope) -> str | None:
+    headers = dict(scope["headers"])
+    client = headers.get(b"x-client-id") or headers.get(b"x-real-ip")
+    if client:
+        return client.decode("latin-1")
+    peer = scope.get("client")
+    return peer[0] if peer else None
@@ -1,15 +1,23 @@
 """Inbound adapter: FastAPI router for Alarm endpoints."""
 
+from datetime import datetime, timedelta
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.adapters.inbound.api.dependencies import get_command_bus
 from app.adapters.inbound.api.schemas.alarm import AlarmCreate, AlarmResponse, AlarmUpdate
+from app.adapters.inbound.api.schemas.common import naive_utc
 from app.application.commands.alarm_commands import (
     CreateAlarmCommand,
     DeleteAlarmCommand,
+    ExpandAlarmOccurrencesCommand,
     GetActiveAlarmsCommand,
+    GetAlarmsFiringSoonCommand,
+    GetAlarmTableCommand,
+    GetNextAlarmsCommand,
     ListAlarmsCommand,
     UpdateAlarmCommand,
 )
@@ -17,6 +25,8 @@ from app.domain.models.alarm import Alarm
 
 router = APIRouter(prefix="/alarms", tags=["alarms"])
 
+MAX_OCCURRENCE_SPAN = timedelta(days=366)
+
 
 def _to_response(alarm: Alarm) -> AlarmResponse:
     return AlarmResponse(
@@ -26,6 +36,7 @@ def _to_response(alarm: Alarm) -> AlarmResponse:
         message=alarm.message,
         status=alarm.status,
         repeat_days=alarm.repeat_days,
+        next_fire_at=alarm.next_fire_at,
         created_at=alarm.created_at,
         updated_at=alarm.updated_at,
     )
@@ -45,6 +56,51 @@ async def get_active_alarms() -> list[AlarmResponse]:
     return [_to_response(a) for a in alarms]
 
 
+@router.get("/next", response_model=list[AlarmResponse])
+async def get_next_alarms(limit: int = Query(default=10, ge=1, le=1000)) -> list[AlarmResponse]:
+    """Upcoming alarms in firing order (each alarm once, at its next_fire_at)."""
+    bus = get_command_bus()
+    upcoming = await bus.execute(GetNextAlarmsCommand, params={"limit": limit})
+    return [_to_response(s.alarm) for s in upcoming]
+
+
+@router.get("/firing", response_model=list[AlarmResponse])
+async def get_alarms_firing_soon(
+    within: int = Query(default=600, ge=1, le=7 * 24 * 3600),
+) -> list[AlarmResponse]:
+    """Active alarms due to fire in the next `within` seconds, soonest first."""
+    bus = get_command_bus()
+    alarms = await bus.execute(GetAlarmsFiringSoonCommand, params={"within_seconds": within})
+    return [_to_response(a) for a in alarms]
+
+
+@router.get(
+    "/occurrences",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def get_alarm_occurrences(
+    start: Annotated[datetime, Query(alias="from")],
+    end: Annotated[datetime, Query(alias="to")],
+) -> StreamingResponse:
+    """Every alarm occurrence in [from, to), in time order, as NDJSON.
+
+    One `{"alarm_id", "name", "at"}` object per line; `at` is UTC. Naive `from`/`to`
+    are UTC. The span is limited to 366 days.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    if start >= end:
+        raise HTTPException(status_code=422, detail="'from' must be before 'to'")
+    if end - start > MAX_OCCURRENCE_SPAN:
+        raise HTTPException(status_code=422, detail="Range must not exceed 366 days")
+    bus = get_command_bus()
+    table = await bus.execute(GetAlarmTableCommand)
+    occurrences = await bus.execute(
+        ExpandAlarmOccurrencesCommand, params={"table": table, "start": start, "end": end}
+    )
+    return StreamingResponse(occurrences.ndjson(), media_type="application/x-ndjson")
+
+
 @router.post("", response_model=AlarmResponse, status_code=201)
 async def create_alarm(body: AlarmCreate) -> AlarmResponse:
     bus = get_command_bus()
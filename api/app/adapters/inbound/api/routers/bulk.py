@@ -0,0 +1,42 @@
+"""Inbound adapter: FastAPI router for bulk NDJSON export/import (backup, migration)."""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.adapters.inbound.api.dependencies import get_command_bus
+from app.adapters.inbound.api.schemas.bulk import ImportReportResponse
+from app.application.commands.bulk_commands import ExportResourceCommand, ImportResourceCommand
+from app.infrastructure.persistence.bulk_transfer import BulkResource
+
+router = APIRouter(prefix="/bulk", tags=["bulk"])
+
+
+@router.get(
+    "/{resource}",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_resource(resource: BulkResource) -> StreamingResponse:
+    """Every row of `resource`, one JSON object per line, streamed as it is read."""
+    bus = get_command_bus()
+    rows = await bus.execute(ExportResourceCommand, params={"resource": resource})
+    return StreamingResponse(
+        rows,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{resource}.ndjson"'},
+    )
+
+
+@router.post("/{resource}", response_model=ImportReportResponse)
+async def import_resource(resource: BulkResource, request: Request) -> ImportReportResponse:
+    """Load an export (NDJSON body). Existing rows are kept; invalid lines are reported."""
+    bus = get_command_bus()
+    report = await bus.execute(
+        ImportResourceCommand, params={"resource": resource, "body": request.stream()}
+    )
+    return ImportReportResponse(
+        imported=report.imported,
+        skipped=report.skipped,
+        rejected=report.rejected,
+        errors=report.errors,
+    )
@@ -1,11 +1,37 @@
 """Inbound adapter: FastAPI router for Device endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import ValidationError
 
 from app.adapters.inbound.api.dependencies import get_command_bus
-from app.adapters.inbound.api.schemas.device import DeviceStatusResponse, HeartbeatRequest
-from app.application.commands.device_commands import GetDeviceStatusCommand, RecordHeartbeatCommand
+from app.adapters.inbound.api.schemas.common import naive_utc, utc_isoformat
+from app.adapters.inbound.api.schemas.device import (
+    DeviceStatusResponse,
+    FleetDeviceResponse,
+    FleetResponse,
+    HeartbeatBatchItem,
+    HeartbeatBatchRequest,
+    HeartbeatBatchResponse,
+    HeartbeatItemStatus,
+    HeartbeatRequest,
+    HeartbeatResponse,
+    TelemetryPointResponse,
+    TelemetryResponse,
+)
+from app.application.commands.device_commands import (
+    GetDeviceStatusCommand,
+    GetDeviceTelemetryCommand,
+    ListDeviceStatusesCommand,
+    RecordHeartbeatCommand,
+    RecordHeartbeatsCommand,
+)
+from app.application.commands.screen_commands import GetNextWakeAtCommand
 from app.domain.models.device import DeviceStatus
+from app.domain.models.telemetry import TelemetryResolution
 
 router = APIRouter(prefix="/device", tags=["device"])
 
@@ -21,6 +47,26 @@ def _to_response(status: DeviceStatus) -> DeviceStatusResponse:
     )
 
 
+@router.get("/status", response_model=FleetResponse)
+async def list_device_statuses(
+    online: bool | None = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+) -> FleetResponse:
+    """Devices with their online state; `online` filters to online or offline ones."""
+    bus = get_command_bus()
+    page = await bus.execute(
+        ListDeviceStatusesCommand, params={"online": online, "offset": offset, "limit": limit}
+    )
+    return FleetResponse(
+        total=page.total,
+        devices=[
+            FleetDeviceResponse(**_to_response(d.status).model_dump(), online=d.online)
+            for d in page.devices
+        ],
+    )
+
+
 @router.get("/status/{device_id}", response_model=DeviceStatusResponse)
 async def get_device_status(device_id: str) -> DeviceStatusResponse:
     bus = get_command_bus()
@@ -30,8 +76,87 @@ async def get_device_status(device_id: str) -> DeviceStatusResponse:
     return _to_response(status)
 
 
-@router.post("/heartbeat", response_model=DeviceStatusResponse)
-async def record_heartbeat(body: HeartbeatRequest) -> DeviceStatusResponse:
+@router.get("/{device_id}/telemetry", response_model=TelemetryResponse)
+async def get_device_telemetry(
+    device_id: str,
+    start: Annotated[datetime | None, Query(alias="from")] = None,
+    end: Annotated[datetime | None, Query(alias="to")] = None,
+    resolution: TelemetryResolution | None = None,
+) -> TelemetryResponse:
+    """Heartbeat history; `from` defaults to 24h before `to`, `to` to now (UTC)."""
+    end = naive_utc(end) if end else datetime.utcnow()
+    start = naive_utc(start) if start else end - timedelta(days=1)
+    if start >= end:
+        raise HTTPException(status_code=422, detail="'from' must be before 'to'")
+    bus = get_command_bus()
+    series = await bus.execute(
+        GetDeviceTelemetryCommand,
+        params={"device_id": device_id, "start": start, "end": end, "resolution": resolution},
+    )
+    return TelemetryResponse(
+        device_id=series.device_id,
+        resolution=series.resolution,
+        points=[TelemetryPointResponse(**asdict(p)) for p in series.points],
+    )
+
+
+@router.post("/heartbeat", response_model=HeartbeatResponse)
+async def record_heartbeat(body: HeartbeatRequest, response: Response) -> HeartbeatResponse:
+    """Stores the heartbeat; `next_wake_at` (also X-Next-Wake-At) says how long to sleep."""
     bus = get_command_bus()
     status = await bus.execute(RecordHeartbeatCommand, params=body.model_dump())
-    return _to_response(status)
+    next_wake_at = await bus.execute(GetNextWakeAtCommand)
+    response.headers["X-Next-Wake-At"] = utc_isoformat(next_wake_at)
+    return HeartbeatResponse(**_to_response(status).model_dump(), next_wake_at=next_wake_at)
+
+
+def _invalid_item(index: int, item: dict, exc: ValidationError) -> HeartbeatBatchItem:
+    error = exc.errors()[0]
+    device_id = item.get("device_id")
+    return HeartbeatBatchItem(
+        index=index,
+        device_id=device_id if isinstance(device_id, str) else None,
+        status=HeartbeatItemStatus.INVALID,
+        error=f"{'.'.join(map(str, error['loc']))}: {error['msg']}",
+    )
+
+
+@router.post("/heartbeats:batch", response_model=HeartbeatBatchResponse)
+async def record_heartbeats(body: HeartbeatBatchRequest) -> HeartbeatBatchResponse:
+    """Heartbeats of many devices (e.g. forwarded by a relay) in one request.
+
+    Items are validated individually; invalid ones are reported and skipped. For a
+    device listed more than once only the last item is stored.
+    """
+    results: list[HeartbeatBatchItem] = []
+    valid: dict[str, tuple[int, HeartbeatRequest]] = {}
+    for index, item in enumerate(body.heartbeats):
+        try:
+            heartbeat = HeartbeatRequest.model_validate(item)
+        except ValidationError as exc:
+            results.append(_invalid_item(index, item, exc))
+            continue
+        superseded = valid.get(heartbeat.device_id)
+        if superseded is not None:
+            results[superseded[0]].status = HeartbeatItemStatus.SUPERSEDED
+        valid[heartbeat.device_id] = (index, heartbeat)
+        results.append(
+            HeartbeatBatchItem(
+                index=index, device_id=heartbeat.device_id, status=HeartbeatItemStatus.ACCEPTED
+            )
+        )
+
+    if valid:
+        bus = get_command_bus()
+        statuses = await bus.execute(
+            RecordHeartbeatsCommand,
+            params={"heartbeats": [hb.model_dump() for _, hb in valid.values()]},
+        )
+        for status in statuses:
+            results[valid[status.device_id][0]].id = status.id
+
+    return HeartbeatBatchResponse(
+        accepted=len(valid),
+        rejected=sum(r.status is HeartbeatItemStatus.INVALID for r in results),
+        results=results,
+    )
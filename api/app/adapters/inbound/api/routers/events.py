@@ -0,0 +1,92 @@
+"""Inbound adapter: live streams of committed changes (SSE and WebSocket).
+
+Dashboards subscribe instead of polling /screens, /alarms and /device/status. Each
+event names what changed (`screen.updated`, `device.heartbeat`, ...) and its id; the
+client refetches the resource.
+
+SSE: a `resync` event means changes were dropped because the client fell behind:
+refetch everything.
+
+WebSocket: send {"subscribe": [topics]} / {"unsubscribe": [topics]}. A connection
+that falls too far behind is closed with code 1013; reconnect and refetch.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Query, WebSocket
+from fastapi.responses import StreamingResponse
+
+from app.adapters.inbound.api.dependencies import get_change_feed, get_topic_hub
+from app.config import settings
+from app.infrastructure.streaming.topic_hub import SLOW_CONSUMER_CLOSE_CODE
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+TOPICS_DESCRIPTION = "Comma-separated: screens, alarms, device:<id>."
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx from buffering the stream.
+    "X-Accel-Buffering": "no",
+}
+
+
+@router.get("/stream")
+async def stream_changes(
+    topics: str | None = Query(default=None, description=TOPICS_DESCRIPTION + " Default: all."),
+) -> StreamingResponse:
+    feed = get_change_feed()
+    client = feed.connect(topics.split(",") if topics else None)
+
+    async def frames() -> AsyncIterator[bytes]:
+        try:
+            yield b"retry: 5000\n\n"
+            while True:
+                yield await client.next_frame(settings.change_feed_heartbeat_seconds)
+        finally:
+            feed.disconnect(client)
+
+    return StreamingResponse(frames(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.websocket("/ws")
+async def websocket_changes(
+    websocket: WebSocket,
+    topics: str | None = Query(default=None, description=TOPICS_DESCRIPTION),
+) -> None:
+    hub = get_topic_hub()
+    await websocket.accept()
+    connection = hub.connect()
+    if topics:
+        hub.subscribe(connection, _topics(topics.split(",")))
+
+    async def read() -> None:
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict):
+                continue
+            hub.subscribe(connection, _topics(message.get("subscribe", [])))
+            hub.unsubscribe(connection, _topics(message.get("unsubscribe", [])))
+
+    async def write() -> None:
+        while frames := await connection.drain():
+            for frame in frames:
+                await websocket.send_text(frame)
+        await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer")
+
+    tasks = [asyncio.create_task(read()), asyncio.create_task(write())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        hub.disconnect(connection)
+        for task in tasks:
+            task.cancel()
+        # Disconnects and malformed messages end the session; nothing to report.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _topics(topics: object) -> list[str]:
+    if not isinstance(topics, list):
+        return []
+    return [t.strip() for t in topics if isinstance(t, str) and t.strip()]
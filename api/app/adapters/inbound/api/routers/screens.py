@@ -5,19 +5,35 @@ Routers ONLY call CommandBus — never access repositories or domain services di
 
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import JSONResponse
 
 from app.adapters.inbound.api.dependencies import get_command_bus
-from app.adapters.inbound.api.schemas.screen import ScreenCreate, ScreenResponse, ScreenUpdate
+from app.adapters.inbound.api.schemas.common import utc_isoformat
+from app.adapters.inbound.api.schemas.screen import (
+    PlaylistItem,
+    PlaylistResponse,
+    ScreenCreate,
+    ScreenResponse,
+    ScreenUpdate,
+)
 from app.application.commands.screen_commands import (
     CreateScreenCommand,
     DeleteScreenCommand,
+    GetActiveScreensCommand,
     GetCurrentScreenCommand,
+    GetCurrentScreenFramebufferCommand,
+    GetNextWakeAtCommand,
     GetScreenCommand,
+    GetScreensEtagCommand,
     ListScreensCommand,
+    PlanFramebufferRefreshCommand,
     UpdateScreenCommand,
 )
+from app.config import settings
 from app.domain.models.screen import Screen
+from app.infrastructure.rendering.partial_refresh import RefreshMode
+from app.infrastructure.rendering.render_farm import RenderStatus
 
 router = APIRouter(prefix="/screens", tags=["screens"])
 
@@ -35,20 +51,163 @@ def _to_response(screen: Screen) -> ScreenResponse:
     )
 
 
+def _rendering_response() -> Response:
+    """202 while the RenderFarm is still producing the buffer — the device retries."""
+    return JSONResponse(
+        status_code=202, content={"status": RenderStatus.RENDERING}, headers={"Retry-After": "2"}
+    )
+
+
+async def _wake_headers() -> dict[str, str]:
+    """When the device should next check in (UTC); it may sleep until then."""
+    next_wake_at = await get_command_bus().execute(GetNextWakeAtCommand)
+    return {"X-Next-Wake-At": utc_isoformat(next_wake_at)}
+
+
+async def _screens_etag(if_none_match: str | None) -> tuple[str, Response | None]:
+    """Current screens ETag, plus a 304 response when the client copy is current.
+
+    The version is read BEFORE the DB query, so a concurrent write can at worst cause
+    one extra refetch — never fresh ETag on stale data.
+    """
+    bus = get_command_bus()
+    etag, matches = await bus.execute(
+        GetScreensEtagCommand, params={"if_none_match": if_none_match}
+    )
+    if matches:
+        return etag, Response(status_code=304, headers={"ETag": etag, **await _wake_headers()})
+    return etag, None
+
+
 @router.get("", response_model=list[ScreenResponse])
-async def list_screens() -> list[ScreenResponse]:
+async def list_screens(
+    response: Response, if_none_match: str | None = Header(default=None)
+) -> list[ScreenResponse] | Response:
+    etag, not_modified = await _screens_etag(if_none_match)
+    if not_modified:
+        return not_modified
+    response.headers["ETag"] = etag
     bus = get_command_bus()
     screens = await bus.execute(ListScreensCommand)
     return [_to_response(s) for s in screens]
 
 
 @router.get("/current", response_model=ScreenResponse | None)
-async def get_current_screen() -> ScreenResponse | None:
+async def get_current_screen(
+    response: Response, if_none_match: str | None = Header(default=None)
+) -> ScreenResponse | None | Response:
+    etag, not_modified = await _screens_etag(if_none_match)
+    if not_modified:
+        return not_modified
+    response.headers["ETag"] = etag
+    response.headers.update(await _wake_headers())
     bus = get_command_bus()
     screen = await bus.execute(GetCurrentScreenCommand)
     return _to_response(screen) if screen else None
 
 
+@router.get("/playlist", response_model=PlaylistResponse)
+async def get_playlist(
+    response: Response, if_none_match: str | None = Header(default=None)
+) -> PlaylistResponse | Response:
+    """All active screens plus their rotation schedule, in one request per version."""
+    etag, not_modified = await _screens_etag(if_none_match)
+    if not_modified:
+        return not_modified
+    response.headers["ETag"] = etag
+    response.headers.update(await _wake_headers())
+    bus = get_command_bus()
+    screens = await bus.execute(GetActiveScreensCommand)
+    dwell = settings.playlist_dwell_seconds
+    items = [
+        PlaylistItem(
+            id=s.id,
+            title=s.title,
+            content=s.content,
+            screen_type=s.screen_type,
+            offset=i * dwell,
+            duration=dwell,
+        )
+        for i, s in enumerate(screens)
+    ]
+    return PlaylistResponse(
+        version=etag.strip('"'), cycle_seconds=len(items) * dwell, items=items
+    )
+
+
+@router.get(
+    "/current/framebuffer",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        202: {"description": "Buffer is still rendering; retry after Retry-After seconds"},
+    },
+)
+async def get_current_screen_framebuffer(
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Packed 200x200 1bpp buffer (5000 bytes) — the device writes it straight to panel RAM."""
+    etag, not_modified = await _screens_etag(if_none_match)
+    if not_modified:
+        return not_modified
+    bus = get_command_bus()
+    framebuffer = await bus.execute(GetCurrentScreenFramebufferCommand)
+    if framebuffer is None:
+        raise HTTPException(status_code=404, detail="No active screen")
+    if framebuffer is RenderStatus.RENDERING:
+        return _rendering_response()
+    # The cached bytes object is handed to the ASGI server as-is — no copy per request.
+    return Response(
+        content=framebuffer,
+        media_type="application/octet-stream",
+        headers={"ETag": etag, **await _wake_headers()},
+    )
+
+
+@router.get(
+    "/current/framebuffer/patch",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        202: {"description": "Buffer is still rendering; retry after Retry-After seconds"},
+        304: {"description": "Device already shows the current buffer"},
+    },
+)
+async def get_current_screen_framebuffer_patch(
+    device_id: str,
+    x_framebuffer_hash: str | None = Header(default=None),
+) -> Response:
+    """Changed SSD1681 RAM windows since the buffer the device reports, or the full buffer.
+
+    X-Refresh-Mode tells the device how to apply the body: `partial` (window list, see
+    app.infrastructure.rendering.partial_refresh) or `full` (5000-byte buffer, also sent
+    when a clean refresh is due to clear ghosting). X-Framebuffer-Hash in the response
+    is what the device sends back next time.
+    """
+    bus = get_command_bus()
+    framebuffer = await bus.execute(GetCurrentScreenFramebufferCommand)
+    if framebuffer is None:
+        raise HTTPException(status_code=404, detail="No active screen")
+    if framebuffer is RenderStatus.RENDERING:
+        return _rendering_response()
+    plan = await bus.execute(
+        PlanFramebufferRefreshCommand,
+        params={
+            "device_id": device_id,
+            "base_hash": x_framebuffer_hash,
+            "framebuffer": framebuffer,
+        },
+    )
+    headers = {
+        "X-Framebuffer-Hash": plan.framebuffer_hash,
+        "X-Refresh-Mode": plan.mode,
+        **await _wake_headers(),
+    }
+    if plan.mode is RefreshMode.NONE:
+        return Response(status_code=304, headers=headers)
+    return Response(content=plan.payload, media_type="application/octet-stream", headers=headers)
+
+
 @router.get("/{screen_id}", response_model=ScreenResponse)
 async def get_screen(screen_id: UUID) -> ScreenResponse:
     bus = get_command_bus()
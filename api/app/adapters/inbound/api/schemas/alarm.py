@@ -30,7 +30,8 @@ class AlarmResponse(BaseModel):
     message: str
     status: AlarmStatus
     repeat_days: list[int]
+    next_fire_at: datetime | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True}
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""Pydantic schemas for bulk export/import — request/response DTOs."""
+
+from pydantic import BaseModel
+
+
+class ImportReportResponse(BaseModel):
+    imported: int
+    skipped: int  # already present
+    rejected: int
+    errors: list[str]  # first errors only, "line N: field: reason"
@@ -0,0 +1,13 @@
+"""Helpers shared by the API schemas and routers."""
+
+from datetime import UTC, datetime
+
+
+def utc_isoformat(at: datetime) -> str:
+    """ISO 8601 with a "Z" suffix, as pydantic writes aware UTC datetimes in bodies."""
+    return at.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+def naive_utc(at: datetime) -> datetime:
+    """Timestamps are stored as naive UTC; naive input is taken to be UTC already."""
+    return at.astimezone(UTC).replace(tzinfo=None) if at.tzinfo else at
@@ -1,9 +1,15 @@
 """Pydantic schemas for Device API — request/response DTOs."""
 
 from datetime import datetime
+from enum import StrEnum
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.domain.models.telemetry import TelemetryResolution
+
+MAX_BATCH_HEARTBEATS = 5000
 
 
 class HeartbeatRequest(BaseModel):
@@ -22,3 +28,56 @@ class DeviceStatusResponse(BaseModel):
     last_seen: datetime
 
     model_config = {"from_attributes": True}
+
+
+class HeartbeatResponse(DeviceStatusResponse):
+    next_wake_at: datetime  # UTC; the device may sleep until then
+
+
+class FleetDeviceResponse(DeviceStatusResponse):
+    online: bool
+
+
+class FleetResponse(BaseModel):
+    total: int
+    devices: list[FleetDeviceResponse]
+
+
+class HeartbeatBatchRequest(BaseModel):
+    # Items are validated one by one so a bad item does not reject the whole batch.
+    heartbeats: list[dict[str, Any]] = Field(max_length=MAX_BATCH_HEARTBEATS)
+
+
+class HeartbeatItemStatus(StrEnum):
+    ACCEPTED = "accepted"
+    SUPERSEDED = "superseded"  # a later item in the batch is for the same device
+    INVALID = "invalid"
+
+
+class HeartbeatBatchItem(BaseModel):
+    index: int
+    device_id: str | None
+    status: HeartbeatItemStatus
+    id: UUID | None = None
+    error: str | None = None
+
+
+class HeartbeatBatchResponse(BaseModel):
+    accepted: int
+    rejected: int
+    results: list[HeartbeatBatchItem]
+
+
+class TelemetryPointResponse(BaseModel):
+    at: datetime
+    samples: int
+    battery_min: int | None
+    battery_max: int | None
+    battery_avg: float | None
+    max_gap_seconds: int
+
+
+class TelemetryResponse(BaseModel):
+    device_id: str
+    resolution: TelemetryResolution
+    points: list[TelemetryPointResponse]
@@ -34,3 +34,24 @@ class ScreenResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class PlaylistItem(BaseModel):
+    id: UUID
+    title: str
+    content: str
+    screen_type: ScreenType
+    offset: int  # seconds from the start of a cycle
+    duration: int  # seconds
+
+
+class PlaylistResponse(BaseModel):
+    """Active screens for local rotation.
+
+    Show item i while (unix_time % cycle_seconds) is in [offset, offset + duration).
+    Re-fetch only when `version` (also the ETag) changes.
+    """
+
+    version: str
+    cycle_seconds: int
+    items: list[PlaylistItem]
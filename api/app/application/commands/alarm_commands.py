@@ -1,31 +1,55 @@
 """Application commands for Alarm — invoked via CommandBus."""
 
+from datetime import UTC, datetime, timedelta
 from datetime import time as dt_time
-from typing import Any
 from uuid import UUID
-
-from app.domain.events.alarm import AlarmCreatedEvent
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+from app.domain.events.alarm import (
+    AlarmCreatedEvent,
+    AlarmDeletedEvent,
+    AlarmsImportedEvent,
+    AlarmTriggeredEvent,
+    AlarmUpdatedEvent,
+)
 from app.domain.models.alarm import Alarm, AlarmStatus
 from app.domain.ports.alarm_repository import AlarmRepository
+from app.infrastructure.cache.result_cache import cached
 from app.infrastructure.commands import BaseCommand
 from app.infrastructure.decorators import transactional
 from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.scheduling.alarm_scheduler import AlarmScheduler, ScheduledAlarm
+from app.infrastructure.scheduling.occurrences import AlarmTable, Occurrences, expand
+
+ALARM_EVENTS = [
+    AlarmCreatedEvent,
+    AlarmUpdatedEvent,
+    AlarmDeletedEvent,
+    AlarmTriggeredEvent,
+    AlarmsImportedEvent,
+]
+
 
+def _reschedule(alarm: Alarm) -> None:
+    """Keep the denormalized next_fire_at in step with the alarm definition."""
+    alarm.reschedule(datetime.now(UTC), ZoneInfo(settings.timezone))
 
+
+@cached(ttl=300, invalidate_on=ALARM_EVENTS)
 class ListAlarmsCommand(BaseCommand):
     alarm_repository: AlarmRepository
-    event_bus: EventBus
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> list[Alarm]:
         return await self.alarm_repository.get_all()
 
 
+@cached(ttl=300, invalidate_on=ALARM_EVENTS)
 class GetActiveAlarmsCommand(BaseCommand):
     alarm_repository: AlarmRepository
-    event_bus: EventBus
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> list[Alarm]:
         return await self.alarm_repository.get_active()
 
@@ -47,6 +71,7 @@ class CreateAlarmCommand(BaseCommand):
             message=self.message,
             repeat_days=self.repeat_days or [],
         )
+        _reschedule(alarm)
         created = await self.alarm_repository.create(alarm)
         self.event_bus.publish(AlarmCreatedEvent(alarm_id=created.id))
         return created
@@ -79,8 +104,13 @@ class UpdateAlarmCommand(BaseCommand):
             alarm.status = AlarmStatus(self.status)
         if self.repeat_days is not None:
             alarm.repeat_days = self.repeat_days
+        # A one-shot alarm is anchored at its last edit, i.e. now.
+        alarm.updated_at = datetime.utcnow()
+        _reschedule(alarm)
 
-        return await self.alarm_repository.update(alarm)
+        updated = await self.alarm_repository.update(alarm)
+        self.event_bus.publish(AlarmUpdatedEvent(alarm_id=updated.id))
+        return updated
 
 
 class DeleteAlarmCommand(BaseCommand):
@@ -91,4 +121,100 @@ class DeleteAlarmCommand(BaseCommand):
 
     @transactional
     async def handle(self) -> bool:
-        return await self.alarm_repository.delete(self.alarm_id)
+        deleted = await self.alarm_repository.delete(self.alarm_id)
+        if deleted:
+            self.event_bus.publish(AlarmDeletedEvent(alarm_id=self.alarm_id))
+        return deleted
+
+
+@cached(ttl=300, invalidate_on=ALARM_EVENTS)
+class GetAlarmTableCommand(BaseCommand):
+    """Active alarms packed into columns for ExpandAlarmOccurrencesCommand."""
+
+    alarm_repository: AlarmRepository
+
+    @transactional(readonly=True)
+    async def handle(self) -> AlarmTable:
+        return AlarmTable.from_alarms(await self.alarm_repository.get_active())
+
+
+class ExpandAlarmOccurrencesCommand(BaseCommand):
+    """Every occurrence between `start` and `end`, sorted — for calendar views.
+
+    Pure NumPy over an already built AlarmTable: no session, no @transactional.
+    """
+
+    table: AlarmTable
+    start: datetime
+    end: datetime
+
+    async def handle(self) -> Occurrences:
+        return expand(self.table, self.start, self.end, ZoneInfo(settings.timezone))
+
+
+class GetNextAlarmsCommand(BaseCommand):
+    """Next `limit` alarm occurrences, straight from the AlarmScheduler heap — no session."""
+
+    alarm_scheduler: AlarmScheduler
+
+    limit: int = 10
+
+    async def handle(self) -> list[ScheduledAlarm]:
+        return self.alarm_scheduler.upcoming(self.limit)
+
+
+class GetAlarmsFiringSoonCommand(BaseCommand):
+    """Active alarms whose next occurrence is within `within_seconds` — an index range scan."""
+
+    alarm_repository: AlarmRepository
+
+    within_seconds: float
+
+    @transactional(readonly=True)
+    async def handle(self) -> list[Alarm]:
+        now = datetime.utcnow()
+        return await self.alarm_repository.get_firing_between(
+            now, now + timedelta(seconds=self.within_seconds)
+        )
+
+
+class LoadAlarmSchedulerCommand(BaseCommand):
+    """Schedules every active alarm at startup."""
+
+    alarm_repository: AlarmRepository
+    alarm_scheduler: AlarmScheduler
+
+    @transactional
+    async def handle(self) -> None:
+        recomputed = self.alarm_scheduler.load(await self.alarm_repository.get_active())
+        await self.alarm_repository.set_next_fire({a.id: a.next_fire_at for a in recomputed})
+
+
+class FireDueAlarmsCommand(BaseCommand):
+    """Run by the AlarmScheduler when alarms come due.
+
+    Publishes AlarmTriggeredEvent per alarm; one-shot alarms become TRIGGERED,
+    repeating ones stay ACTIVE and roll over to their next next_fire_at. The
+    scheduler itself only advances once this has committed (AdvanceAlarmSchedule
+    subscriber), so a failed commit loses no firing.
+    """
+
+    alarm_repository: AlarmRepository
+    alarm_scheduler: AlarmScheduler
+    event_bus: EventBus
+
+    @transactional
+    async def handle(self) -> None:
+        now = datetime.now(UTC)
+        fired = self.alarm_scheduler.due(now)
+        one_shot = [f.alarm.id for f in fired if not f.alarm.repeat_days]
+        if one_shot:
+            await self.alarm_repository.mark_triggered(one_shot)
+        await self.alarm_repository.set_next_fire(
+            {
+                f.alarm.id: self.alarm_scheduler.next_fire_at(f.alarm, now)
+                for f in fired
+                if f.alarm.repeat_days
+            }
+        )
+        self.event_bus.publish_many(AlarmTriggeredEvent(alarm_id=f.alarm.id) for f in fired)
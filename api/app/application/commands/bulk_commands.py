@@ -0,0 +1,58 @@
+"""Application commands for bulk export/import — invoked via CommandBus."""
+
+from collections.abc import AsyncIterable, AsyncIterator
+
+from app.domain.events.alarm import AlarmsImportedEvent
+from app.domain.events.base import Event
+from app.domain.events.device import DevicesImportedEvent
+from app.domain.events.screen import ScreensImportedEvent
+from app.infrastructure.commands import BaseCommand
+from app.infrastructure.decorators import transactional
+from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.persistence.bulk_transfer import BulkResource, BulkTransfer, ImportReport
+
+IMPORTED_EVENTS: dict[BulkResource, type[Event]] = {
+    BulkResource.SCREENS: ScreensImportedEvent,
+    BulkResource.ALARMS: AlarmsImportedEvent,
+    BulkResource.DEVICES: DevicesImportedEvent,
+}
+
+
+class ExportResourceCommand(BaseCommand):
+    """NDJSON stream of every row of `resource`.
+
+    The stream reads in a session of its own, opened only once iteration starts, so
+    there is no @transactional here.
+    """
+
+    bulk_transfer: BulkTransfer
+
+    resource: BulkResource
+
+    async def handle(self) -> AsyncIterator[bytes]:
+        return self.bulk_transfer.export(self.resource)
+
+
+class ImportResourceCommand(BaseCommand):
+    """Loads NDJSON rows of `resource`; rows are committed batch by batch as they arrive.
+
+    Imported rows publish no per-row events — one *ImportedEvent lets caches and
+    in-memory indexes reload instead.
+
+    The batches commit on their own sessions, so @transactional is not there for the
+    rows: its dispatch() writes the outbox rows of the event's AsyncSubscribers in this
+    session and commits them, then runs the CommitSubscribers.
+    """
+
+    bulk_transfer: BulkTransfer
+    event_bus: EventBus
+
+    resource: BulkResource
+    body: AsyncIterable[bytes]
+
+    @transactional
+    async def handle(self) -> ImportReport:
+        report = await self.bulk_transfer.import_ndjson(self.resource, self.body)
+        if report.imported:
+            self.event_bus.publish(IMPORTED_EVENTS[self.resource]())
+        return report
@@ -1,26 +1,108 @@
 """Application commands for Device — invoked via CommandBus."""
 
-from app.domain.events.device import DeviceHeartbeatReceivedEvent
-from app.domain.models.device import DeviceStatus
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.config import settings
+from app.domain.events.device import (
+    DeviceHeartbeatReceivedEvent,
+    DeviceOfflineEvent,
+    DeviceOnlineEvent,
+)
+from app.domain.models.device import DeviceStatus, FleetDevice, FleetPage
+from app.domain.models.telemetry import TelemetryResolution, TelemetrySeries
 from app.domain.ports.device_repository import DeviceRepository
+from app.domain.ports.telemetry_repository import TelemetryRepository
 from app.infrastructure.commands import BaseCommand
 from app.infrastructure.decorators import transactional
 from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.fleet.fleet_registry import FleetRegistry
+from app.infrastructure.persistence.heartbeat_buffer import HeartbeatBuffer
 
 
 class GetDeviceStatusCommand(BaseCommand):
+    """Latest status; reads through heartbeats not yet written by the HeartbeatBuffer."""
+
     device_repository: DeviceRepository
-    event_bus: EventBus
+    heartbeat_buffer: HeartbeatBuffer
 
     device_id: str
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> DeviceStatus | None:
-        return await self.device_repository.get_status(self.device_id)
+        pending = self.heartbeat_buffer.get(self.device_id)
+        if pending is not None and self.heartbeat_buffer.knows(self.device_id):
+            return pending
+        stored = await self.device_repository.get_status(self.device_id)
+        if stored is not None:
+            self.heartbeat_buffer.remember(stored)
+        return self.heartbeat_buffer.get(self.device_id) or stored
+
+
+class ListDeviceStatusesCommand(BaseCommand):
+    """Page of the fleet, optionally only online/offline devices (per FleetRegistry)."""
+
+    device_repository: DeviceRepository
+    heartbeat_buffer: HeartbeatBuffer
+    fleet_registry: FleetRegistry
+
+    online: bool | None = None
+    offset: int = 0
+    limit: int = 100
+
+    @transactional(readonly=True)
+    async def handle(self) -> FleetPage:
+        total, entries = self.fleet_registry.list(self.online, self.offset, self.limit)
+        stored = {
+            s.device_id: s
+            for s in await self.device_repository.get_many([e.device_id for e in entries])
+        }
+        devices = []
+        for entry in entries:
+            status = self.heartbeat_buffer.get(entry.device_id) or stored.get(entry.device_id)
+            if status is not None:
+                devices.append(FleetDevice(status=status, online=entry.online))
+        return FleetPage(total=total, devices=devices)
+
+
+class LoadFleetRegistryCommand(BaseCommand):
+    """Primes the FleetRegistry from device_status at startup."""
+
+    device_repository: DeviceRepository
+    fleet_registry: FleetRegistry
+
+    @transactional(readonly=True)
+    async def handle(self) -> None:
+        devices = await self.device_repository.list_last_seen()
+        self.fleet_registry.load(devices, now=datetime.utcnow())
+
+
+class ExpireOfflineDevicesCommand(BaseCommand):
+    """Runs every FleetRegistry tick; publishes DeviceOnlineEvent per device that came
+    back since the last tick and DeviceOfflineEvent per expired device.
+    """
+
+    fleet_registry: FleetRegistry
+    event_bus: EventBus
+
+    @transactional
+    async def handle(self) -> None:
+        for entry in self.fleet_registry.came_online():
+            self.event_bus.publish(
+                DeviceOnlineEvent(device_id=entry.device_id, occurred_on=entry.last_seen)
+            )
+        for entry in self.fleet_registry.expire(datetime.utcnow()):
+            self.event_bus.publish(
+                DeviceOfflineEvent(device_id=entry.device_id, last_seen=entry.last_seen)
+            )
 
 
 class RecordHeartbeatCommand(BaseCommand):
+    """Write-behind by default: buffered and upserted in batches by HeartbeatBuffer."""
+
     device_repository: DeviceRepository
+    heartbeat_buffer: HeartbeatBuffer
     event_bus: EventBus
 
     device_id: str
@@ -36,6 +118,73 @@ class RecordHeartbeatCommand(BaseCommand):
             firmware_version=self.firmware_version,
             battery_level=self.battery_level,
         )
-        result = await self.device_repository.upsert_heartbeat(status)
-        self.event_bus.publish(DeviceHeartbeatReceivedEvent(device_id=self.device_id))
+        if settings.heartbeat_write_behind:
+            result = self.heartbeat_buffer.add(status)
+        else:
+            result = await self.device_repository.upsert_heartbeat(status)
+        self.event_bus.publish(
+            DeviceHeartbeatReceivedEvent(device_id=self.device_id, battery_level=self.battery_level)
+        )
         return result
+
+
+class RecordHeartbeatsCommand(BaseCommand):
+    """Bulk heartbeats (relays): one set-based upsert, events published in one batch.
+
+    `heartbeats` are validated HeartbeatRequest dicts; for a device listed more than
+    once the last entry wins. Returns the stored status per device, in input order.
+    """
+
+    device_repository: DeviceRepository
+    heartbeat_buffer: HeartbeatBuffer
+    event_bus: EventBus
+
+    heartbeats: list[dict[str, Any]]
+
+    @transactional
+    async def handle(self) -> list[DeviceStatus]:
+        latest = {hb["device_id"]: DeviceStatus(**hb) for hb in self.heartbeats}
+        statuses = list(latest.values())
+        if settings.heartbeat_write_behind:
+            statuses = self.heartbeat_buffer.add_many(statuses)
+        else:
+            ids = await self.device_repository.upsert_many(statuses)
+            statuses = [
+                replace(s, id=ids[s.device_id]) if s.device_id in ids else s for s in statuses
+            ]
+        self.event_bus.publish_many(
+            DeviceHeartbeatReceivedEvent(device_id=s.device_id, battery_level=s.battery_level)
+            for s in statuses
+        )
+        return statuses
+
+
+class GetDeviceTelemetryCommand(BaseCommand):
+    """Battery/connectivity history between `start` and `end` (naive UTC).
+
+    Without an explicit resolution the coarsest one that still gives a useful curve
+    for the span is used, so long ranges are served from daily rollups.
+    """
+
+    telemetry_repository: TelemetryRepository
+
+    device_id: str
+    start: datetime
+    end: datetime
+    resolution: TelemetryResolution | None = None
+
+    @transactional(readonly=True)
+    async def handle(self) -> TelemetrySeries:
+        resolution = self.resolution or _auto_resolution(self.end - self.start)
+        points = await self.telemetry_repository.get_points(
+            self.device_id, resolution, self.start, self.end
+        )
+        return TelemetrySeries(self.device_id, resolution, points)
+
+
+def _auto_resolution(span: timedelta) -> TelemetryResolution:
+    if span <= timedelta(days=1):
+        return TelemetryResolution.RAW
+    if span <= timedelta(days=60):
+        return TelemetryResolution.HOUR
+    return TelemetryResolution.DAY
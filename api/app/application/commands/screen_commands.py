@@ -4,45 +4,123 @@ Each command's handle() is decorated with @transactional:
   1. Executes business logic
   2. Publishes domain events
   3. @transactional flushes, dispatches events, commits
+
+Pure reads use @transactional(readonly=True): a read-only session, no flush, dispatch
+or commit.
+
+Read commands marked @cached are served from the ResultCache until a screen event commits.
 """
 
-from datetime import time as dt_time
-from typing import Any
+from datetime import datetime
 from uuid import UUID
 
-from app.domain.events.screen import ScreenCreatedEvent, ScreenDeletedEvent, ScreenUpdatedEvent
+from app.domain.events.screen import (
+    ScreenCreatedEvent,
+    ScreenDeletedEvent,
+    ScreensImportedEvent,
+    ScreenUpdatedEvent,
+)
 from app.domain.models.screen import Screen, ScreenType
 from app.domain.ports.screen_repository import ScreenRepository
+from app.infrastructure.cache.result_cache import cached
+from app.infrastructure.cache.versions import SCREENS_RESOURCE, ResourceVersions
 from app.infrastructure.commands import BaseCommand
 from app.infrastructure.decorators import transactional
 from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.rendering.partial_refresh import RefreshPlan, RefreshPlanner
+from app.infrastructure.rendering.render_farm import RenderFarm, RenderStatus
+from app.infrastructure.scheduling.wake_index import WakeIndex
+
+SCREEN_EVENTS = [ScreenCreatedEvent, ScreenUpdatedEvent, ScreenDeletedEvent, ScreensImportedEvent]
 
 
+@cached(ttl=300, invalidate_on=SCREEN_EVENTS)
 class ListScreensCommand(BaseCommand):
     screen_repository: ScreenRepository
-    event_bus: EventBus
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> list[Screen]:
         return await self.screen_repository.get_all()
 
 
+@cached(ttl=300, invalidate_on=SCREEN_EVENTS)
 class GetCurrentScreenCommand(BaseCommand):
     screen_repository: ScreenRepository
-    event_bus: EventBus
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> Screen | None:
         return await self.screen_repository.get_current()
 
 
+@cached(ttl=300, invalidate_on=SCREEN_EVENTS)
+class GetActiveScreensCommand(BaseCommand):
+    """All active screens in display order — the device playlist."""
+
+    screen_repository: ScreenRepository
+
+    @transactional(readonly=True)
+    async def handle(self) -> list[Screen]:
+        return await self.screen_repository.get_active()
+
+
+@cached(
+    ttl=300,
+    invalidate_on=SCREEN_EVENTS,
+    should_cache=lambda result: result is not RenderStatus.RENDERING,
+)
+class GetCurrentScreenFramebufferCommand(BaseCommand):
+    """Current screen as the packed 1bpp SSD1681 buffer, or None if no screen is active.
+
+    Never renders inline: returns RenderStatus.RENDERING until the RenderFarm is done.
+    """
+
+    screen_repository: ScreenRepository
+    render_farm: RenderFarm
+
+    @transactional(readonly=True)
+    async def handle(self) -> bytes | RenderStatus | None:
+        screen = await self.screen_repository.get_current()
+        return self.render_farm.get(screen) if screen else None
+
+
+class GetScreensEtagCommand(BaseCommand):
+    """Current ETag of the screens collection, and whether `if_none_match` matches it.
+
+    In-memory version lookup: no session, no @transactional. Executed BEFORE the DB
+    query, so a concurrent write can at worst cause one extra refetch.
+    """
+
+    resource_versions: ResourceVersions
+
+    if_none_match: str | None = None
+
+    async def handle(self) -> tuple[str, bool]:
+        etag = self.resource_versions.etag(SCREENS_RESOURCE)
+        return etag, self.resource_versions.matches(etag, self.if_none_match)
+
+
+class PlanFramebufferRefreshCommand(BaseCommand):
+    """Full buffer, changed windows only, or nothing — for what `device_id` displays.
+
+    Pure in-memory planning on an already rendered buffer: no session, no @transactional.
+    """
+
+    refresh_planner: RefreshPlanner
+
+    device_id: str
+    base_hash: str | None = None
+    framebuffer: bytes
+
+    async def handle(self) -> RefreshPlan:
+        return self.refresh_planner.plan(self.device_id, self.base_hash, self.framebuffer)
+
+
 class GetScreenCommand(BaseCommand):
     screen_repository: ScreenRepository
-    event_bus: EventBus
 
     screen_id: UUID
 
-    @transactional
+    @transactional(readonly=True)
     async def handle(self) -> Screen | None:
         return await self.screen_repository.get_by_id(self.screen_id)
 
@@ -114,3 +192,27 @@ class DeleteScreenCommand(BaseCommand):
         if deleted:
             self.event_bus.publish(ScreenDeletedEvent(screen_id=self.screen_id))
         return deleted
+
+
+class LoadWakeIndexCommand(BaseCommand):
+    """Primes the WakeIndex with the active screen count at startup."""
+
+    screen_repository: ScreenRepository
+    wake_index: WakeIndex
+
+    @transactional(readonly=True)
+    async def handle(self) -> None:
+        self.wake_index.load(len(await self.screen_repository.get_active()))
+
+
+class GetNextWakeAtCommand(BaseCommand):
+    """When a device should next check in: aware UTC, whole seconds.
+
+    WakeIndex lookup in memory: no session, no @transactional. Cheap enough to run on
+    every device request.
+    """
+
+    wake_index: WakeIndex
+
+    async def handle(self) -> datetime:
+        return self.wake_index.next_wake_at().replace(microsecond=0)
@@ -0,0 +1,83 @@
+"""Subscribers for Alarm events.
+
+SubscriberCommands run inside the existing @transactional — NEVER add @transactional here.
+"""
+
+import logging
+from uuid import UUID
+
+from app.domain.ports.alarm_repository import AlarmRepository
+from app.infrastructure.commands import SubscriberCommand
+from app.infrastructure.events.subscriber import (
+    AsyncSubscriber,
+    CommitSubscriber,
+    SyncSubscriber,
+)
+from app.infrastructure.scheduling.alarm_scheduler import AlarmScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class LogAlarmTriggeredCommand(SubscriberCommand):
+    alarm_id: UUID
+
+    async def handle(self) -> None:
+        logger.info("Alarm triggered: %s", self.alarm_id)
+
+
+class RefreshAlarmScheduleCommand(SubscriberCommand):
+    """Reschedules the alarm, or drops it when deleted. Runs after commit."""
+
+    alarm_repository: AlarmRepository
+    alarm_scheduler: AlarmScheduler
+
+    alarm_id: UUID
+
+    async def handle(self) -> None:
+        alarm = await self.alarm_repository.get_by_id(self.alarm_id)
+        if alarm is None:
+            self.alarm_scheduler.remove(self.alarm_id)
+        else:
+            self.alarm_scheduler.set(alarm)
+
+
+class AdvanceAlarmScheduleCommand(SubscriberCommand):
+    """Moves the fired alarm to its next occurrence. Runs after the firing committed."""
+
+    alarm_scheduler: AlarmScheduler
+
+    alarm_id: UUID
+
+    async def handle(self) -> None:
+        self.alarm_scheduler.advance(self.alarm_id)
+
+
+class ReloadAlarmScheduleCommand(SubscriberCommand):
+    """Reschedules every active alarm after a bulk import. Runs in the background.
+
+    Imported rows keep their exported next_fire_at, which may have passed; the ones
+    the scheduler recomputed are stored in this subscriber's own transaction.
+    """
+
+    alarm_repository: AlarmRepository
+    alarm_scheduler: AlarmScheduler
+
+    async def handle(self) -> None:
+        recomputed = self.alarm_scheduler.load(await self.alarm_repository.get_active())
+        await self.alarm_repository.set_next_fire({a.id: a.next_fire_at for a in recomputed})
+
+
+class LogAlarmTriggeredSubscriber(SyncSubscriber):
+    command = LogAlarmTriggeredCommand
+
+
+class RefreshAlarmScheduleSubscriber(CommitSubscriber):
+    command = RefreshAlarmScheduleCommand
+
+
+class AdvanceAlarmScheduleSubscriber(CommitSubscriber):
+    command = AdvanceAlarmScheduleCommand
+
+
+class ReloadAlarmScheduleSubscriber(AsyncSubscriber):
+    command = ReloadAlarmScheduleCommand
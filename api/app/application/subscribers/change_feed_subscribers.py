@@ -0,0 +1,134 @@
+"""Subscribers pushing committed changes to live clients (SSE ChangeFeed, WebSocket TopicHub).
+
+All of them are CommitSubscribers: a client told about a change must be able to
+refetch it, so nothing is pushed before the transaction has committed.
+"""
+
+from abc import abstractmethod
+from datetime import datetime
+from typing import ClassVar
+from uuid import UUID
+
+from app.infrastructure.commands import SubscriberCommand
+from app.infrastructure.events.subscriber import CommitSubscriber
+from app.infrastructure.streaming.change import Change
+from app.infrastructure.streaming.change_feed import ChangeFeed
+from app.infrastructure.streaming.topic_hub import TopicHub
+
+SCREENS_TOPIC = "screens"
+ALARMS_TOPIC = "alarms"
+
+
+def device_topic(device_id: str) -> str:
+    return f"device:{device_id}"
+
+
+# --- SubscriberCommand: one per event, ids mapped from event fields ---
+
+
+class PublishChangeCommand(SubscriberCommand):
+    change_feed: ChangeFeed
+    topic_hub: TopicHub
+
+    occurred_on: datetime
+
+    change_type: ClassVar[str]
+
+    @abstractmethod
+    def change(self) -> Change:
+        ...
+
+    async def handle(self) -> None:
+        change = self.change()
+        self.change_feed.publish(change)
+        self.topic_hub.publish(change)
+
+
+class PublishScreenChangeCommand(PublishChangeCommand):
+    screen_id: UUID
+
+    def change(self) -> Change:
+        return Change(self.change_type, SCREENS_TOPIC, str(self.screen_id), self.occurred_on)
+
+
+class PublishScreenCreatedCommand(PublishScreenChangeCommand):
+    change_type = "screen.created"
+
+
+class PublishScreenUpdatedCommand(PublishScreenChangeCommand):
+    change_type = "screen.updated"
+
+
+class PublishScreenDeletedCommand(PublishScreenChangeCommand):
+    change_type = "screen.deleted"
+
+
+class PublishAlarmChangeCommand(PublishChangeCommand):
+    alarm_id: UUID
+
+    def change(self) -> Change:
+        return Change(self.change_type, ALARMS_TOPIC, str(self.alarm_id), self.occurred_on)
+
+
+class PublishAlarmCreatedCommand(PublishAlarmChangeCommand):
+    change_type = "alarm.created"
+
+
+class PublishAlarmTriggeredCommand(PublishAlarmChangeCommand):
+    change_type = "alarm.triggered"
+
+
+class PublishDeviceChangeCommand(PublishChangeCommand):
+    device_id: str
+
+    def change(self) -> Change:
+        return Change(
+            self.change_type, device_topic(self.device_id), self.device_id, self.occurred_on
+        )
+
+
+class PublishHeartbeatCommand(PublishDeviceChangeCommand):
+    change_type = "device.heartbeat"
+
+
+class PublishDeviceOnlineCommand(PublishDeviceChangeCommand):
+    change_type = "device.online"
+
+
+class PublishDeviceOfflineCommand(PublishDeviceChangeCommand):
+    change_type = "device.offline"
+
+
+# --- Subscriber: links event → command ---
+
+
+class PublishScreenCreatedSubscriber(CommitSubscriber):
+    command = PublishScreenCreatedCommand
+
+
+class PublishScreenUpdatedSubscriber(CommitSubscriber):
+    command = PublishScreenUpdatedCommand
+
+
+class PublishScreenDeletedSubscriber(CommitSubscriber):
+    command = PublishScreenDeletedCommand
+
+
+class PublishAlarmCreatedSubscriber(CommitSubscriber):
+    command = PublishAlarmCreatedCommand
+
+
+class PublishAlarmTriggeredSubscriber(CommitSubscriber):
+    command = PublishAlarmTriggeredCommand
+
+
+class PublishHeartbeatSubscriber(CommitSubscriber):
+    command = PublishHeartbeatCommand
+
+
+class PublishDeviceOnlineSubscriber(CommitSubscriber):
+    command = PublishDeviceOnlineCommand
+
+
+class PublishDeviceOfflineSubscriber(CommitSubscriber):
+    command = PublishDeviceOfflineCommand
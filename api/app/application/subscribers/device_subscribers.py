@@ -4,9 +4,18 @@ SubscriberCommands run inside the existing @transactional — NEVER add @transac
 """
 
 import logging
+from datetime import datetime
 
+from app.domain.models.telemetry import HeartbeatSample
+from app.domain.ports.device_repository import DeviceRepository
 from app.infrastructure.commands import SubscriberCommand
-from app.infrastructure.events.subscriber import SyncSubscriber
+from app.infrastructure.events.subscriber import (
+    AsyncSubscriber,
+    CommitSubscriber,
+    SyncSubscriber,
+)
+from app.infrastructure.fleet.fleet_registry import FleetRegistry
+from app.infrastructure.persistence.telemetry_recorder import TelemetryRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -18,5 +27,57 @@ class LogHeartbeatCommand(SubscriberCommand):
         logger.info("Heartbeat received from device: %s", self.device_id)
 
 
+class TrackHeartbeatCommand(SubscriberCommand):
+    """Updates the FleetRegistry. Runs after commit, so a rolled-back heartbeat never
+    marks the device online; ExpireOfflineDevicesCommand announces it coming back.
+    """
+
+    fleet_registry: FleetRegistry
+
+    device_id: str
+    occurred_on: datetime
+
+    async def handle(self) -> None:
+        self.fleet_registry.seen(self.device_id, self.occurred_on)
+
+
+class RecordTelemetryCommand(SubscriberCommand):
+    """Appends the heartbeat to the device's telemetry history. Runs after commit."""
+
+    telemetry_recorder: TelemetryRecorder
+
+    device_id: str
+    battery_level: int | None
+    occurred_on: datetime
+
+    async def handle(self) -> None:
+        self.telemetry_recorder.record(
+            HeartbeatSample(self.device_id, self.occurred_on, self.battery_level)
+        )
+
+
+class ReloadFleetRegistryCommand(SubscriberCommand):
+    """Registers bulk-imported devices with the FleetRegistry. Runs in the background."""
+
+    device_repository: DeviceRepository
+    fleet_registry: FleetRegistry
+
+    async def handle(self) -> None:
+        devices = await self.device_repository.list_last_seen()
+        self.fleet_registry.load(devices, now=datetime.utcnow())
+
+
 class LogHeartbeatSubscriber(SyncSubscriber):
     command = LogHeartbeatCommand
+
+
+class TrackHeartbeatSubscriber(CommitSubscriber):
+    command = TrackHeartbeatCommand
+
+
+class RecordTelemetrySubscriber(CommitSubscriber):
+    command = RecordTelemetryCommand
+
+
+class ReloadFleetRegistrySubscriber(AsyncSubscriber):
+    command = ReloadFleetRegistryCommand
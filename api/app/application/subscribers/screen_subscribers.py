@@ -7,8 +7,16 @@ Subscribers link events to commands. Registered in app.main.prepare().
 import logging
 from uuid import UUID
 
+from app.domain.ports.screen_repository import ScreenRepository
+from app.infrastructure.cache.versions import SCREENS_RESOURCE, ResourceVersions
 from app.infrastructure.commands import SubscriberCommand
-from app.infrastructure.events.subscriber import SyncSubscriber
+from app.infrastructure.events.subscriber import (
+    AsyncSubscriber,
+    CommitSubscriber,
+    SyncSubscriber,
+)
+from app.infrastructure.rendering.render_farm import RenderFarm
+from app.infrastructure.scheduling.wake_index import WakeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +31,54 @@ class LogScreenCreatedCommand(SubscriberCommand):
         logger.info("Screen created: %s", self.screen_id)
 
 
+class BumpScreensVersionCommand(SubscriberCommand):
+    """Invalidates ETags of /screens and /screens/current. Runs after commit."""
+
+    resource_versions: ResourceVersions
+
+    async def handle(self) -> None:
+        self.resource_versions.bump(SCREENS_RESOURCE)
+
+
+class ScheduleScreenRenderCommand(SubscriberCommand):
+    """Queues a pre-render of the changed screen. Runs in the background after commit."""
+
+    screen_repository: ScreenRepository
+    render_farm: RenderFarm
+
+    screen_id: UUID
+
+    async def handle(self) -> None:
+        screen = await self.screen_repository.get_by_id(self.screen_id)
+        if screen and screen.is_active:
+            self.render_farm.submit(screen)
+
+
+class RefreshWakeScreensCommand(SubscriberCommand):
+    """Recounts active screens for the WakeIndex and marks edit activity. Runs in background."""
+
+    screen_repository: ScreenRepository
+    wake_index: WakeIndex
+
+    async def handle(self) -> None:
+        self.wake_index.screens_changed(len(await self.screen_repository.get_active()))
+
+
 # --- Subscriber: links event → command ---
 
 
 class LogScreenCreatedSubscriber(SyncSubscriber):
     command = LogScreenCreatedCommand
+
+
+class BumpScreensVersionSubscriber(CommitSubscriber):
+    command = BumpScreensVersionCommand
+
+
+class ScheduleScreenRenderSubscriber(AsyncSubscriber):
+    command = ScheduleScreenRenderCommand
+    concurrency = 4
+
+
+class RefreshWakeScreensSubscriber(AsyncSubscriber):
+    command = RefreshWakeScreensCommand
@@ -1,14 +1,37 @@
+from app.domain.events.alarm import (
+    AlarmCreatedEvent,
+    AlarmDeletedEvent,
+    AlarmsImportedEvent,
+    AlarmTriggeredEvent,
+    AlarmUpdatedEvent,
+)
 from app.domain.events.base import Event
-from app.domain.events.screen import ScreenCreatedEvent, ScreenUpdatedEvent, ScreenDeletedEvent
-from app.domain.events.alarm import AlarmCreatedEvent, AlarmTriggeredEvent
-from app.domain.events.device import DeviceHeartbeatReceivedEvent
+from app.domain.events.device import (
+    DeviceHeartbeatReceivedEvent,
+    DeviceOfflineEvent,
+    DeviceOnlineEvent,
+    DevicesImportedEvent,
+)
+from app.domain.events.screen import (
+    ScreenCreatedEvent,
+    ScreenDeletedEvent,
+    ScreensImportedEvent,
+    ScreenUpdatedEvent,
+)
 
 __all__ = [
     "Event",
     "ScreenCreatedEvent",
     "ScreenUpdatedEvent",
     "ScreenDeletedEvent",
+    "ScreensImportedEvent",
     "AlarmCreatedEvent",
     "AlarmTriggeredEvent",
+    "AlarmUpdatedEvent",
+    "AlarmDeletedEvent",
+    "AlarmsImportedEvent",
     "DeviceHeartbeatReceivedEvent",
+    "DeviceOnlineEvent",
+    "DeviceOfflineEvent",
+    "DevicesImportedEvent",
 ]
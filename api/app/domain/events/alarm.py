@@ -14,3 +14,18 @@ class AlarmCreatedEvent(Event):
 @dataclass(frozen=True)
 class AlarmTriggeredEvent(Event):
     alarm_id: UUID = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class AlarmUpdatedEvent(Event):
+    alarm_id: UUID = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class AlarmDeletedEvent(Event):
+    alarm_id: UUID = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class AlarmsImportedEvent(Event):
+    """Alarms were bulk-loaded without per-alarm events."""
@@ -1,6 +1,7 @@
 """Domain events related to Device."""
 
 from dataclasses import dataclass
+from datetime import datetime
 
 from app.domain.events.base import Event
 
@@ -8,3 +9,20 @@ from app.domain.events.base import Event
 @dataclass(frozen=True)
 class DeviceHeartbeatReceivedEvent(Event):
     device_id: str = ""
+    battery_level: int | None = None
+
+
+@dataclass(frozen=True)
+class DeviceOnlineEvent(Event):
+    device_id: str = ""
+
+
+@dataclass(frozen=True)
+class DeviceOfflineEvent(Event):
+    device_id: str = ""
+    last_seen: datetime = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class DevicesImportedEvent(Event):
+    """Device statuses were bulk-loaded without heartbeat events."""
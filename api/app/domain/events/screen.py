@@ -19,3 +19,8 @@ class ScreenUpdatedEvent(Event):
 @dataclass(frozen=True)
 class ScreenDeletedEvent(Event):
     screen_id: UUID = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class ScreensImportedEvent(Event):
+    """Screens were bulk-loaded without per-screen events."""
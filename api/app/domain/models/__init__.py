@@ -1,5 +1,23 @@
-from app.domain.models.screen import Screen, ScreenType
 from app.domain.models.alarm import Alarm, AlarmStatus
-from app.domain.models.device import DeviceStatus
+from app.domain.models.device import DeviceStatus, FleetDevice, FleetPage
+from app.domain.models.screen import Screen, ScreenType
+from app.domain.models.telemetry import (
+    HeartbeatSample,
+    TelemetryPoint,
+    TelemetryResolution,
+    TelemetrySeries,
+)
 
-__all__ = ["Screen", "ScreenType", "Alarm", "AlarmStatus", "DeviceStatus"]
+__all__ = [
+    "Screen",
+    "ScreenType",
+    "Alarm",
+    "AlarmStatus",
+    "DeviceStatus",
+    "FleetDevice",
+    "FleetPage",
+    "HeartbeatSample",
+    "TelemetryPoint",
+    "TelemetryResolution",
+    "TelemetrySeries",
+]
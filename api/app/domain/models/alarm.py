@@ -1,7 +1,7 @@
 """Domain entity: Alarm — pure Python, no framework dependencies."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, time
+from datetime import UTC, datetime, time, timedelta, tzinfo
 from enum import StrEnum
 from uuid import UUID, uuid4
 
@@ -19,6 +19,37 @@ class Alarm:
     message: str = ""
     status: AlarmStatus = AlarmStatus.ACTIVE
     repeat_days: list[int] = field(default_factory=list)
+    next_fire_at: datetime | None = None  # naive UTC, denormalized from the fields above
     id: UUID = field(default_factory=uuid4)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def next_occurrence(self, after: datetime, tz: tzinfo) -> datetime | None:
+        """First time strictly after `after` (aware) that this alarm fires, or None.
+
+        `trigger_time` is wall-clock time in `tz`. `repeat_days` are weekdays,
+        0 = Monday .. 6 = Sunday; with no repeat days the alarm fires once, at the
+        first `trigger_time` after it was last edited.
+        """
+        if self.status is not AlarmStatus.ACTIVE:
+            return None
+        if not self.repeat_days:
+            edited = self.updated_at.replace(tzinfo=UTC).astimezone(tz)
+            once = datetime.combine(edited.date(), self.trigger_time, tzinfo=tz)
+            if once < edited:
+                once += timedelta(days=1)
+            return once if once > after else None
+        local_date = after.astimezone(tz).date()
+        for offset in range(8):
+            day = local_date + timedelta(days=offset)
+            if day.weekday() in self.repeat_days:
+                candidate = datetime.combine(day, self.trigger_time, tzinfo=tz)
+                if candidate > after:
+                    return candidate
+        return None
+
+    def reschedule(self, after: datetime, tz: tzinfo) -> datetime | None:
+        """Recompute and store `next_fire_at` (naive UTC) from `after` (aware)."""
+        at = self.next_occurrence(after, tz)
+        self.next_fire_at = at.astimezone(UTC).replace(tzinfo=None) if at else None
+        return self.next_fire_at
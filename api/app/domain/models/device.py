@@ -13,3 +13,15 @@ class DeviceStatus:
     battery_level: int | None = None
     last_seen: datetime = field(default_factory=datetime.utcnow)
     id: UUID = field(default_factory=uuid4)
+
+
+@dataclass
+class FleetDevice:
+    status: DeviceStatus
+    online: bool
+
+
+@dataclass
+class FleetPage:
+    total: int
+    devices: list[FleetDevice]
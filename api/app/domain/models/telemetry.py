@@ -0,0 +1,38 @@
+"""Domain entities: device telemetry history — pure Python, no framework dependencies."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class TelemetryResolution(StrEnum):
+    RAW = "raw"
+    HOUR = "hour"
+    DAY = "day"
+
+
+@dataclass
+class HeartbeatSample:
+    device_id: str
+    at: datetime
+    battery_level: int | None = None
+
+
+@dataclass
+class TelemetryPoint:
+    """One raw sample or one rollup bucket starting at `at`."""
+
+    at: datetime
+    samples: int
+    battery_min: int | None
+    battery_max: int | None
+    battery_avg: float | None
+    # Longest silence between consecutive heartbeats ending in this bucket.
+    max_gap_seconds: int
+
+
+@dataclass
+class TelemetrySeries:
+    device_id: str
+    resolution: TelemetryResolution
+    points: list[TelemetryPoint]
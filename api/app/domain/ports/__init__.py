@@ -1,5 +1,13 @@
-from app.domain.ports.screen_repository import ScreenRepository
 from app.domain.ports.alarm_repository import AlarmRepository
 from app.domain.ports.device_repository import DeviceRepository
+from app.domain.ports.screen_renderer import ScreenRenderer
+from app.domain.ports.screen_repository import ScreenRepository
+from app.domain.ports.telemetry_repository import TelemetryRepository
 
-__all__ = ["ScreenRepository", "AlarmRepository", "DeviceRepository"]
+__all__ = [
+    "ScreenRepository",
+    "AlarmRepository",
+    "DeviceRepository",
+    "ScreenRenderer",
+    "TelemetryRepository",
+]
@@ -1,6 +1,8 @@
 """Port: Alarm repository interface — domain defines the contract."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
 from app.domain.models.alarm import Alarm
@@ -30,3 +32,27 @@ class AlarmRepository(ABC):
     @abstractmethod
     async def delete(self, alarm_id: UUID) -> bool:
         ...
+
+    @abstractmethod
+    async def get_firing_between(self, start: datetime, end: datetime) -> list[Alarm]:
+        """Active alarms with start <= next_fire_at < end (naive UTC), soonest first."""
+        ...
+
+    @abstractmethod
+    async def set_next_fire(self, next_fire: dict[UUID, datetime | None]) -> None:
+        ...
+
+    @abstractmethod
+    async def mark_triggered(self, alarm_ids: list[UUID]) -> None:
+        """Set still-active alarms to TRIGGERED (one-shot alarms that have fired)."""
+        ...
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int) -> AsyncIterator[list[Alarm]]:
+        """Every row, `chunk_size` at a time, without loading the table into memory."""
+        ...
+
+    @abstractmethod
+    async def insert_many(self, alarms: list[Alarm]) -> int:
+        """Bulk insert; rows that already exist are skipped. Returns the number inserted."""
+        ...
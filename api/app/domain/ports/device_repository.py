@@ -1,6 +1,9 @@
 """Port: Device repository interface — domain defines the contract."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
 
 from app.domain.models.device import DeviceStatus
 
@@ -10,6 +13,29 @@ class DeviceRepository(ABC):
     async def get_status(self, device_id: str) -> DeviceStatus | None:
         ...
 
+    @abstractmethod
+    async def get_many(self, device_ids: list[str]) -> list[DeviceStatus]:
+        ...
+
+    @abstractmethod
+    async def list_last_seen(self) -> list[tuple[str, datetime]]:
+        ...
+
     @abstractmethod
     async def upsert_heartbeat(self, status: DeviceStatus) -> DeviceStatus:
         ...
+
+    @abstractmethod
+    async def upsert_many(self, statuses: list[DeviceStatus]) -> dict[str, UUID]:
+        """Upsert latest statuses in one statement; returns device_id -> stored row id."""
+        ...
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int) -> AsyncIterator[list[DeviceStatus]]:
+        """Every row, `chunk_size` at a time, without loading the table into memory."""
+        ...
+
+    @abstractmethod
+    async def insert_many(self, statuses: list[DeviceStatus]) -> int:
+        """Bulk insert; rows that already exist are skipped. Returns the number inserted."""
+        ...
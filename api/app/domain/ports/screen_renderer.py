@@ -0,0 +1,12 @@
+"""Port: Screen renderer interface — turns a Screen into the panel framebuffer."""
+
+from abc import ABC, abstractmethod
+
+from app.domain.models.screen import Screen
+
+
+class ScreenRenderer(ABC):
+    @abstractmethod
+    def render(self, screen: Screen) -> bytes:
+        """Packed 1bpp 200x200 buffer (5000 bytes) in SSD1681 RAM layout."""
+        ...
@@ -1,6 +1,7 @@
 """Port: Screen repository interface — domain defines the contract."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from app.domain.models.screen import Screen
@@ -19,6 +20,10 @@ class ScreenRepository(ABC):
     async def get_current(self) -> Screen | None:
         ...
 
+    @abstractmethod
+    async def get_active(self) -> list[Screen]:
+        ...
+
     @abstractmethod
     async def create(self, screen: Screen) -> Screen:
         ...
@@ -30,3 +35,13 @@ class ScreenRepository(ABC):
     @abstractmethod
     async def delete(self, screen_id: UUID) -> bool:
         ...
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int) -> AsyncIterator[list[Screen]]:
+        """Every row, `chunk_size` at a time, without loading the table into memory."""
+        ...
+
+    @abstractmethod
+    async def insert_many(self, screens: list[Screen]) -> int:
+        """Bulk insert; rows that already exist are skipped. Returns the number inserted."""
+        ...
@@ -0,0 +1,36 @@
+"""Port: Telemetry repository interface — heartbeat history and its rollups."""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+from app.domain.models.telemetry import HeartbeatSample, TelemetryPoint, TelemetryResolution
+
+
+class TelemetryRepository(ABC):
+    @abstractmethod
+    async def append(self, samples: list[HeartbeatSample]) -> None:
+        ...
+
+    @abstractmethod
+    async def get_points(
+        self,
+        device_id: str,
+        resolution: TelemetryResolution,
+        start: datetime,
+        end: datetime,
+    ) -> list[TelemetryPoint]:
+        ...
+
+    @abstractmethod
+    async def uncompacted_days(self, before: date) -> list[date]:
+        ...
+
+    @abstractmethod
+    async def compact(self, day: date) -> int:
+        """Merge the day's samples per device and store its rollups; returns devices."""
+        ...
+
+    @abstractmethod
+    async def prune(self, resolution: TelemetryResolution, before: date) -> int:
+        """Delete history at `resolution` older than `before`; returns rows deleted."""
+        ...
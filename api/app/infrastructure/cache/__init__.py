@@ -0,0 +1,4 @@
+from app.infrastructure.cache.result_cache import ResultCache, cached
+from app.infrastructure.cache.versions import SCREENS_RESOURCE, ResourceVersions
+
+__all__ = ["SCREENS_RESOURCE", "ResourceVersions", "ResultCache", "cached"]
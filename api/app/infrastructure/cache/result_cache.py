@@ -0,0 +1,177 @@
+"""ResultCache — event-invalidated LRU cache for read commands.
+
+Mark a read command with @cached and SimpleCommandBus.execute() serves repeated
+calls (same command class + params) from memory instead of opening a session:
+
+    @cached(ttl=60, invalidate_on=[ScreenCreatedEvent, ScreenUpdatedEvent])
+    class ListScreensCommand(BaseCommand):
+        ...
+
+Entries of a command class are evicted by CommitSubscribers once any event listed in
+invalidate_on has committed. The subscriptions of every @cached class are registered
+on the EventBus when the ResultCache is built (a class decorated later, on its first
+lookup), so a write that commits during the first miss is not missed. Results for
+which should_cache(result) is False (e.g. "still rendering") are returned but never
+stored.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.domain.events.base import Event
+from app.infrastructure.commands import BaseCommand, SubscriberCommand
+from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.events.subscriber import CommitSubscriber
+
+C = TypeVar("C", bound=type[BaseCommand])
+
+# Every @cached command class, in decoration order; watched by each new ResultCache.
+_cached_commands: list[type[BaseCommand]] = []
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float
+    invalidate_on: tuple[type[Event], ...]
+    should_cache: Callable[[Any], bool] | None = None
+
+
+def cached(
+    ttl: float,
+    invalidate_on: Iterable[type[Event]] = (),
+    should_cache: Callable[[Any], bool] | None = None,
+) -> Callable[[C], C]:
+    """Class decorator: let the CommandBus cache results of a read-only BaseCommand."""
+
+    def deco(cls: C) -> C:
+        cls.__cache_policy__ = CachePolicy(
+            ttl=ttl, invalidate_on=tuple(invalidate_on), should_cache=should_cache
+        )
+        _cached_commands.append(cls)
+        return cls
+
+    return deco
+
+
+def cache_policy(command: type[BaseCommand]) -> CachePolicy | None:
+    return getattr(command, "__cache_policy__", None)
+
+
+class ResultCache:
+    def __init__(self, event_bus: EventBus, maxsize: int = 1024) -> None:
+        self._event_bus = event_bus
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._keys_by_command: dict[type[BaseCommand], set[Hashable]] = {}
+        # Bumped on every invalidation: a result computed while a write committed
+        # must not be stored, or it would outlive the eviction.
+        self._generations: dict[type[BaseCommand], int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        for command in _cached_commands:
+            self._watch(command, command.__cache_policy__)
+
+    async def get_or_execute(
+        self,
+        command: type[BaseCommand],
+        params: dict[str, Any] | None,
+        execute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        policy = cache_policy(command)
+        key = self._key(command, params)
+        if policy is None or key is None:
+            return await execute()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._discard(command, key)
+
+        self.misses += 1
+        generation = self._generations.get(command)
+        if generation is None:
+            self._watch(command, policy)
+            generation = 0
+        value = await execute()
+        if policy.should_cache is not None and not policy.should_cache(value):
+            return value
+        if self._generations[command] == generation:
+            self._store(command, policy, key, value)
+        return value
+
+    def invalidate(self, command: type[BaseCommand]) -> None:
+        self._generations[command] = self._generations.get(command, 0) + 1
+        for key in self._keys_by_command.pop(command, set()):
+            if self._entries.pop(key, None) is not None:
+                self.evictions += 1
+
+    def clear(self) -> None:
+        for command in list(self._keys_by_command):
+            self.invalidate(command)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _store(
+        self, command: type[BaseCommand], policy: CachePolicy, key: Hashable, value: Any
+    ) -> None:
+        self._entries[key] = (time.monotonic() + policy.ttl, value)
+        self._entries.move_to_end(key)
+        self._keys_by_command.setdefault(command, set()).add(key)
+        while len(self._entries) > self._maxsize:
+            oldest, _ = self._entries.popitem(last=False)
+            self._keys_by_command.get(oldest[0], set()).discard(oldest)
+            self.evictions += 1
+
+    def _discard(self, command: type[BaseCommand], key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._keys_by_command.get(command, set()).discard(key)
+
+    def _watch(self, command: type[BaseCommand], policy: CachePolicy) -> None:
+        """Subscribe the eviction of `command` to its invalidate_on events."""
+        evict_command = type(
+            f"Evict{command.__name__}Command",
+            (EvictCachedResultsCommand,),
+            {"cached_command": command},
+        )
+        subscriber = type(
+            f"Evict{command.__name__}Subscriber",
+            (CommitSubscriber,),
+            {"command": evict_command},
+        )
+        for event in policy.invalidate_on:
+            self._event_bus.subscribe(event=event, subscribers=[subscriber])
+        self._generations[command] = 0
+
+    @staticmethod
+    def _key(command: type[BaseCommand], params: dict[str, Any] | None) -> Hashable | None:
+        key = (command, tuple(sorted((params or {}).items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+class EvictCachedResultsCommand(SubscriberCommand):
+    """Evicts cached results of `cached_command`. Subclassed per command by ResultCache."""
+
+    result_cache: ResultCache
+    cached_command: type[BaseCommand]
+
+    async def handle(self) -> None:
+        self.result_cache.invalidate(self.cached_command)
@@ -0,0 +1,39 @@
+"""ResourceVersions — in-process version counters backing ETag conditional GETs.
+
+A version is bumped by CommitSubscribers after the write that changed the resource
+has committed, so a reader that captured the version BEFORE reading the DB can
+never tag stale data with a newer ETag.
+"""
+
+from uuid import uuid4
+
+SCREENS_RESOURCE = "screens"
+
+
+class ResourceVersions:
+    def __init__(self) -> None:
+        # Random per-process epoch: a restart never reuses an ETag handed out earlier.
+        self._epoch = uuid4().hex[:8]
+        self._versions: dict[str, int] = {}
+
+    def get(self, resource: str) -> int:
+        return self._versions.get(resource, 0)
+
+    def bump(self, resource: str) -> int:
+        version = self._versions.get(resource, 0) + 1
+        self._versions[resource] = version
+        return version
+
+    def etag(self, resource: str) -> str:
+        return f'"{resource}-{self._epoch}-{self.get(resource)}"'
+
+    @staticmethod
+    def matches(etag: str, if_none_match: str | None) -> bool:
+        """Check an If-None-Match header value (weak comparison, RFC 9110 13.1.2)."""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == etag:
+                return True
+        return False
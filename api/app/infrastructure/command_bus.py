@@ -2,12 +2,23 @@
 
 Usage in routers:
     result = await command_bus.execute(CreateScreenCommand, params={...})
+
+Commands decorated with @cached are served from the container's ResultCache.
+Every execution is timed into the container's CommandMetrics.
+Every execution runs in a unit of work of its own (session and event queues), so
+concurrent requests never share an AsyncSession. Commands whose handle() is
+@transactional(readonly=True) get a read-only one, served by a read replica unless
+the command is @cached: a result read from a lagging replica could be cached after
+the invalidation that should have removed it.
 """
 
 from abc import ABC, abstractmethod
+from time import perf_counter
 from typing import Any
 
+from app.infrastructure.cache.result_cache import cache_policy
 from app.infrastructure.commands import BaseCommand
+from app.infrastructure.decorators import is_readonly
 
 
 class CommandBus(ABC):
@@ -19,7 +30,10 @@ class CommandBus(ABC):
 
 
 class SimpleCommandBus(CommandBus):
-    """Creates command instance with params and calls handle()."""
+    """Creates command instance with params and calls handle().
+
+    @cached commands are looked up in the ResultCache first.
+    """
 
     def __init__(self, container: "Container") -> None:  # noqa: F821
         self._container = container
@@ -27,6 +41,26 @@ class SimpleCommandBus(CommandBus):
     async def execute(
         self, command: type[BaseCommand], params: dict[str, Any] | None = None
     ) -> Any:
-        instance = command(**(params or {}))
-        self._container.inject(instance)
-        return await instance.handle()
+        timings = self._container.metrics.timings(command)
+        timings.in_flight += 1
+        start = perf_counter()
+        try:
+            if cache_policy(command) is None:
+                return await self._handle(command, params)
+            return await self._container.result_cache.get_or_execute(
+                command, params, lambda: self._handle(command, params)
+            )
+        except Exception:
+            timings.errors += 1
+            raise
+        finally:
+            timings.in_flight -= 1
+            timings.total.observe(perf_counter() - start)
+
+    async def _handle(self, command: type[BaseCommand], params: dict[str, Any] | None) -> Any:
+        readonly = is_readonly(command)
+        replica = readonly and cache_policy(command) is None
+        async with self._container.unit_of_work(readonly, replica):
+            instance = command(**(params or {}))
+            self._container.inject(instance)
+            return await instance.handle()
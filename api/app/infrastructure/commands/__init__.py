@@ -1,6 +1,7 @@
 """Base command classes following the Command Bus pattern.
 
-BaseCommand — for commands invoked via CommandBus. Decorate handle() with @transactional.
+BaseCommand — for commands invoked via CommandBus. Decorate handle() with @transactional
+              (@transactional(readonly=True) for commands that only read).
 SubscriberCommand — for commands invoked by event subscribers. NEVER use @transactional.
 """
 
@@ -23,6 +24,7 @@ class BaseCommand(ABC):
 class SubscriberCommand(ABC):
     """Command invoked by event subscribers — runs inside existing transaction.
 
+    Commands of AsyncSubscribers get a transaction of their own from the pool instead.
     NEVER decorate handle() with @transactional.
     """
 
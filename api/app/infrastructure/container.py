@@ -1,43 +1,205 @@
 """IoC Container — dependency injection for commands and subscribers.
 
 Replaces haps Container() from ARCHITECTURE_PLAN. Provides:
-- Repository instances (bound to current session)
+- unit_of_work() scope: one session per command execution, bound via contextvars
+  (a read-only one for @transactional(readonly=True) commands)
+- ReadRouter (primary or read replica for read-only units of work)
+- Repository instances (bound to the session of the current unit of work)
+- ScreenRenderer, RenderFarm and RefreshPlanner singletons
 - EventBus singleton
-- inject() method to populate command attributes
+- CommandMetrics singleton (per-command latency histograms, /metrics)
+- AsyncSubscriberPool singleton (AsyncSubscribers, run after commit in the background)
+- Outbox singleton (durable hand-off of committed events to the AsyncSubscriberPool)
+- ResourceVersions singleton (ETag versions)
+- ResultCache singleton (cached read commands)
+- ChangeFeed and TopicHub singletons (SSE / WebSocket change streams)
+- HeartbeatBuffer singleton (write-behind heartbeat ingestion)
+- TelemetryRecorder singleton (heartbeat history, rollups, retention)
+- FleetRegistry singleton (online/offline state of every device)
+- AlarmScheduler singleton (next occurrence of every active alarm)
+- WakeIndex singleton (next_wake_at hint for devices)
+- BulkTransfer singleton (NDJSON export/import)
+- inject() method to populate command attributes (plan precomputed per command class)
 """
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import settings
+from app.domain.events.base import Event
+from app.domain.models.device import DeviceStatus
+from app.domain.models.telemetry import TelemetryResolution
 from app.domain.ports.alarm_repository import AlarmRepository
 from app.domain.ports.device_repository import DeviceRepository
+from app.domain.ports.screen_renderer import ScreenRenderer
 from app.domain.ports.screen_repository import ScreenRepository
+from app.domain.ports.telemetry_repository import TelemetryRepository
+from app.infrastructure.cache.result_cache import ResultCache
+from app.infrastructure.cache.versions import ResourceVersions
+from app.infrastructure.events.async_subscriber_pool import AsyncSubscriberPool
 from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.events.outbox import Outbox
+from app.infrastructure.events.subscriber import AsyncSubscriber
+from app.infrastructure.fleet.fleet_registry import FleetRegistry
+from app.infrastructure.metrics import CommandMetrics
+from app.infrastructure.persistence.bulk_transfer import BulkResource, BulkTransfer
+from app.infrastructure.persistence.heartbeat_buffer import HeartbeatBuffer
+from app.infrastructure.persistence.read_routing import ReadRouter
+from app.infrastructure.persistence.telemetry_recorder import TelemetryRecorder
+from app.infrastructure.rendering.partial_refresh import RefreshPlanner
+from app.infrastructure.rendering.render_farm import RenderFarm
+from app.infrastructure.scheduling.alarm_scheduler import AlarmScheduler
+from app.infrastructure.scheduling.wake_index import WakeIndex
+from app.infrastructure.streaming.change_feed import ChangeFeed
+from app.infrastructure.streaming.topic_hub import TopicHub
+
+logger = logging.getLogger(__name__)
 
 _container_instance: "Container | None" = None
 
+# (command attribute, getter on the Container) per injected dependency.
+InjectionPlan = tuple[tuple[str, Callable[["Container"], Any]], ...]
+
+
+@dataclass
+class _UnitOfWork:
+    readonly: bool = False
+    replica: bool = False
+    session: AsyncSession | None = None
+
+
+# Set by Container.unit_of_work(). Each request runs in its own asyncio task, so each
+# in-flight command sees only its own unit of work.
+_unit_of_work: ContextVar[_UnitOfWork | None] = ContextVar("unit_of_work", default=None)
+
 
 class Container:
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
+        read_router: ReadRouter,
         event_bus: EventBus,
         screen_repo_cls: type[ScreenRepository],
         alarm_repo_cls: type[AlarmRepository],
         device_repo_cls: type[DeviceRepository],
+        telemetry_repo_cls: type[TelemetryRepository],
+        screen_renderer: ScreenRenderer,
     ) -> None:
         self._session_factory = session_factory
-        self._session: AsyncSession | None = None
+        self.read_router = read_router
+        self._injection_plans: dict[type, InjectionPlan] = {}
         self.event_bus = event_bus
+        self.metrics = CommandMetrics()
+        self.async_subscribers = AsyncSubscriberPool(
+            self._run_async_subscriber,
+            workers=settings.async_subscriber_workers,
+            max_pending=settings.async_subscriber_max_pending,
+        )
+        self.outbox = Outbox(
+            session_factory,
+            self.session,
+            self._deliver_outbox,
+            batch_size=settings.outbox_batch_size,
+            poll_interval=settings.outbox_poll_interval_seconds,
+            lease_seconds=settings.outbox_lease_seconds,
+            max_attempts=settings.outbox_max_attempts,
+            retry_delay=settings.outbox_retry_delay_seconds,
+        )
+        self.resource_versions = ResourceVersions()
+        self.result_cache = ResultCache(event_bus, maxsize=settings.result_cache_size)
+        self.change_feed = ChangeFeed(client_buffer_size=settings.change_feed_buffer_size)
+        self.topic_hub = TopicHub(high_water=settings.topic_hub_high_water_bytes)
+        self.heartbeat_buffer = HeartbeatBuffer(
+            self._write_heartbeats,
+            flush_interval=settings.heartbeat_flush_interval_ms / 1000,
+            max_records=settings.heartbeat_flush_max_records,
+        )
+        self.telemetry_recorder = TelemetryRecorder(
+            self._telemetry_repository_scope,
+            retention_days={
+                TelemetryResolution.RAW: settings.telemetry_raw_retention_days,
+                TelemetryResolution.HOUR: settings.telemetry_hourly_retention_days,
+                TelemetryResolution.DAY: settings.telemetry_daily_retention_days,
+            },
+            flush_interval=settings.telemetry_flush_interval_seconds,
+            maintenance_interval=settings.telemetry_maintenance_interval_seconds,
+            min_sample_interval=settings.telemetry_min_sample_interval_seconds,
+        )
+        self.fleet_registry = FleetRegistry(
+            offline_after=settings.fleet_offline_after_seconds,
+            tick_seconds=settings.fleet_tick_seconds,
+        )
+        self.alarm_scheduler = AlarmScheduler(tz=settings.timezone)
+        self.wake_index = WakeIndex(
+            self.alarm_scheduler,
+            min_sleep=settings.wake_min_sleep_seconds,
+            max_sleep=settings.wake_max_sleep_seconds,
+            alarm_lead=settings.wake_alarm_lead_seconds,
+            active_window=settings.wake_edit_window_seconds,
+            playlist_dwell=settings.playlist_dwell_seconds,
+        )
         self._screen_repo_cls = screen_repo_cls
         self._alarm_repo_cls = alarm_repo_cls
         self._device_repo_cls = device_repo_cls
+        self._telemetry_repo_cls = telemetry_repo_cls
+        self.bulk_transfer = BulkTransfer(
+            self._bulk_repository_scope, chunk_size=settings.bulk_chunk_size
+        )
+        self.screen_renderer = screen_renderer
+        self.render_farm = RenderFarm(
+            screen_renderer,
+            workers=settings.render_workers,
+            batch_size=settings.render_batch_size,
+            batch_delay=settings.render_batch_delay,
+            cache_size=settings.render_cache_size,
+        )
+        self.refresh_planner = RefreshPlanner(
+            history_size=settings.framebuffer_history_size,
+            max_partial_refreshes=settings.max_partial_refreshes,
+            max_devices=settings.refresh_planner_max_devices,
+        )
+
+    @asynccontextmanager
+    async def unit_of_work(
+        self, readonly: bool = False, replica: bool = False
+    ) -> AsyncIterator[None]:
+        """Scope of one command execution: its own session and event queues.
+
+        The session is opened on first use and closed when the scope exits. A
+        read-only unit gets a ReadOnlySession and may not publish events; with
+        `replica` it reads from wherever the ReadRouter sends it, else from the primary.
+        """
+        unit = _UnitOfWork(readonly, replica)
+        token = _unit_of_work.set(unit)
+        try:
+            with self.event_bus.scope(readonly):
+                yield
+        finally:
+            _unit_of_work.reset(token)
+            if unit.session is not None:
+                await unit.session.close()
 
     def session(self) -> AsyncSession:
-        if self._session is None or not self._session.is_active:
-            self._session = self._session_factory()
-        return self._session
+        unit = _unit_of_work.get()
+        if unit is None:
+            raise RuntimeError("No unit of work. Execute commands through the CommandBus.")
+        if unit.session is None or not unit.session.is_active:
+            unit.session = self._session_factory_for(unit)()
+        return unit.session
+
+    def _session_factory_for(self, unit: _UnitOfWork) -> async_sessionmaker[AsyncSession]:
+        if not unit.readonly:
+            return self._session_factory
+        return self.read_router.session_factory() if unit.replica else self.read_router.primary
 
     @property
     def screen_repository(self) -> ScreenRepository:
@@ -51,43 +213,143 @@ class Container:
     def device_repository(self) -> DeviceRepository:
         return self._device_repo_cls(self.session())  # type: ignore[call-arg]
 
+    @property
+    def telemetry_repository(self) -> TelemetryRepository:
+        return self._telemetry_repo_cls(self.session())  # type: ignore[call-arg]
+
+    async def _run_async_subscriber(self, event: Event, subscriber: type[AsyncSubscriber]) -> None:
+        """AsyncSubscriberPool job: the subscriber's command in a transaction of its own.
+
+        Events it publishes are dispatched like in @transactional. Its own failures
+        propagate (the pool retries); failures of its commit subscribers are only
+        logged, since the command's writes are committed by then.
+        """
+        async with self.unit_of_work():
+            command = self.event_bus.command_for(event, subscriber)
+            self.inject(command)
+            await command.handle()
+            session = self.session()
+            await session.flush()
+            await self.event_bus.dispatch(container=self)
+            await session.commit()
+            try:
+                await self.event_bus.dispatch_committed(container=self)
+            except Exception:
+                logger.exception("Commit subscriber failed after %s", subscriber.__name__)
+
+    async def _deliver_outbox(self, jobs: list[tuple[Event, type[AsyncSubscriber]]]) -> list[bool]:
+        """Outbox delivery: each job once, through the pool (the outbox retries)."""
+        futures = [self.async_subscribers.submit(event, subscriber) for event, subscriber in jobs]
+        return list(await asyncio.gather(*futures))
+
+    async def _write_heartbeats(self, statuses: list[DeviceStatus]) -> dict[str, UUID]:
+        """HeartbeatBuffer writer: one short transaction of its own, outside any command."""
+        async with self._session_factory() as session:
+            repository = self._device_repo_cls(session)  # type: ignore[call-arg]
+            ids = await repository.upsert_many(statuses)
+            await session.commit()
+        return ids
+
+    @asynccontextmanager
+    async def _telemetry_repository_scope(self) -> AsyncIterator[TelemetryRepository]:
+        """TelemetryRecorder unit of work: own session, committed when the block exits."""
+        async with self._session_factory() as session:
+            yield self._telemetry_repo_cls(session)  # type: ignore[call-arg]
+            await session.commit()
+
+    @asynccontextmanager
+    async def _bulk_repository_scope(self, resource: BulkResource) -> AsyncIterator[Any]:
+        """BulkTransfer unit of work: own session, committed when the block exits."""
+        repo_cls = {
+            BulkResource.SCREENS: self._screen_repo_cls,
+            BulkResource.ALARMS: self._alarm_repo_cls,
+            BulkResource.DEVICES: self._device_repo_cls,
+        }[resource]
+        async with self._session_factory() as session:
+            yield repo_cls(session)  # type: ignore[call-arg]
+            await session.commit()
+
     def inject(self, instance: Any) -> None:
         """Inject dependencies into command instance based on type annotations."""
-        annotations = {}
-        for cls in type(instance).__mro__:
-            annotations.update(getattr(cls, "__annotations__", {}))
-
-        for attr_name, attr_type in annotations.items():
-            if attr_type is ScreenRepository or (
-                isinstance(attr_type, type) and issubclass(attr_type, ScreenRepository)
-            ):
-                setattr(instance, attr_name, self.screen_repository)
-            elif attr_type is AlarmRepository or (
-                isinstance(attr_type, type) and issubclass(attr_type, AlarmRepository)
-            ):
-                setattr(instance, attr_name, self.alarm_repository)
-            elif attr_type is DeviceRepository or (
-                isinstance(attr_type, type) and issubclass(attr_type, DeviceRepository)
-            ):
-                setattr(instance, attr_name, self.device_repository)
-            elif attr_type is EventBus:
-                setattr(instance, attr_name, self.event_bus)
+        plan = self._injection_plans.get(type(instance))
+        if plan is None:
+            plan = self._injection_plans[type(instance)] = _injection_plan(type(instance))
+        for attr_name, provide in plan:
+            setattr(instance, attr_name, provide(self))
+
+
+# Annotation type -> Container attribute. Ports also match their implementations;
+# the other dependencies are concrete classes and only match exactly.
+_PORT_PROVIDERS: dict[type, str] = {
+    ScreenRepository: "screen_repository",
+    AlarmRepository: "alarm_repository",
+    DeviceRepository: "device_repository",
+    TelemetryRepository: "telemetry_repository",
+    ScreenRenderer: "screen_renderer",
+}
+_PROVIDERS: dict[type, str] = {
+    EventBus: "event_bus",
+    ResourceVersions: "resource_versions",
+    ResultCache: "result_cache",
+    RefreshPlanner: "refresh_planner",
+    RenderFarm: "render_farm",
+    ChangeFeed: "change_feed",
+    TopicHub: "topic_hub",
+    HeartbeatBuffer: "heartbeat_buffer",
+    TelemetryRecorder: "telemetry_recorder",
+    FleetRegistry: "fleet_registry",
+    AlarmScheduler: "alarm_scheduler",
+    WakeIndex: "wake_index",
+    BulkTransfer: "bulk_transfer",
+}
+
+
+def _provider(attr_type: Any) -> str | None:
+    if not isinstance(attr_type, type):
+        return None
+    for port, provider in _PORT_PROVIDERS.items():
+        if issubclass(attr_type, port):
+            return provider
+    return _PROVIDERS.get(attr_type)
+
+
+def _injection_plan(command_cls: type) -> InjectionPlan:
+    """Injectable annotations of `command_cls` (and its bases), resolved once.
+
+    Getters are evaluated on every injection: repositories are bound to the session
+    current at that time.
+    """
+    annotations: dict[str, Any] = {}
+    for cls in reversed(command_cls.__mro__):
+        annotations.update(getattr(cls, "__annotations__", {}))
+    plan = []
+    for attr_name, attr_type in annotations.items():
+        provider = _provider(attr_type)
+        if provider is not None:
+            plan.append((attr_name, attrgetter(provider)))
+    return tuple(plan)
 
 
 def init_container(
     session_factory: async_sessionmaker[AsyncSession],
+    read_router: ReadRouter,
     screen_repo_cls: type[ScreenRepository],
     alarm_repo_cls: type[AlarmRepository],
     device_repo_cls: type[DeviceRepository],
+    telemetry_repo_cls: type[TelemetryRepository],
+    screen_renderer: ScreenRenderer,
 ) -> Container:
     global _container_instance
     event_bus = EventBus()
     _container_instance = Container(
         session_factory=session_factory,
+        read_router=read_router,
         event_bus=event_bus,
         screen_repo_cls=screen_repo_cls,
         alarm_repo_cls=alarm_repo_cls,
         device_repo_cls=device_repo_cls,
+        telemetry_repo_cls=telemetry_repo_cls,
+        screen_renderer=screen_renderer,
     )
     return _container_instance
 
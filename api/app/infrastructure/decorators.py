@@ -1,18 +1,22 @@
 """Decorators: @transactional — manages DB session + event dispatch.
 
 Use ONLY on BaseCommand.handle(). NEVER on SubscriberCommand.handle().
+Pure reads use @transactional(readonly=True).
 """
 
 import functools
 import logging
+from time import perf_counter
 from typing import Any
 
 from app.infrastructure.container import get_container
+from app.infrastructure.metrics import Histogram
+from app.infrastructure.persistence.read_routing import session_wrote
 
 logger = logging.getLogger(__name__)
 
 
-def transactional(func: Any) -> Any:
+def transactional(func: Any = None, *, readonly: bool = False) -> Any:
     """Wraps async handle() with session management and event dispatch.
 
     Flow:
@@ -20,31 +24,94 @@ def transactional(func: Any) -> Any:
         2. session.flush()       — check DB constraints
         3. event_bus.dispatch()  — run subscriber commands
         4. session.commit()      — persist everything
+        5. event_bus.dispatch_committed() — run CommitSubscribers
 
     On exception:
         1. event_bus.clear()
         2. session.rollback()
     Always:
         1. session.close()
+
+    CommitSubscriber failures are logged, not raised: the data is already committed.
+    Their repository reads see committed data; the session is closed again afterwards.
+    A commit that wrote (a flush with changes or a write statement; reads do not count)
+    keeps the client's reads on the primary for a while (ReadRouter.wrote()). The
+    duration of steps 1-4 is recorded in the container's CommandMetrics; a failed
+    run records the steps it reached, the one that raised up to the exception.
+
+    readonly=True: the CommandBus runs the command in a read-only unit of work
+    (autocommit ReadOnlySession; publish() raises). No flush, dispatch or commit:
+    the session is just closed, returning its connection to the pool at once.
     """
+    if func is None:
+        return functools.partial(transactional, readonly=readonly)
+    if readonly:
+        return _readonly(func)
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
         container = get_container()
         session = container.session()
         event_bus = container.event_bus
+        timings = container.metrics.timings(type(args[0]))
 
+        phase, started = timings.handler, perf_counter()
         try:
             result = await func(*args, **kwargs)
+            phase, started = timings.flush, _lap(phase, started)
             await session.flush()
+            phase, started = timings.dispatch, _lap(phase, started)
             await event_bus.dispatch(container=container)
+            wrote = session_wrote(session)
+            phase, started = timings.commit, _lap(phase, started)
             await session.commit()
-            return result
+            _lap(phase, started)
         except Exception:
+            _lap(phase, started)
             event_bus.clear()
             await session.rollback()
             raise
         finally:
             await session.close()
+        if wrote:
+            container.read_router.wrote()
+
+        try:
+            await event_bus.dispatch_committed(container=container)
+        except Exception:
+            event_bus.clear()
+            logger.exception("Commit subscriber failed after %s", func.__qualname__)
+        finally:
+            # Commit subscribers may read through repositories in a fresh transaction.
+            await session.close()
+        return result
 
     return wrapper
+
+
+def _readonly(func: Any) -> Any:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        container = get_container()
+        session = container.session()
+        started = perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _lap(container.metrics.timings(type(args[0])).handler, started)
+            await session.close()
+
+    wrapper.__readonly__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _lap(phase: Histogram, started: float) -> float:
+    """Record the time since `started` in `phase`; returns the current time."""
+    now = perf_counter()
+    phase.observe(now - started)
+    return now
+
+
+def is_readonly(command: type) -> bool:
+    """True if `command.handle` is @transactional(readonly=True)."""
+    return getattr(command.handle, "__readonly__", False)
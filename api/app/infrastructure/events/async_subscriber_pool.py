@@ -0,0 +1,153 @@
+"""AsyncSubscriberPool — runs AsyncSubscribers after commit on a bounded set of workers.
+
+The outbox relay submits one job per (event, AsyncSubscriber) and awaits the returned
+future for its outcome. Jobs wait in a FIFO per subscriber; a subscriber is handed
+to a worker only while it has fewer than `concurrency` jobs running, so a slow
+subscriber occupies at most that many workers and independent subscribers run side
+by side. Every job runs once: its future resolves to False if it raised, and the
+outbox retries it later. Submitting never blocks: once `max_pending` jobs wait, new
+ones are dropped (and counted) and their future resolves to False as well. stop()
+lets queued jobs finish, up to `drain_timeout`.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.domain.events.base import Event
+from app.infrastructure.events.subscriber import AsyncSubscriber
+
+logger = logging.getLogger(__name__)
+
+# Runs one job: builds the subscriber's command from the event and handles it.
+JobRunner = Callable[[Event, type[AsyncSubscriber]], Awaitable[None]]
+
+
+@dataclass
+class _Job:
+    event: Event
+    subscriber: type[AsyncSubscriber]
+    done: asyncio.Future[bool]
+
+
+@dataclass
+class _Lane:
+    """Jobs of one subscriber: waiting ones, and how many slots are taken."""
+
+    jobs: deque[_Job]
+    slots: int = 0  # running, or handed to the ready queue; <= concurrency
+
+
+class AsyncSubscriberPool:
+    def __init__(
+        self,
+        run: JobRunner,
+        workers: int = 4,
+        max_pending: int = 10_000,
+        drain_timeout: float = 10.0,
+    ) -> None:
+        self._run_job = run
+        self._workers = workers
+        self._max_pending = max_pending
+        self._drain_timeout = drain_timeout
+        self._lanes: dict[type[AsyncSubscriber], _Lane] = {}
+        self._ready: asyncio.Queue[type[AsyncSubscriber]] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._pending = 0
+        self._running = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"async-subscriber-{n}")
+            for n in range(self._workers)
+        ]
+
+    async def stop(self) -> None:
+        try:
+            await asyncio.wait_for(self._idle.wait(), self._drain_timeout)
+        except TimeoutError:
+            logger.warning("Stopping with %d async subscriber jobs unfinished", self._pending)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, event: Event, subscriber: type[AsyncSubscriber]) -> asyncio.Future[bool]:
+        """Queue a job; the future tells whether it eventually succeeded."""
+        done: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        if self._pending >= self._max_pending:
+            self.dropped += 1
+            logger.warning("Async subscriber queue full, dropped %s", subscriber.__name__)
+            done.set_result(False)
+            return done
+        self.submitted += 1
+        self._enqueue(_Job(event, subscriber, done))
+        return done
+
+    async def join(self) -> None:
+        """Wait until every submitted job has finished."""
+        await self._idle.wait()
+
+    def stats(self) -> dict[str, int | dict[str, dict[str, int]]]:
+        return {
+            "workers": self._workers,
+            "pending": self._pending,
+            "running": self._running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "subscribers": {
+                subscriber.__name__: {"queued": len(lane.jobs), "slots": lane.slots}
+                for subscriber, lane in self._lanes.items()
+            },
+        }
+
+    def _enqueue(self, job: _Job) -> None:
+        lane = self._lanes.get(job.subscriber)
+        if lane is None:
+            lane = self._lanes[job.subscriber] = _Lane(deque())
+        lane.jobs.append(job)
+        self._pending += 1
+        self._idle.clear()
+        if lane.slots < job.subscriber.concurrency:
+            lane.slots += 1
+            self._ready.put_nowait(job.subscriber)
+
+    async def _work(self) -> None:
+        while True:
+            subscriber = await self._ready.get()
+            lane = self._lanes[subscriber]
+            if not lane.jobs:
+                # Another slot of this subscriber already took the job this one was for.
+                lane.slots -= 1
+                continue
+            job = lane.jobs.popleft()
+            self._running += 1
+            try:
+                await self._run_job(job.event, subscriber)
+            except Exception:
+                self.failed += 1
+                logger.exception("%s failed", subscriber.__name__)
+                job.done.set_result(False)
+            else:
+                self.completed += 1
+                job.done.set_result(True)
+            finally:
+                self._running -= 1
+                self._pending -= 1
+                # Keep the slot while the lane has work.
+                if lane.jobs:
+                    self._ready.put_nowait(subscriber)
+                else:
+                    lane.slots -= 1
+                if self._pending == 0:
+                    self._idle.set()
@@ -2,56 +2,199 @@
 
 Events are published with publish() and dispatched with dispatch().
 dispatch() is called automatically by @transactional after session.flush().
+dispatch_committed() is called by @transactional after session.commit() and runs
+CommitSubscribers for the events dispatched in that transaction.
+
+Events with AsyncSubscribers are also written to the container's Outbox by dispatch(),
+inside the transaction; dispatch_committed() then wakes the outbox relay, which
+delivers them to the AsyncSubscriberPool (see infrastructure.events.outbox).
+
+Subscribing to an event class also subscribes to its subclasses. Which subscribers
+run for an event type, and which of its fields each subscriber command receives,
+is worked out on first dispatch and kept until the next subscribe().
+
+Queues are per unit of work: inside scope() (entered by Container.unit_of_work() for
+every command) events published by one command are never dispatched by another
+command running concurrently. Outside any scope the bus-wide queues are used. A
+read-only scope (read-only commands) rejects publish().
 """
 
-from typing import Any
+import dataclasses
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
 
 from app.domain.events.base import Event
-from app.infrastructure.events.subscriber import SyncSubscriber
+from app.infrastructure.commands import SubscriberCommand
+from app.infrastructure.events.subscriber import AsyncSubscriber, CommitSubscriber, SyncSubscriber
+
+Subscriber = type[SyncSubscriber] | type[CommitSubscriber] | type[AsyncSubscriber]
+
+
+@dataclass
+class _Queues:
+    published: deque[Event] = field(default_factory=deque)
+    dispatched: deque[Event] = field(default_factory=deque)  # awaiting commit
+    # Dispatched events with AsyncSubscribers: written to the outbox, or (without a
+    # container) run inline after commit. `stored` marks a pending outbox write.
+    background: deque[Event] = field(default_factory=deque)
+    stored: bool = False
+    readonly: bool = False
+
+
+class DispatchTable(NamedTuple):
+    sync: tuple[type[SyncSubscriber], ...]
+    commit: tuple[type[CommitSubscriber], ...]
+    background: tuple[type[AsyncSubscriber], ...]
 
 
 class EventBus:
     def __init__(self) -> None:
-        self._queue: list[Event] = []
-        self._subscriptions: dict[type[Event], list[type[SyncSubscriber]]] = {}
+        self._default = _Queues()
+        self._scoped: ContextVar[_Queues | None] = ContextVar("event_bus_queues", default=None)
+        self._subscriptions: dict[type[Event], list[Subscriber]] = {}
+        self._tables: dict[type[Event], DispatchTable] = {}
+        self._param_plans: dict[tuple[type[Event], Subscriber], tuple[str, ...]] = {}
+        # Per event type, for CommandMetrics.
+        self.published_counts: Counter[type[Event]] = Counter()
+        self.dispatched_counts: Counter[type[Event]] = Counter()
 
     def subscribe(
         self,
         event: type[Event],
-        subscribers: list[type[SyncSubscriber]],
+        subscribers: list[Subscriber],
     ) -> None:
         existing = self._subscriptions.get(event, [])
         existing.extend(subscribers)
         self._subscriptions[event] = existing
+        self._tables.clear()
+
+    @contextmanager
+    def scope(self, readonly: bool = False) -> Iterator[None]:
+        """Fresh queues for the current context until the block exits."""
+        token = self._scoped.set(_Queues(readonly=readonly))
+        try:
+            yield
+        finally:
+            self._scoped.reset(token)
 
     def publish(self, event: Event) -> None:
         """Add event to queue. Dispatched later by @transactional."""
-        self._queue.append(event)
+        self._writable().published.append(event)
+        self.published_counts[type(event)] += 1
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        """Add a batch of events to the queue, e.g. one per item of a bulk write."""
+        queues = self._writable()
+        batch = list(events)
+        queues.published.extend(batch)
+        self.published_counts.update(map(type, batch))
 
     async def dispatch(self, container: Any = None) -> None:
-        """Execute all queued events' subscribers. Called by @transactional."""
-        while self._queue:
-            event = self._queue.pop(0)
-            subscriber_classes = self._subscriptions.get(type(event), [])
-            for subscriber_cls in subscriber_classes:
-                params = self._collect_params(event, subscriber_cls)
-                command_instance = subscriber_cls.command(**params)
-                if container:
-                    container.inject(command_instance)
-                await command_instance.handle()
+        """Execute all queued events' sync subscribers. Called by @transactional.
+
+        Events with AsyncSubscribers are then added to the container's outbox, in the
+        same transaction.
+        """
+        queues = self._queues()
+        while queues.published:
+            event = queues.published.popleft()
+            self.dispatched_counts[type(event)] += 1
+            table = self._table(type(event))
+            for subscriber_cls in table.sync:
+                await self._run(event, subscriber_cls, container)
+            queues.dispatched.append(event)
+            if table.background:
+                queues.background.append(event)
+        if container and queues.background:
+            await container.outbox.add(
+                [
+                    (event, subscriber)
+                    for event in queues.background
+                    for subscriber in self._table(type(event)).background
+                ]
+            )
+            queues.background.clear()
+            queues.stored = True
+
+    async def dispatch_committed(self, container: Any = None) -> None:
+        """Execute commit subscribers of dispatched events. Called after commit.
+
+        Wakes the outbox relay for the events stored by dispatch(). Without a
+        container (no outbox) AsyncSubscribers run inline here instead.
+        """
+        queues = self._queues()
+        if queues.stored:
+            queues.stored = False
+            container.outbox.notify()
+        while queues.dispatched:
+            event = queues.dispatched.popleft()
+            for subscriber_cls in self._table(type(event)).commit:
+                await self._run(event, subscriber_cls, container)
+        while queues.background:
+            event = queues.background.popleft()
+            for async_cls in self._table(type(event)).background:
+                await self._run(event, async_cls, container)
 
     def clear(self) -> None:
-        """Clear event queue. Called by @transactional on exception."""
-        self._queue.clear()
+        """Clear event queues. Called by @transactional on exception."""
+        queues = self._queues()
+        queues.published.clear()
+        queues.dispatched.clear()
+        queues.background.clear()
+        queues.stored = False
+
+    def _queues(self) -> _Queues:
+        return self._scoped.get() or self._default
+
+    def _writable(self) -> _Queues:
+        queues = self._queues()
+        if queues.readonly:
+            raise RuntimeError("Read-only command tried to publish an event.")
+        return queues
+
+    def command_for(self, event: Event, subscriber_cls: Subscriber) -> SubscriberCommand:
+        """The subscriber's command, with the event fields it declares (not yet injected)."""
+        names = self._param_plans.get((type(event), subscriber_cls))
+        if names is None:
+            names = self._param_plan(type(event), subscriber_cls)
+        return subscriber_cls.command(**{n: getattr(event, n) for n in names})
+
+    async def _run(self, event: Event, subscriber_cls: Subscriber, container: Any) -> None:
+        command_instance = self.command_for(event, subscriber_cls)
+        if container:
+            container.inject(command_instance)
+        await command_instance.handle()
+
+    def _table(self, event_type: type[Event]) -> DispatchTable:
+        table = self._tables.get(event_type)
+        if table is None:
+            table = self._tables[event_type] = self._build_table(event_type)
+        return table
 
-    @staticmethod
-    def _collect_params(event: Event, subscriber: type[SyncSubscriber]) -> dict[str, Any]:
-        """Map event fields to subscriber command params by name."""
-        import dataclasses
+    def _build_table(self, event_type: type[Event]) -> DispatchTable:
+        """Subscribers of `event_type` and of its base classes, most specific first."""
+        subscribers: list[Subscriber] = []
+        for cls in event_type.__mro__:
+            for subscriber_cls in self._subscriptions.get(cls, []):
+                if subscriber_cls not in subscribers:
+                    subscribers.append(subscriber_cls)
+        return DispatchTable(
+            sync=tuple(s for s in subscribers if issubclass(s, SyncSubscriber)),
+            commit=tuple(s for s in subscribers if issubclass(s, CommitSubscriber)),
+            background=tuple(s for s in subscribers if issubclass(s, AsyncSubscriber)),
+        )
 
-        event_fields = {f.name: getattr(event, f.name) for f in dataclasses.fields(event)}
-        command_cls = subscriber.command
+    def _param_plan(self, event_type: type[Event], subscriber: Subscriber) -> tuple[str, ...]:
+        """Event fields that are also subscriber command params (matched by name)."""
         command_init_fields = set()
-        for cls in command_cls.__mro__:
+        for cls in subscriber.command.__mro__:
             command_init_fields.update(getattr(cls, "__annotations__", {}).keys())
-        return {k: v for k, v in event_fields.items() if k in command_init_fields}
+        names = tuple(
+            f.name for f in dataclasses.fields(event_type) if f.name in command_init_fields
+        )
+        self._param_plans[(event_type, subscriber)] = names
+        return names
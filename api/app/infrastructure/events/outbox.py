@@ -0,0 +1,287 @@
+"""Outbox — durable hand-off of committed events to AsyncSubscribers.
+
+Events that have AsyncSubscribers are written to the `outbox` table by
+EventBus.dispatch(), one message per (event, AsyncSubscriber), in the session of the
+command that published them, so they commit (or roll back) with its data. After the
+commit the relay is woken; it also polls, which picks up messages of other processes
+and of a process that died before delivering.
+
+The relay claims up to `batch_size` messages at a time by leasing them (one UPDATE
+... RETURNING; the candidate rows are selected FOR UPDATE SKIP LOCKED on Postgres,
+so concurrent relays never claim the same rows; SQLite drops the locking clause and
+relies on its single writer). It hands the jobs to `deliver` and then deletes the
+delivered messages in one statement. While `deliver` runs, the lease of the batch is
+renewed every third of `lease_seconds`, so jobs waiting in the AsyncSubscriberPool
+are not claimed a second time.
+
+This is the only retry layer: a message whose delivery failed is retried after a
+backoff, up to `max_attempts`; since every message is for one subscriber, the
+subscribers that already succeeded are not run again. A lease that expires (relay
+died) makes a message claimable again, so delivery is at least once: a subscriber
+may see an event twice.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.events.base import Event
+from app.infrastructure.events.subscriber import AsyncSubscriber
+from app.infrastructure.persistence.models.outbox import OutboxMessageORM
+
+logger = logging.getLogger(__name__)
+
+# An event and the AsyncSubscriber it is for.
+Job = tuple[Event, type[AsyncSubscriber]]
+# Runs a batch of jobs once each; returns per job whether it succeeded.
+Deliver = Callable[[list[Job]], Awaitable[list[bool]]]
+
+_adapters: dict[type[Event], TypeAdapter[Any]] = {}
+
+
+def _adapter(event_type: type[Event]) -> TypeAdapter[Any]:
+    adapter = _adapters.get(event_type)
+    if adapter is None:
+        adapter = _adapters[event_type] = TypeAdapter(event_type)
+    return adapter
+
+
+def type_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolve(name: str) -> Any:
+    module, _, qualname = name.partition(":")
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def encode(event: Event) -> str:
+    return _adapter(type(event)).dump_json(event).decode()
+
+
+def decode(event_type: str, payload: str) -> Event:
+    return _adapter(resolve(event_type)).validate_json(payload)  # type: ignore[no-any-return]
+
+
+class Outbox:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        current_session: Callable[[], AsyncSession],
+        deliver: Deliver,
+        batch_size: int = 500,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 10,
+        retry_delay: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._current_session = current_session
+        self._deliver = deliver
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._lease = timedelta(seconds=lease_seconds)
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.stored = 0
+        self.delivered = 0
+        self.retried = 0
+        self.dead = 0
+        self.batches = 0
+        # Seconds from commit to delivery: oldest message of the last batch, and the max.
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Stop relaying; undelivered messages stay in the table for the next start."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def add(self, jobs: Sequence[Job]) -> None:
+        """Store `jobs` in the current unit of work's session (not committed here)."""
+        now = datetime.utcnow()
+        payloads: dict[int, str] = {}
+        rows = []
+        for event, subscriber in jobs:
+            payload = payloads.get(id(event))
+            if payload is None:
+                payload = payloads[id(event)] = encode(event)
+            rows.append(
+                {
+                    "event_type": type_name(type(event)),
+                    "subscriber": type_name(subscriber),
+                    "payload": payload,
+                    "created_at": now,
+                    "available_at": now,
+                    "attempts": 0,
+                }
+            )
+        await self._current_session().execute(OutboxMessageORM.__table__.insert(), rows)
+        self.stored += len(rows)
+
+    def notify(self) -> None:
+        """Wake the relay: messages were just committed."""
+        self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """Claim and deliver one batch; returns the number of messages claimed."""
+        now = datetime.utcnow()
+        messages = await self._claim(now)
+        if not messages:
+            return 0
+        self.batches += 1
+        self.last_lag = (now - messages[0].created_at).total_seconds()
+        self.max_lag = max(self.max_lag, self.last_lag)
+
+        jobs: list[Job] = []
+        claimed: list[OutboxMessageORM] = []
+        undecodable: list[OutboxMessageORM] = []
+        for message in messages:
+            try:
+                event = decode(message.event_type, message.payload)
+                jobs.append((event, resolve(message.subscriber)))
+                claimed.append(message)
+            except Exception:
+                logger.exception("Undecodable outbox message %s", message.id)
+                undecodable.append(message)
+        results = await self._deliver_leased(jobs, [m.id for m in claimed]) if jobs else []
+
+        delivered = [m.id for m, ok in zip(claimed, results, strict=True) if ok]
+        failed = [m for m, ok in zip(claimed, results, strict=True) if not ok]
+        await self._settle(delivered, failed, undecodable)
+        return len(messages)
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "stored": self.stored,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "dead": self.dead,
+            "batches": self.batches,
+            "last_lag_seconds": round(self.last_lag, 3),
+            "max_lag_seconds": round(self.max_lag, 3),
+        }
+
+    async def backlog(self) -> dict[str, int | float]:
+        """Messages waiting (or leased) and dead ones; age of the oldest waiting one."""
+        async with self._session_factory() as session:
+            waiting, oldest = (
+                await session.execute(
+                    select(func.count(), func.min(OutboxMessageORM.created_at)).where(
+                        OutboxMessageORM.available_at.is_not(None)
+                    )
+                )
+            ).one()
+            dead = await session.scalar(
+                select(func.count()).where(OutboxMessageORM.available_at.is_(None))
+            )
+        age = (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+        return {"waiting": waiting, "dead_rows": dead or 0, "oldest_age_seconds": round(age, 3)}
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.relay_once()
+            except Exception:
+                logger.exception("Outbox relay failed")
+                claimed = 0
+            if claimed >= self._batch_size:
+                continue  # more are probably waiting
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+
+    async def _deliver_leased(self, jobs: list[Job], ids: list[int]) -> list[bool]:
+        """`deliver(jobs)`, renewing the lease of messages `ids` until it returns."""
+        delivery = asyncio.ensure_future(self._deliver(jobs))
+        interval = self._lease.total_seconds() / 3
+        while True:
+            done, _ = await asyncio.wait({delivery}, timeout=interval)
+            if done:
+                return delivery.result()
+            try:
+                await self._renew(ids)
+            except Exception:
+                logger.exception("Outbox lease renewal failed")
+
+    async def _renew(self, ids: list[int]) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                update(OutboxMessageORM)
+                .where(OutboxMessageORM.id.in_(ids))
+                .values(available_at=datetime.utcnow() + self._lease)
+            )
+            await session.commit()
+
+    async def _claim(self, now: datetime) -> list[OutboxMessageORM]:
+        candidates = (
+            select(OutboxMessageORM.id)
+            .where(OutboxMessageORM.available_at <= now)
+            .order_by(OutboxMessageORM.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with self._session_factory() as session:
+            rows = (
+                await session.execute(
+                    update(OutboxMessageORM)
+                    .where(OutboxMessageORM.id.in_(candidates.scalar_subquery()))
+                    .values(
+                        available_at=now + self._lease, attempts=OutboxMessageORM.attempts + 1
+                    )
+                    .returning(OutboxMessageORM)
+                    .execution_options(synchronize_session=False)
+                )
+            ).scalars().all()
+            await session.commit()
+        return sorted(rows, key=lambda m: m.id)
+
+    async def _settle(
+        self,
+        delivered: list[int],
+        failed: list[OutboxMessageORM],
+        undecodable: list[OutboxMessageORM],
+    ) -> None:
+        now = datetime.utcnow()
+        retries = []
+        for message in failed:
+            if message.attempts >= self._max_attempts:
+                logger.error(
+                    "Outbox message %s dead after %d attempts", message.id, message.attempts
+                )
+                retries.append({"id": message.id, "available_at": None})
+                self.dead += 1
+            else:
+                delay = self._retry_delay * 2 ** (message.attempts - 1)
+                retries.append({"id": message.id, "available_at": now + timedelta(seconds=delay)})
+                self.retried += 1
+        retries.extend({"id": m.id, "available_at": None} for m in undecodable)
+        self.dead += len(undecodable)
+        async with self._session_factory() as session:
+            if delivered:
+                await session.execute(
+                    delete(OutboxMessageORM).where(OutboxMessageORM.id.in_(delivered))
+                )
+            if retries:
+                await session.execute(update(OutboxMessageORM), retries)
+            await session.commit()
+        self.delivered += len(delivered)
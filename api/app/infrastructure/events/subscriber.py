@@ -1,4 +1,17 @@
-"""Subscriber — links a domain Event to a SubscriberCommand."""
+"""Subscribers — link a domain Event to a SubscriberCommand.
+
+SyncSubscriber   — runs inside @transactional, before session.commit().
+CommitSubscriber — runs after session.commit() succeeded. Use for in-memory side
+                   effects (cache/version invalidation) that must not become
+                   visible before the data they describe.
+AsyncSubscriber  — stored in the outbox with the transaction and run after commit
+                   by the AsyncSubscriberPool, in a unit of work of its own. Use for
+                   slow work (rendering, pushes, analytics) that must not add to
+                   request latency. Failures are retried by the outbox; the request
+                   never sees them.
+"""
+
+from typing import ClassVar
 
 from app.infrastructure.commands import SubscriberCommand
 
@@ -7,3 +20,17 @@ class SyncSubscriber:
     """Base subscriber. Set `command` to a SubscriberCommand class."""
 
     command: type[SubscriberCommand]
+
+
+class CommitSubscriber:
+    """Post-commit subscriber. Set `command` to a SubscriberCommand class."""
+
+    command: type[SubscriberCommand]
+
+
+class AsyncSubscriber:
+    """Background subscriber. Set `command`; optionally tune `concurrency`."""
+
+    command: type[SubscriberCommand]
+
+    concurrency: ClassVar[int] = 1  # commands of this subscriber running at once
@@ -0,0 +1,4 @@
+from app.infrastructure.fleet.fleet_registry import FleetEntry, FleetRegistry
+from app.infrastructure.fleet.timing_wheel import TimingWheel
+
+__all__ = ["FleetEntry", "FleetRegistry", "TimingWheel"]
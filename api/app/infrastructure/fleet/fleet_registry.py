@@ -0,0 +1,161 @@
+"""FleetRegistry — in-process last-seen/online state of every device.
+
+Devices are interned to dense indices; last-seen times and online flags live in flat
+arrays (8 + 1 bytes per device). Each online device has exactly one entry in a
+TimingWheel. A heartbeat only updates last-seen (O(1), no wheel operation); when the
+entry comes due, the device is either rescheduled at its new deadline or reported
+offline. Detecting offline devices therefore never scans the fleet. Devices that
+came back online are kept until came_online() collects them, like expire() does for
+those that went offline.
+"""
+
+import asyncio
+import contextlib
+import logging
+from array import array
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import numpy as np
+
+from app.infrastructure.fleet.timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FleetEntry:
+    device_id: str
+    online: bool
+    last_seen: datetime
+
+
+def _to_unix(at: datetime) -> float:
+    return at.replace(tzinfo=UTC).timestamp() if at.tzinfo is None else at.timestamp()
+
+
+def _from_unix(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, UTC).replace(tzinfo=None)
+
+
+class FleetRegistry:
+    def __init__(self, offline_after: float = 900.0, tick_seconds: float = 1.0) -> None:
+        self._offline_after = offline_after
+        self._tick_seconds = tick_seconds
+        self._index: dict[str, int] = {}
+        self._device_ids: list[str] = []
+        self._last_seen = array("d")
+        self._online = bytearray()
+        self._scheduled = bytearray()
+        self._came_online: list[int] = []
+        self._wheel = TimingWheel(offline_after, tick_seconds)
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, on_tick: Callable[[], Awaitable[object]]) -> None:
+        """Call `on_tick` (which should call expire()) every tick until stop()."""
+        self._task = asyncio.create_task(self._run(on_tick), name="fleet-registry")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def load(self, devices: Iterable[tuple[str, datetime]], now: datetime) -> None:
+        """Prime from stored last-seen times; no transitions are reported."""
+        now_ts = _to_unix(now)
+        for device_id, last_seen in devices:
+            index = self._intern(device_id)
+            seen_ts = _to_unix(last_seen)
+            self._last_seen[index] = max(self._last_seen[index], seen_ts)
+            if self._last_seen[index] + self._offline_after > now_ts:
+                self._online[index] = 1
+                self._schedule(index)
+
+    def seen(self, device_id: str, at: datetime) -> bool:
+        """Record a heartbeat; True if the device just came online."""
+        index = self._intern(device_id)
+        self._last_seen[index] = max(self._last_seen[index], _to_unix(at))
+        came_online = not self._online[index]
+        if came_online:
+            self._came_online.append(index)
+        self._online[index] = 1
+        if not self._scheduled[index]:
+            self._schedule(index)
+        return came_online
+
+    def came_online(self) -> list[FleetEntry]:
+        """Devices that came online since the previous call."""
+        indices, self._came_online = self._came_online, []
+        return [self._entry(i) for i in indices]
+
+    def expire(self, now: datetime) -> list[FleetEntry]:
+        """Devices that went offline since the previous call."""
+        now_ts = _to_unix(now)
+        offline = []
+        for index in self._wheel.advance(now_ts):
+            deadline = self._last_seen[index] + self._offline_after
+            if deadline > now_ts:
+                self._wheel.schedule(index, deadline)
+                continue
+            self._scheduled[index] = 0
+            self._online[index] = 0
+            offline.append(self._entry(index))
+        return offline
+
+    def get(self, device_id: str) -> FleetEntry | None:
+        index = self._index.get(device_id)
+        return self._entry(index) if index is not None else None
+
+    def list(
+        self, online: bool | None = None, offset: int = 0, limit: int = 100
+    ) -> tuple[int, list[FleetEntry]]:
+        """(total matching, page) in registration order."""
+        if online is None:
+            total = len(self._device_ids)
+            indices = range(offset, min(offset + limit, total))
+        else:
+            flags = np.frombuffer(self._online, dtype=np.bool_)
+            matching = np.flatnonzero(flags if online else ~flags)
+            total = int(matching.size)
+            indices = matching[offset : offset + limit].tolist()
+        return total, [self._entry(i) for i in indices]
+
+    def stats(self) -> dict[str, int]:
+        online = self._online.count(1)
+        return {
+            "devices": len(self._device_ids),
+            "online": online,
+            "offline": len(self._device_ids) - online,
+            "wheel_entries": self._wheel.scheduled,
+        }
+
+    async def _run(self, on_tick: Callable[[], Awaitable[object]]) -> None:
+        while True:
+            await asyncio.sleep(self._tick_seconds)
+            try:
+                await on_tick()
+            except Exception:
+                logger.exception("Fleet registry tick failed")
+
+    def _intern(self, device_id: str) -> int:
+        index = self._index.get(device_id)
+        if index is None:
+            index = len(self._device_ids)
+            self._index[device_id] = index
+            self._device_ids.append(device_id)
+            self._last_seen.append(0.0)
+            self._online.append(0)
+            self._scheduled.append(0)
+        return index
+
+    def _schedule(self, index: int) -> None:
+        self._scheduled[index] = 1
+        self._wheel.schedule(index, self._last_seen[index] + self._offline_after)
+
+    def _entry(self, index: int) -> FleetEntry:
+        return FleetEntry(
+            self._device_ids[index], bool(self._online[index]), _from_unix(self._last_seen[index])
+        )
@@ -0,0 +1,56 @@
+"""TimingWheel — hashed timing wheel of integer items.
+
+schedule() drops an item into the slot of its deadline tick; advance() visits only
+the slots of the ticks that elapsed, so the cost per tick is the number of entries
+in those slots, independent of how many items are scheduled in total.
+"""
+
+import math
+
+
+class TimingWheel:
+    def __init__(self, horizon: float, tick_seconds: float = 1.0) -> None:
+        # One revolution covers the longest deadline, so a slot never holds entries
+        # for a later round (the deadline check in advance() keeps it correct anyway).
+        self._size = math.ceil(horizon / tick_seconds) + 2
+        self._tick_seconds = tick_seconds
+        self._slots: list[list[tuple[int, int]]] = [[] for _ in range(self._size)]
+        self._current: int | None = None
+        # Lowest tick scheduled before the first advance(), which starts there: items
+        # primed at startup may already be due by then.
+        self._first: int | None = None
+        self.scheduled = 0
+
+    def tick_of(self, at: float) -> int:
+        return int(at // self._tick_seconds)
+
+    def schedule(self, item: int, at: float) -> None:
+        tick = self.tick_of(at)
+        if self._current is not None:
+            tick = max(tick, self._current + 1)
+        elif self._first is None or tick < self._first:
+            self._first = tick
+        self._slots[tick % self._size].append((tick, item))
+        self.scheduled += 1
+
+    def advance(self, now: float) -> list[int]:
+        """Items whose deadline is <= now, in deadline order."""
+        target = self.tick_of(now)
+        if self._current is None:
+            start = target if self._first is None else min(target, self._first)
+            self._current = start - 1
+        due: list[int] = []
+        for tick in range(self._current + 1, min(target, self._current + self._size) + 1):
+            slot = self._slots[tick % self._size]
+            if not slot:
+                continue
+            keep = []
+            for deadline, item in slot:
+                if deadline <= target:
+                    due.append(item)
+                else:
+                    keep.append((deadline, item))
+            self._slots[tick % self._size] = keep
+        self._current = max(self._current, target)
+        self.scheduled -= len(due)
+        return due
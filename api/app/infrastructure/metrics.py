@@ -0,0 +1,113 @@
+"""CommandMetrics — per-command latency histograms, exposed in Prometheus text format.
+
+SimpleCommandBus.execute() records every command's total time (results served from
+the ResultCache included), errors and in-flight count; @transactional records the
+phases of its transaction (handler, flush, dispatch, commit), also of failed runs.
+Published and dispatched events are counted by the EventBus.
+
+Recording is a bisect into fixed buckets plus a few integer updates on plain Python
+objects. All commands of a worker process run on its event loop, so nothing is
+locked; each worker exposes its own series, to be summed by Prometheus.
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from app.infrastructure.events.event_bus import EventBus
+
+# Upper bounds (seconds) of the latency buckets; +Inf is implied.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PHASES = ("handler", "flush", "dispatch", "commit")
+
+
+class Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # per bucket, not cumulative
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+
+class CommandTimings:
+    """Histograms and counters of one command class."""
+
+    __slots__ = ("total", "handler", "flush", "dispatch", "commit", "errors", "in_flight")
+
+    def __init__(self) -> None:
+        self.total = Histogram()
+        self.handler = Histogram()
+        self.flush = Histogram()
+        self.dispatch = Histogram()
+        self.commit = Histogram()
+        self.errors = 0
+        self.in_flight = 0
+
+
+class CommandMetrics:
+    def __init__(self) -> None:
+        self._commands: dict[type, CommandTimings] = {}
+
+    def timings(self, command: type) -> CommandTimings:
+        timings = self._commands.get(command)
+        if timings is None:
+            timings = self._commands[command] = CommandTimings()
+        return timings
+
+    def render(self, event_bus: EventBus) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        return "".join(f"{line}\n" for line in self._lines(event_bus))
+
+    def _lines(self, event_bus: EventBus) -> Iterator[str]:
+        commands = sorted(self._commands.items(), key=lambda item: item[0].__name__)
+
+        yield from _help("command_duration_seconds", "histogram", "CommandBus.execute() time.")
+        for command, timings in commands:
+            yield from _histogram(
+                "command_duration_seconds", f'command="{command.__name__}"', timings.total
+            )
+        yield from _help(
+            "command_phase_duration_seconds", "histogram", "@transactional phase time."
+        )
+        for command, timings in commands:
+            for phase in PHASES:
+                histogram: Histogram = getattr(timings, phase)
+                if sum(histogram.counts):
+                    labels = f'command="{command.__name__}",phase="{phase}"'
+                    yield from _histogram("command_phase_duration_seconds", labels, histogram)
+
+        yield from _help("command_errors_total", "counter", "Commands that raised.")
+        for command, timings in commands:
+            labels = f'command="{command.__name__}"'
+            yield f"paperassist_command_errors_total{{{labels}}} {timings.errors}"
+        yield from _help("commands_in_flight", "gauge", "Commands executing right now.")
+        for command, timings in commands:
+            labels = f'command="{command.__name__}"'
+            yield f"paperassist_commands_in_flight{{{labels}}} {timings.in_flight}"
+
+        for name, counts in (
+            ("events_published_total", event_bus.published_counts),
+            ("events_dispatched_total", event_bus.dispatched_counts),
+        ):
+            yield from _help(name, "counter", f"Events {name.split('_')[1]} per event type.")
+            for event_type, count in sorted(counts.items(), key=lambda item: item[0].__name__):
+                yield f'paperassist_{name}{{event="{event_type.__name__}"}} {count}'
+
+
+def _help(name: str, kind: str, text: str) -> Iterator[str]:
+    yield f"# HELP paperassist_{name} {text}"
+    yield f"# TYPE paperassist_{name} {kind}"
+
+
+def _histogram(name: str, labels: str, histogram: Histogram) -> Iterator[str]:
+    cumulative = 0
+    for bound, count in zip(BUCKETS, histogram.counts, strict=False):
+        cumulative += count
+        yield f'paperassist_{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+    cumulative += histogram.counts[-1]
+    yield f'paperassist_{name}_bucket{{{labels},le="+Inf"}} {cumulative}'
+    yield f"paperassist_{name}_sum{{{labels}}} {histogram.sum}"
+    yield f"paperassist_{name}_count{{{labels}}} {cumulative}"
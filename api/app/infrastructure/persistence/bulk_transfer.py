@@ -0,0 +1,140 @@
+"""BulkTransfer — NDJSON export and import of whole tables in constant memory.
+
+Exports read through a server-side cursor and encode one chunk of rows at a time.
+Imports split the request body into lines as it arrives, validate each line on its
+own (a bad line is reported, not fatal) and insert every `chunk_size` valid rows in
+one statement and one transaction. Either way memory holds at most one chunk.
+
+Both run in sessions of their own, opened through `repository_scope`: an export
+outlives the request handler that started it, so it cannot use a command's session.
+"""
+
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import DBAPIError
+
+from app.domain.models.alarm import Alarm
+from app.domain.models.device import DeviceStatus
+from app.domain.models.screen import Screen
+
+logger = logging.getLogger(__name__)
+
+
+class BulkResource(StrEnum):
+    SCREENS = "screens"
+    ALARMS = "alarms"
+    DEVICES = "devices"
+
+
+_ADAPTERS: dict[BulkResource, TypeAdapter[Any]] = {
+    BulkResource.SCREENS: TypeAdapter(Screen),
+    BulkResource.ALARMS: TypeAdapter(Alarm),
+    BulkResource.DEVICES: TypeAdapter(DeviceStatus),
+}
+
+# Yields a repository (Screen/Alarm/DeviceRepository) on its own session, committed on exit.
+RepositoryScope = Callable[[BulkResource], AbstractAsyncContextManager[Any]]
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    skipped: int = 0  # already present (same id / device_id)
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def _describe(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    loc = ".".join(map(str, error["loc"]))
+    return f"{loc}: {error['msg']}" if loc else error["msg"]
+
+
+class BulkTransfer:
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        chunk_size: int = 1000,
+        max_line_bytes: int = 1024 * 1024,
+        max_errors: int = 100,
+    ) -> None:
+        self._scope = repository_scope
+        self._chunk_size = chunk_size
+        self._max_line_bytes = max_line_bytes
+        self._max_errors = max_errors
+
+    async def export(self, resource: BulkResource) -> AsyncIterator[bytes]:
+        """One NDJSON block per fetched chunk."""
+        adapter = _ADAPTERS[resource]
+        async with self._scope(resource) as repository:
+            async for rows in repository.stream_all(self._chunk_size):
+                yield b"".join(adapter.dump_json(row) + b"\n" for row in rows)
+
+    async def import_ndjson(
+        self, resource: BulkResource, body: AsyncIterable[bytes]
+    ) -> ImportReport:
+        adapter = _ADAPTERS[resource]
+        report = ImportReport()
+        batch: list[Any] = []
+        async for number, line in self._lines(body, report):
+            try:
+                batch.append(adapter.validate_json(line))
+            except ValidationError as exc:
+                self._reject(report, 1, f"line {number}: {_describe(exc)}")
+                continue
+            if len(batch) >= self._chunk_size:
+                await self._insert(resource, batch, number, report)
+                batch = []
+        if batch:
+            await self._insert(resource, batch, None, report)
+        return report
+
+    async def _insert(
+        self, resource: BulkResource, batch: list[Any], last_line: int | None, report: ImportReport
+    ) -> None:
+        try:
+            async with self._scope(resource) as repository:
+                inserted = await repository.insert_many(batch)
+        except DBAPIError as exc:
+            logger.warning("Bulk import of %s failed for a batch", resource, exc_info=exc)
+            where = f"batch ending at line {last_line}" if last_line else "last batch"
+            self._reject(report, len(batch), f"{where}: {exc.orig}")
+            return
+        report.imported += inserted
+        report.skipped += len(batch) - inserted
+
+    async def _lines(
+        self, body: AsyncIterable[bytes], report: ImportReport
+    ) -> AsyncIterator[tuple[int, bytes]]:
+        """(line number, line) of non-blank lines; over-long lines are rejected unread."""
+        number = 0
+        pending = b""
+        oversized = False
+        async for chunk in body:
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                number += 1
+                if oversized:
+                    oversized = False
+                    self._reject(report, 1, f"line {number}: longer than {self._max_line_bytes}")
+                elif line.strip():
+                    yield number, line
+            if len(pending) > self._max_line_bytes:
+                oversized, pending = True, b""
+        number += 1
+        if oversized:
+            self._reject(report, 1, f"line {number}: longer than {self._max_line_bytes}")
+        elif pending.strip():
+            yield number, pending
+
+    def _reject(self, report: ImportReport, rows: int, error: str) -> None:
+        report.rejected += rows
+        if len(report.errors) < self._max_errors:
+            report.errors.append(error)
@@ -1,16 +1,106 @@
-"""SQLAlchemy async engine and session factory."""
+"""SQLAlchemy async engines and session factories.
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+`engine` / `async_session_factory` serve everything that writes. Read-only commands
+(@transactional(readonly=True)) use read engines: autocommit, so a query is a single
+round trip without BEGIN and COMMIT, and on Postgres every connection defaults to
+read-only transactions, so a stray write fails in the database. ReadOnlySession
+refuses writes before they are sent, on every backend.
+
+`read_router` picks the read engine per unit of work: one of the replicas in
+`settings.database_read_replica_urls`, or `read_engine` on the primary.
+"""
+
+from typing import Any
+
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
 
 from app.config import settings
+from app.infrastructure.persistence.read_routing import ReadRouter, Replica, is_write
 
-engine = create_async_engine(settings.database_url, echo=settings.debug, pool_pre_ping=True)
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    pool_pre_ping=True,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+)
 
 async_session_factory = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+def _read_only_connect_args(url: str) -> dict[str, Any]:
+    if make_url(url).get_backend_name() == "postgresql":
+        return {"server_settings": {"default_transaction_read_only": "on"}}
+    return {}
+
+
+def _read_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        isolation_level="AUTOCOMMIT",
+        connect_args=_read_only_connect_args(url),
+    )
+
+
+read_engine = _read_engine(settings.database_url)
+
+
+class ReadOnlySession(Session):
+    """Session of read-only commands: flushes and INSERT/UPDATE/DELETE raise.
+
+    Covers ORM, Core and text() statements; a write sent through a raw connection
+    still fails on Postgres, whose read connections default to read-only transactions.
+    """
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _refuse_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    raise RuntimeError("Read-only command tried to flush changes.")
+
+
+@event.listens_for(ReadOnlySession, "do_orm_execute")
+def _refuse_writes(state: ORMExecuteState) -> None:
+    if is_write(state):
+        raise RuntimeError("Read-only command tried to execute a write statement.")
+
+
+def _read_session_factory(read: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        read, class_=AsyncSession, sync_session_class=ReadOnlySession, expire_on_commit=False
+    )
+
+
+def _replica(url: str) -> Replica:
+    replica_engine = _read_engine(url)
+    return Replica(
+        name=make_url(url).render_as_string(hide_password=True),
+        engine=replica_engine,
+        session_factory=_read_session_factory(replica_engine),
+    )
+
+
+read_session_factory = _read_session_factory(read_engine)
+
+read_router = ReadRouter(
+    read_session_factory,
+    [_replica(url) for url in settings.database_read_replica_urls],
+    sticky_seconds=settings.database_read_your_writes_seconds,
+    health_interval=settings.database_replica_health_interval_seconds,
+)
+
+
 class Base(DeclarativeBase):
     pass
@@ -0,0 +1,119 @@
+"""HeartbeatBuffer — write-behind ingestion of device heartbeats.
+
+Heartbeats are kept in memory, latest per device_id, and written every
+`flush_interval` seconds (or as soon as `max_records` devices are pending) with one
+multi-row INSERT ... ON CONFLICT (device_id) DO UPDATE. Readers go through get()
+first, so a heartbeat is visible from the moment it is accepted. stop() flushes
+whatever is still pending.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from uuid import UUID
+
+from app.domain.models.device import DeviceStatus
+
+logger = logging.getLogger(__name__)
+
+HeartbeatWriter = Callable[[list[DeviceStatus]], Awaitable[dict[str, UUID]]]
+
+
+class HeartbeatBuffer:
+    def __init__(
+        self, writer: HeartbeatWriter, flush_interval: float = 1.0, max_records: int = 500
+    ) -> None:
+        self._writer = writer
+        self._flush_interval = flush_interval
+        self._max_records = max_records
+        self._pending: dict[str, DeviceStatus] = {}
+        # Batch being written: still served by get() until its transaction committed.
+        self._flushing: dict[str, DeviceStatus] = {}
+        # Row ids of devices already stored, so buffered statuses carry the real id.
+        self._ids: dict[str, UUID] = {}
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.accepted = 0
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="heartbeat-buffer")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    def add(self, status: DeviceStatus) -> DeviceStatus:
+        """Accept a heartbeat; returns it as it will be stored."""
+        known_id = self._ids.get(status.device_id)
+        if known_id is not None:
+            status = replace(status, id=known_id)
+        self._pending[status.device_id] = status
+        self.accepted += 1
+        if len(self._pending) >= self._max_records:
+            self._full.set()
+        return status
+
+    def add_many(self, statuses: list[DeviceStatus]) -> list[DeviceStatus]:
+        return [self.add(status) for status in statuses]
+
+    def get(self, device_id: str) -> DeviceStatus | None:
+        status = self._pending.get(device_id)
+        return status if status is not None else self._flushing.get(device_id)
+
+    def knows(self, device_id: str) -> bool:
+        """True if `device_id`'s stored row id is known (buffered status is exact)."""
+        return device_id in self._ids
+
+    def remember(self, status: DeviceStatus) -> None:
+        """Record the stored row id of a device read from the database."""
+        self._ids[status.device_id] = status.id
+        pending = self._pending.get(status.device_id)
+        if pending is not None and pending.id != status.id:
+            self._pending[status.device_id] = replace(pending, id=status.id)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            self._flushing = batch
+            try:
+                ids = await self._writer(list(batch.values()))
+            except Exception:
+                # Put the batch back, without overwriting newer heartbeats.
+                self._pending = batch | self._pending
+                self.failed_flushes += 1
+                logger.exception("Heartbeat flush of %d devices failed", len(batch))
+                return
+            finally:
+                self._flushing = {}
+            for device_id, row_id in ids.items():
+                self.remember(DeviceStatus(device_id=device_id, id=row_id))
+            self.written += len(batch)
+            self.flushes += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "accepted": self.accepted,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._full.wait(), self._flush_interval)
+            self._full.clear()
+            await self.flush()
@@ -1,5 +1,14 @@
-from app.infrastructure.persistence.models.screen import ScreenORM
 from app.infrastructure.persistence.models.alarm import AlarmORM
 from app.infrastructure.persistence.models.device import DeviceStatusORM
+from app.infrastructure.persistence.models.outbox import OutboxMessageORM
+from app.infrastructure.persistence.models.screen import ScreenORM
+from app.infrastructure.persistence.models.telemetry import TelemetryRollupORM, TelemetrySegmentORM
 
-__all__ = ["ScreenORM", "AlarmORM", "DeviceStatusORM"]
+__all__ = [
+    "ScreenORM",
+    "AlarmORM",
+    "DeviceStatusORM",
+    "TelemetrySegmentORM",
+    "TelemetryRollupORM",
+    "OutboxMessageORM",
+]
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, time
 
-from sqlalchemy import DateTime, String, Text, Time, func
+from sqlalchemy import JSON, DateTime, Index, String, Text, Time, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, INTEGER, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,13 +13,26 @@ from app.infrastructure.persistence.database import Base
 
 class AlarmORM(Base):
     __tablename__ = "alarms"
+    # "What fires next" is a range scan over active alarms only.
+    __table_args__ = (
+        Index(
+            "ix_alarms_next_fire_at_active",
+            "next_fire_at",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     trigger_time: Mapped[time] = mapped_column(Time, nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False, default="")
     status: Mapped[str] = mapped_column(String(50), nullable=False, default=AlarmStatus.ACTIVE)
-    repeat_days: Mapped[list[int]] = mapped_column(ARRAY(INTEGER), nullable=False, default=[])
+    # A JSON list on SQLite, which stands in for Postgres in tests.
+    repeat_days: Mapped[list[int]] = mapped_column(
+        ARRAY(INTEGER).with_variant(JSON(), "sqlite"), nullable=False, default=[]
+    )
+    next_fire_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
@@ -33,6 +46,7 @@ class AlarmORM(Base):
             message=self.message,
             status=AlarmStatus(self.status),
             repeat_days=self.repeat_days or [],
+            next_fire_at=self.next_fire_at,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -46,4 +60,5 @@ class AlarmORM(Base):
             message=alarm.message,
             status=alarm.status.value,
             repeat_days=alarm.repeat_days,
+            next_fire_at=alarm.next_fire_at,
         )
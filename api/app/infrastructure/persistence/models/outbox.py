@@ -0,0 +1,30 @@
+"""SQLAlchemy ORM model for the transactional outbox (see infrastructure.events.outbox)."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.persistence.database import Base
+
+
+class OutboxMessageORM(Base):
+    """A committed domain event awaiting delivery to one of its AsyncSubscribers.
+
+    `available_at` is when the message may next be claimed: its creation time, then
+    the end of a relay's lease or of a retry backoff. NULL marks a dead message that
+    exhausted its attempts; it stays for inspection and is never claimed again.
+    """
+
+    __tablename__ = "outbox"
+
+    # INTEGER on SQLite, where only INTEGER PRIMARY KEY autoincrements.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    event_type: Mapped[str] = mapped_column(String(200), nullable=False)
+    subscriber: Mapped[str] = mapped_column(String(200), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    available_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,52 @@
+"""SQLAlchemy ORM models for device telemetry history."""
+
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.persistence.database import Base
+
+
+class TelemetrySegmentORM(Base):
+    """Encoded samples of one device in one day (see telemetry_codec).
+
+    A day collects one segment per flush; compaction merges them into one.
+    """
+
+    __tablename__ = "device_telemetry_segments"
+    __table_args__ = (Index("ix_device_telemetry_segments_device_day", "device_id", "day"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    device_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    start_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    compacted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class TelemetryRollupORM(Base):
+    __tablename__ = "device_telemetry_rollups"
+
+    device_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    resolution: Mapped[str] = mapped_column(String(10), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    battery_min: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    battery_max: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    battery_avg: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_gap_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,172 @@
+"""ReadRouter — read-only units of work go to read replicas, everything else to the primary.
+
+Replicas are used round-robin, skipping those whose last health check (a SELECT 1
+every `health_interval`) failed; with no healthy replica, reads fall back to the
+primary's read-only engine. A client that committed a write reads from the primary
+for `sticky_seconds` afterwards, so it sees its own writes despite replication lag.
+
+The client of the current request is set in `current_client` (by the API's
+ClientMiddleware). Commands run without one, e.g. at startup or from the alarm
+scheduler, never stick to the primary.
+
+Whether a command wrote is tracked per session (session_wrote()): a flush with
+changes, or an INSERT/UPDATE/DELETE statement, ORM, Core or text(). A transaction
+that only read does not make its client sticky.
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import TextClause, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+current_client: ContextVar[str | None] = ContextVar("current_client", default=None)
+
+# First keyword of a data-changing SQL string, after comments and a leading CTE.
+_WRITE_SQL = re.compile(
+    r"^(?:\s+|--[^\n]*|/\*.*?\*/)*(?:WITH\b.*?\b)?"
+    r"(INSERT|UPDATE|DELETE|MERGE|UPSERT|REPLACE|TRUNCATE|CREATE|ALTER|DROP)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def is_write(state: ORMExecuteState) -> bool:
+    """True if the statement being executed changes data (text() statements too)."""
+    if state.is_insert or state.is_update or state.is_delete:
+        return True
+    statement = state.statement
+    return isinstance(statement, TextClause) and _WRITE_SQL.match(statement.text) is not None
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context: Any) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    if is_write(state):
+        state.session.info["wrote"] = True
+
+
+def session_wrote(session: AsyncSession) -> bool:
+    """True if `session` wrote since the last call; resets the flag."""
+    return bool(session.info.pop("wrote", False))
+
+
+@dataclass
+class Replica:
+    name: str  # URL with the password masked
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+    reads: int = 0
+    failed_checks: int = 0
+
+
+class ReadRouter:
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: list[Replica],
+        sticky_seconds: float = 5.0,
+        health_interval: float = 5.0,
+        health_timeout: float = 2.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self._sticky_seconds = sticky_seconds
+        self._health_interval = health_interval
+        self._health_timeout = health_timeout
+        self._next = 0
+        # client -> monotonic time until which its reads go to the primary
+        self._sticky: dict[str, float] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.primary_reads = 0
+        self.sticky_reads = 0
+
+    async def start(self) -> None:
+        if self.replicas:
+            await self.check()
+            self._task = asyncio.create_task(self._run(), name="read-router")
+
+    async def stop(self) -> None:
+        """Stop health checks and close the replica engines."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Where the current client's next read-only unit of work reads from."""
+        client = current_client.get()
+        if client is not None and client in self._sticky:
+            if self._sticky[client] > time.monotonic():
+                self.sticky_reads += 1
+                return self.primary
+            del self._sticky[client]
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next]
+            self._next = (self._next + 1) % len(self.replicas)
+            if replica.healthy:
+                replica.reads += 1
+                return replica.session_factory
+        self.primary_reads += 1
+        return self.primary
+
+    def wrote(self) -> None:
+        """The current client committed a write: read from the primary for a while."""
+        client = current_client.get()
+        if client is not None and self.replicas:
+            self._sticky[client] = time.monotonic() + self._sticky_seconds
+
+    async def check(self) -> None:
+        """Health-check every replica once; also forgets expired sticky clients."""
+        healthy = await asyncio.gather(*(self._ping(r.engine) for r in self.replicas))
+        for replica, ok in zip(self.replicas, healthy, strict=True):
+            if ok != replica.healthy:
+                log = logger.info if ok else logger.warning
+                log("Read replica %s is %s", replica.name, "back" if ok else "down")
+            replica.healthy = ok
+            replica.failed_checks += not ok
+        now = time.monotonic()
+        self._sticky = {c: until for c, until in self._sticky.items() if until > now}
+
+    def stats(self) -> dict[str, int | dict[str, dict[str, int | bool]]]:
+        return {
+            "primary_reads": self.primary_reads,
+            "sticky_reads": self.sticky_reads,
+            "sticky_clients": len(self._sticky),
+            "replicas": {
+                r.name: {"healthy": r.healthy, "reads": r.reads, "failed_checks": r.failed_checks}
+                for r in self.replicas
+            },
+        }
+
+    async def _ping(self, engine: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(self._health_timeout), engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        except Exception:
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Read replica health check failed")
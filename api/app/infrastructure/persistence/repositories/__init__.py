@@ -1,5 +1,13 @@
-from app.infrastructure.persistence.repositories.screen_repository import SqlScreenRepository
 from app.infrastructure.persistence.repositories.alarm_repository import SqlAlarmRepository
 from app.infrastructure.persistence.repositories.device_repository import SqlDeviceRepository
+from app.infrastructure.persistence.repositories.screen_repository import SqlScreenRepository
+from app.infrastructure.persistence.repositories.telemetry_repository import (
+    SqlTelemetryRepository,
+)
 
-__all__ = ["SqlScreenRepository", "SqlAlarmRepository", "SqlDeviceRepository"]
+__all__ = [
+    "SqlScreenRepository",
+    "SqlAlarmRepository",
+    "SqlDeviceRepository",
+    "SqlTelemetryRepository",
+]
@@ -1,8 +1,11 @@
 """Outbound adapter: SQLAlchemy implementation of AlarmRepository port."""
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.alarm import Alarm, AlarmStatus
@@ -45,7 +48,10 @@ class SqlAlarmRepository(AlarmRepository):
         orm.message = alarm.message
         orm.status = alarm.status.value
         orm.repeat_days = alarm.repeat_days
+        orm.next_fire_at = alarm.next_fire_at
         await self._session.flush()
+        # updated_at is set server-side (onupdate=now()) and expired by the flush.
+        await self._session.refresh(orm)
         return orm.to_domain()
 
     async def delete(self, alarm_id: UUID) -> bool:
@@ -55,3 +61,65 @@ class SqlAlarmRepository(AlarmRepository):
         await self._session.delete(orm)
         await self._session.flush()
         return True
+
+    async def get_firing_between(self, start: datetime, end: datetime) -> list[Alarm]:
+        # Matches ix_alarms_next_fire_at_active: the status predicate selects the index.
+        result = await self._session.execute(
+            select(AlarmORM)
+            .where(
+                AlarmORM.status == AlarmStatus.ACTIVE.value,
+                AlarmORM.next_fire_at >= start,
+                AlarmORM.next_fire_at < end,
+            )
+            .order_by(AlarmORM.next_fire_at)
+        )
+        return [row.to_domain() for row in result.scalars().all()]
+
+    async def set_next_fire(self, next_fire: dict[UUID, datetime | None]) -> None:
+        if not next_fire:
+            return
+        # ORM bulk UPDATE by primary key: one executemany, no row loading.
+        await self._session.execute(
+            update(AlarmORM),
+            [{"id": alarm_id, "next_fire_at": at} for alarm_id, at in next_fire.items()],
+        )
+
+    async def mark_triggered(self, alarm_ids: list[UUID]) -> None:
+        await self._session.execute(
+            update(AlarmORM)
+            .where(AlarmORM.id.in_(alarm_ids), AlarmORM.status == AlarmStatus.ACTIVE.value)
+            .values(status=AlarmStatus.TRIGGERED.value, next_fire_at=None, updated_at=func.now())
+        )
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[list[Alarm]]:
+        # Server-side cursor: rows are fetched chunk_size at a time as the caller iterates.
+        result = await self._session.stream_scalars(
+            select(AlarmORM).execution_options(yield_per=chunk_size)
+        )
+        async for orms in result.partitions():
+            yield [orm.to_domain() for orm in orms]
+
+    async def insert_many(self, alarms: list[Alarm]) -> int:
+        if not alarms:
+            return 0
+        # Chunked by the caller (BulkTransfer); existing rows are left untouched. Passed as
+        # executemany parameters so the statement compiles once, not once per chunk. Exported
+        # timestamps are kept.
+        result = await self._session.execute(
+            insert(AlarmORM).on_conflict_do_nothing().returning(AlarmORM.id),
+            [
+                {
+                    "id": a.id,
+                    "name": a.name,
+                    "trigger_time": a.trigger_time,
+                    "message": a.message,
+                    "status": a.status.value,
+                    "repeat_days": a.repeat_days,
+                    "next_fire_at": a.next_fire_at,
+                    "created_at": a.created_at,
+                    "updated_at": a.updated_at,
+                }
+                for a in alarms
+            ],
+        )
+        return len(result.all())
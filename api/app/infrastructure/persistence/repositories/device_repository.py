@@ -1,12 +1,20 @@
 """Outbound adapter: SQLAlchemy implementation of DeviceRepository port."""
 
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.device import DeviceStatus
 from app.domain.ports.device_repository import DeviceRepository
 from app.infrastructure.persistence.models.device import DeviceStatusORM
 
+# 6 bind parameters per row; stays well under PostgreSQL's 32767 limit.
+UPSERT_CHUNK_SIZE = 1000
+
 
 class SqlDeviceRepository(DeviceRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -19,6 +27,18 @@ class SqlDeviceRepository(DeviceRepository):
         orm = result.scalar_one_or_none()
         return orm.to_domain() if orm else None
 
+    async def get_many(self, device_ids: list[str]) -> list[DeviceStatus]:
+        result = await self._session.execute(
+            select(DeviceStatusORM).where(DeviceStatusORM.device_id.in_(device_ids))
+        )
+        return [orm.to_domain() for orm in result.scalars().all()]
+
+    async def list_last_seen(self) -> list[tuple[str, datetime]]:
+        result = await self._session.execute(
+            select(DeviceStatusORM.device_id, DeviceStatusORM.last_seen)
+        )
+        return [(device_id, last_seen) for device_id, last_seen in result.all()]
+
     async def upsert_heartbeat(self, status: DeviceStatus) -> DeviceStatus:
         result = await self._session.execute(
             select(DeviceStatusORM).where(DeviceStatusORM.device_id == status.device_id)
@@ -36,3 +56,65 @@ class SqlDeviceRepository(DeviceRepository):
 
         await self._session.flush()
         return orm.to_domain()
+
+    async def upsert_many(self, statuses: list[DeviceStatus]) -> dict[str, UUID]:
+        ids: dict[str, UUID] = {}
+        for start in range(0, len(statuses), UPSERT_CHUNK_SIZE):
+            chunk = statuses[start : start + UPSERT_CHUNK_SIZE]
+            stmt = insert(DeviceStatusORM).values(
+                [
+                    {
+                        "id": s.id,
+                        "device_id": s.device_id,
+                        "ip_address": s.ip_address,
+                        "firmware_version": s.firmware_version,
+                        "battery_level": s.battery_level,
+                        "last_seen": s.last_seen,
+                    }
+                    for s in chunk
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DeviceStatusORM.device_id],
+                set_={
+                    "ip_address": stmt.excluded.ip_address,
+                    "firmware_version": stmt.excluded.firmware_version,
+                    "battery_level": stmt.excluded.battery_level,
+                    "last_seen": stmt.excluded.last_seen,
+                },
+                # Never let a late (retried) flush overwrite a newer heartbeat.
+                where=DeviceStatusORM.last_seen <= stmt.excluded.last_seen,
+            ).returning(DeviceStatusORM.device_id, DeviceStatusORM.id)
+            result = await self._session.execute(stmt)
+            ids.update({device_id: id_ for device_id, id_ in result.all()})
+        return ids
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[list[DeviceStatus]]:
+        # Server-side cursor: rows are fetched chunk_size at a time as the caller iterates.
+        result = await self._session.stream_scalars(
+            select(DeviceStatusORM).execution_options(yield_per=chunk_size)
+        )
+        async for orms in result.partitions():
+            yield [orm.to_domain() for orm in orms]
+
+    async def insert_many(self, statuses: list[DeviceStatus]) -> int:
+        if not statuses:
+            return 0
+        # Chunked by the caller (BulkTransfer); existing rows are left untouched. Passed as
+        # executemany parameters so the statement compiles once, not once per chunk. Exported
+        # timestamps are kept.
+        result = await self._session.execute(
+            insert(DeviceStatusORM).on_conflict_do_nothing().returning(DeviceStatusORM.id),
+            [
+                {
+                    "id": s.id,
+                    "device_id": s.device_id,
+                    "ip_address": s.ip_address,
+                    "firmware_version": s.firmware_version,
+                    "battery_level": s.battery_level,
+                    "last_seen": s.last_seen,
+                }
+                for s in statuses
+            ],
+        )
+        return len(result.all())
@@ -1,8 +1,10 @@
 """Outbound adapter: SQLAlchemy implementation of ScreenRepository port."""
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.screen import Screen
@@ -34,6 +36,14 @@ class SqlScreenRepository(ScreenRepository):
         orm = result.scalar_one_or_none()
         return orm.to_domain() if orm else None
 
+    async def get_active(self) -> list[Screen]:
+        result = await self._session.execute(
+            select(ScreenORM)
+            .where(ScreenORM.is_active.is_(True))
+            .order_by(ScreenORM.display_order)
+        )
+        return [row.to_domain() for row in result.scalars().all()]
+
     async def create(self, screen: Screen) -> Screen:
         orm = ScreenORM.from_domain(screen)
         self._session.add(orm)
@@ -50,6 +60,8 @@ class SqlScreenRepository(ScreenRepository):
         orm.is_active = screen.is_active
         orm.display_order = screen.display_order
         await self._session.flush()
+        # updated_at is set server-side (onupdate=now()) and expired by the flush.
+        await self._session.refresh(orm)
         return orm.to_domain()
 
     async def delete(self, screen_id: UUID) -> bool:
@@ -59,3 +71,35 @@ class SqlScreenRepository(ScreenRepository):
         await self._session.delete(orm)
         await self._session.flush()
         return True
+
+    async def stream_all(self, chunk_size: int) -> AsyncIterator[list[Screen]]:
+        # Server-side cursor: rows are fetched chunk_size at a time as the caller iterates.
+        result = await self._session.stream_scalars(
+            select(ScreenORM).execution_options(yield_per=chunk_size)
+        )
+        async for orms in result.partitions():
+            yield [orm.to_domain() for orm in orms]
+
+    async def insert_many(self, screens: list[Screen]) -> int:
+        if not screens:
+            return 0
+        # Chunked by the caller (BulkTransfer); existing rows are left untouched. Passed as
+        # executemany parameters so the statement compiles once, not once per chunk. Exported
+        # timestamps are kept.
+        result = await self._session.execute(
+            insert(ScreenORM).on_conflict_do_nothing().returning(ScreenORM.id),
+            [
+                {
+                    "id": s.id,
+                    "title": s.title,
+                    "content": s.content,
+                    "screen_type": s.screen_type.value,
+                    "is_active": s.is_active,
+                    "display_order": s.display_order,
+                    "created_at": s.created_at,
+                    "updated_at": s.updated_at,
+                }
+                for s in screens
+            ],
+        )
+        return len(result.all())
@@ -0,0 +1,236 @@
+"""Outbound adapter: SQLAlchemy implementation of TelemetryRepository port.
+
+Raw samples live in encoded day segments (telemetry_codec). Rollups are written when
+a day is compacted; days that still have uncompacted segments (today, or late
+samples) are rolled up on the fly from the segments instead.
+"""
+
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.telemetry import HeartbeatSample, TelemetryPoint, TelemetryResolution
+from app.domain.ports.telemetry_repository import TelemetryRepository
+from app.infrastructure.persistence.models.telemetry import TelemetryRollupORM, TelemetrySegmentORM
+from app.infrastructure.persistence.telemetry_codec import NO_BATTERY, decode, encode, rollup
+
+BUCKET_SECONDS = {TelemetryResolution.HOUR: 3600, TelemetryResolution.DAY: 86400}
+
+
+def _to_unix(at: datetime) -> int:
+    return int(at.replace(tzinfo=UTC).timestamp())
+
+
+def _from_unix(seconds: int) -> datetime:
+    return datetime.fromtimestamp(seconds, UTC).replace(tzinfo=None)
+
+
+class SqlTelemetryRepository(TelemetryRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def append(self, samples: list[HeartbeatSample]) -> None:
+        by_segment: dict[tuple[str, date], list[HeartbeatSample]] = defaultdict(list)
+        for sample in samples:
+            by_segment[(sample.device_id, sample.at.date())].append(sample)
+        rows = []
+        for (device_id, day), day_samples in by_segment.items():
+            timestamps = np.array([_to_unix(s.at) for s in day_samples], dtype=np.int64)
+            battery = np.array(
+                [NO_BATTERY if s.battery_level is None else s.battery_level for s in day_samples],
+                dtype=np.int16,
+            )
+            rows.append(self._segment_row(device_id, day, timestamps, battery, compacted=False))
+        if rows:
+            await self._session.execute(insert(TelemetrySegmentORM), rows)
+
+    async def get_points(
+        self,
+        device_id: str,
+        resolution: TelemetryResolution,
+        start: datetime,
+        end: datetime,
+    ) -> list[TelemetryPoint]:
+        if resolution is TelemetryResolution.RAW:
+            segments = await self._segments(device_id, start.date(), end.date())
+            timestamps, battery = self._merge(segments)
+            keep = (timestamps >= _to_unix(start)) & (timestamps < _to_unix(end))
+            gaps = np.diff(timestamps, prepend=timestamps[:1])
+            return [
+                TelemetryPoint(
+                    at=_from_unix(ts),
+                    samples=1,
+                    battery_min=None if level == NO_BATTERY else level,
+                    battery_max=None if level == NO_BATTERY else level,
+                    battery_avg=None if level == NO_BATTERY else float(level),
+                    max_gap_seconds=gap,
+                )
+                for ts, level, gap in zip(
+                    timestamps[keep].tolist(),
+                    battery[keep].tolist(),
+                    gaps[keep].tolist(),
+                    strict=True,
+                )
+            ]
+
+        bucket_seconds = BUCKET_SECONDS[resolution]
+        first_bucket = _from_unix(_to_unix(start) // bucket_seconds * bucket_seconds)
+        # Days with uncompacted segments have no (or partial) stored rollups.
+        live_days = set(
+            (
+                await self._session.execute(
+                    select(TelemetrySegmentORM.day)
+                    .where(
+                        TelemetrySegmentORM.device_id == device_id,
+                        TelemetrySegmentORM.day.between(start.date(), end.date()),
+                        TelemetrySegmentORM.compacted.is_(False),
+                    )
+                    .distinct()
+                )
+            )
+            .scalars()
+            .all()
+        )
+        stored = (
+            await self._session.execute(
+                select(TelemetryRollupORM)
+                .where(
+                    TelemetryRollupORM.device_id == device_id,
+                    TelemetryRollupORM.resolution == resolution,
+                    TelemetryRollupORM.bucket_start >= first_bucket,
+                    TelemetryRollupORM.bucket_start < end,
+                )
+                .order_by(TelemetryRollupORM.bucket_start)
+            )
+        ).scalars()
+        points = [
+            TelemetryPoint(
+                at=row.bucket_start,
+                samples=row.samples,
+                battery_min=row.battery_min,
+                battery_max=row.battery_max,
+                battery_avg=row.battery_avg,
+                max_gap_seconds=row.max_gap_seconds,
+            )
+            for row in stored
+            if row.bucket_start.date() not in live_days
+        ]
+        for day in sorted(live_days):
+            segments = await self._segments(device_id, day, day)
+            timestamps, battery = self._merge(segments)
+            for bucket, samples, low, high, avg, gap in rollup(timestamps, battery, bucket_seconds):
+                at = _from_unix(bucket)
+                if first_bucket <= at < end:
+                    points.append(TelemetryPoint(at, samples, low, high, avg, gap))
+        points.sort(key=lambda p: p.at)
+        return points
+
+    async def uncompacted_days(self, before: date) -> list[date]:
+        result = await self._session.execute(
+            select(TelemetrySegmentORM.day)
+            .where(TelemetrySegmentORM.compacted.is_(False), TelemetrySegmentORM.day < before)
+            .distinct()
+            .order_by(TelemetrySegmentORM.day)
+        )
+        return list(result.scalars().all())
+
+    async def compact(self, day: date) -> int:
+        result = await self._session.execute(
+            select(TelemetrySegmentORM).where(TelemetrySegmentORM.day == day)
+        )
+        by_device: dict[str, list[TelemetrySegmentORM]] = defaultdict(list)
+        for segment in result.scalars():
+            by_device[segment.device_id].append(segment)
+
+        compacted = 0
+        day_start = datetime.combine(day, datetime.min.time())
+        for device_id, segments in by_device.items():
+            if len(segments) == 1 and segments[0].compacted:
+                continue
+            timestamps, battery = self._merge(segments)
+            await self._session.execute(
+                delete(TelemetrySegmentORM).where(
+                    TelemetrySegmentORM.id.in_([s.id for s in segments])
+                )
+            )
+            await self._session.execute(
+                insert(TelemetrySegmentORM),
+                [self._segment_row(device_id, day, timestamps, battery, compacted=True)],
+            )
+            await self._session.execute(
+                delete(TelemetryRollupORM).where(
+                    TelemetryRollupORM.device_id == device_id,
+                    TelemetryRollupORM.bucket_start >= day_start,
+                    TelemetryRollupORM.bucket_start < day_start + timedelta(days=1),
+                )
+            )
+            rollups = [
+                {
+                    "device_id": device_id,
+                    "resolution": resolution,
+                    "bucket_start": _from_unix(bucket),
+                    "samples": samples,
+                    "battery_min": low,
+                    "battery_max": high,
+                    "battery_avg": avg,
+                    "max_gap_seconds": gap,
+                }
+                for resolution, bucket_seconds in BUCKET_SECONDS.items()
+                for bucket, samples, low, high, avg, gap in rollup(
+                    timestamps, battery, bucket_seconds
+                )
+            ]
+            await self._session.execute(insert(TelemetryRollupORM), rollups)
+            compacted += 1
+        return compacted
+
+    async def prune(self, resolution: TelemetryResolution, before: date) -> int:
+        if resolution is TelemetryResolution.RAW:
+            stmt = delete(TelemetrySegmentORM).where(TelemetrySegmentORM.day < before)
+        else:
+            stmt = delete(TelemetryRollupORM).where(
+                TelemetryRollupORM.resolution == resolution,
+                TelemetryRollupORM.bucket_start < datetime.combine(before, datetime.min.time()),
+            )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def _segments(
+        self, device_id: str, first_day: date, last_day: date
+    ) -> list[TelemetrySegmentORM]:
+        result = await self._session.execute(
+            select(TelemetrySegmentORM).where(
+                TelemetrySegmentORM.device_id == device_id,
+                TelemetrySegmentORM.day.between(first_day, last_day),
+            )
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _merge(segments: list[TelemetrySegmentORM]) -> tuple[np.ndarray, np.ndarray]:
+        decoded = [decode(s.payload) for s in segments]
+        if not decoded:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int16)
+        timestamps = np.concatenate([ts for ts, _ in decoded])
+        battery = np.concatenate([b for _, b in decoded])
+        order = np.argsort(timestamps, kind="stable")
+        return timestamps[order], battery[order]
+
+    @staticmethod
+    def _segment_row(
+        device_id: str, day: date, timestamps: np.ndarray, battery: np.ndarray, compacted: bool
+    ) -> dict:
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, battery = timestamps[order], battery[order]
+        return {
+            "device_id": device_id,
+            "day": day,
+            "start_at": _from_unix(int(timestamps[0])),
+            "end_at": _from_unix(int(timestamps[-1])),
+            "sample_count": int(timestamps.size),
+            "compacted": compacted,
+            "payload": encode(timestamps, battery),
+        }
@@ -0,0 +1,79 @@
+"""Compact encoding of heartbeat samples and their rollups.
+
+A segment holds one device's samples of one day:
+
+    header  <I q   sample count, first timestamp (unix seconds)
+    body    zlib(  u32 timestamp deltas [count - 1]
+                   i8  battery deltas     [count]      battery -1 = unknown )
+
+Heartbeats arrive at a near-constant period, so the deltas are a handful of repeated
+values and compress to a few bytes per hundred samples.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+HEADER = struct.Struct("<Iq")
+NO_BATTERY = -1
+
+
+def encode(timestamps: np.ndarray, battery: np.ndarray) -> bytes:
+    """`timestamps` sorted int64 unix seconds; `battery` 0..100 or NO_BATTERY."""
+    count = int(timestamps.size)
+    if count == 0:
+        return HEADER.pack(0, 0)
+    ts_deltas = np.diff(timestamps).astype("<u4")
+    levels = np.clip(battery, NO_BATTERY, 100).astype(np.int16)
+    battery_deltas = np.diff(levels, prepend=0).astype("i1")
+    body = zlib.compress(ts_deltas.tobytes() + battery_deltas.tobytes())
+    return HEADER.pack(count, int(timestamps[0])) + body
+
+
+def decode(payload: bytes) -> tuple[np.ndarray, np.ndarray]:
+    count, first = HEADER.unpack_from(payload)
+    if count == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int16)
+    body = zlib.decompress(payload[HEADER.size :])
+    ts_deltas = np.frombuffer(body, dtype="<u4", count=count - 1)
+    battery_deltas = np.frombuffer(body, dtype="i1", count=count, offset=4 * (count - 1))
+    timestamps = np.concatenate(([first], first + np.cumsum(ts_deltas, dtype=np.int64)))
+    return timestamps, np.cumsum(battery_deltas, dtype=np.int16)
+
+
+def rollup(
+    timestamps: np.ndarray, battery: np.ndarray, bucket_seconds: int
+) -> list[tuple[int, int, int | None, int | None, float | None, int]]:
+    """(bucket_start, samples, min, max, avg, max_gap) per non-empty bucket.
+
+    Input must be sorted by time. Samples without a battery reading count towards
+    `samples` and gaps but not towards min/max/avg.
+    """
+    if timestamps.size == 0:
+        return []
+    buckets = timestamps - timestamps % bucket_seconds
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    counts = np.diff(np.append(starts, timestamps.size))
+    gaps = np.maximum.reduceat(np.diff(timestamps, prepend=timestamps[0]), starts)
+
+    known = battery != NO_BATTERY
+    known_counts = np.add.reduceat(known.astype(np.int64), starts)
+    sums = np.add.reduceat(np.where(known, battery, 0).astype(np.int64), starts)
+    mins = np.minimum.reduceat(np.where(known, battery, np.iinfo(np.int16).max), starts)
+    maxs = np.maximum.reduceat(np.where(known, battery, NO_BATTERY), starts)
+
+    rows = []
+    for i, start in enumerate(starts.tolist()):
+        has_battery = known_counts[i] > 0
+        rows.append(
+            (
+                int(buckets[start]),
+                int(counts[i]),
+                int(mins[i]) if has_battery else None,
+                int(maxs[i]) if has_battery else None,
+                float(sums[i] / known_counts[i]) if has_battery else None,
+                int(gaps[i]),
+            )
+        )
+    return rows
@@ -0,0 +1,123 @@
+"""TelemetryRecorder — buffers heartbeat samples and maintains the telemetry history.
+
+Samples are appended to the TelemetryRepository every `flush_interval` seconds as one
+segment per device and day. Every `maintenance_interval` seconds (and at start) the
+recorder compacts closed days, which also writes their hourly/daily rollups, and
+prunes each resolution past its retention.
+
+Storage is bounded on both axes: a device contributes at most one sample per
+`min_sample_interval` seconds, and every resolution has a retention in days.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta
+
+from app.domain.models.telemetry import HeartbeatSample, TelemetryResolution
+from app.domain.ports.telemetry_repository import TelemetryRepository
+
+logger = logging.getLogger(__name__)
+
+RepositoryScope = Callable[[], AbstractAsyncContextManager[TelemetryRepository]]
+
+
+class TelemetryRecorder:
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        retention_days: dict[TelemetryResolution, int],
+        flush_interval: float = 60.0,
+        maintenance_interval: float = 3600.0,
+        min_sample_interval: float = 30.0,
+        max_buffered: int = 10_000,
+    ) -> None:
+        self._repository_scope = repository_scope
+        self._retention_days = retention_days
+        self._flush_interval = flush_interval
+        self._maintenance_interval = maintenance_interval
+        self._min_sample_interval = timedelta(seconds=min_sample_interval)
+        self._max_buffered = max_buffered
+        self._buffer: list[HeartbeatSample] = []
+        self._last_sample_at: dict[str, datetime] = {}
+        self._full = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self.recorded = 0
+        self.skipped = 0
+        self.written = 0
+        self.compacted = 0
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._flush_loop(), name="telemetry-flush"),
+            asyncio.create_task(self._maintenance_loop(), name="telemetry-maintenance"),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.flush()
+
+    def record(self, sample: HeartbeatSample) -> None:
+        last = self._last_sample_at.get(sample.device_id)
+        if last is not None and sample.at - last < self._min_sample_interval:
+            self.skipped += 1
+            return
+        self._last_sample_at[sample.device_id] = sample.at
+        self._buffer.append(sample)
+        self.recorded += 1
+        if len(self._buffer) >= self._max_buffered:
+            self._full.set()
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            async with self._repository_scope() as repository:
+                await repository.append(batch)
+        except Exception:
+            logger.exception("Telemetry flush of %d samples failed; dropped", len(batch))
+            return
+        self.written += len(batch)
+
+    async def maintain(self, now: datetime | None = None) -> None:
+        """Compact closed days, then apply retention to every resolution."""
+        today = (now or datetime.utcnow()).date()
+        async with self._repository_scope() as repository:
+            days = await repository.uncompacted_days(before=today)
+        for day in days:
+            # One transaction per day keeps each compaction short.
+            async with self._repository_scope() as repository:
+                self.compacted += await repository.compact(day)
+        async with self._repository_scope() as repository:
+            for resolution, days_kept in self._retention_days.items():
+                await repository.prune(resolution, before=today - timedelta(days=days_kept))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "skipped": self.skipped,
+            "written": self.written,
+            "compacted": self.compacted,
+        }
+
+    async def _flush_loop(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._full.wait(), self._flush_interval)
+            self._full.clear()
+            await self.flush()
+
+    async def _maintenance_loop(self) -> None:
+        while True:
+            try:
+                await self.maintain()
+            except Exception:
+                logger.exception("Telemetry maintenance failed")
+            await asyncio.sleep(self._maintenance_interval)
@@ -0,0 +1,15 @@
+from app.infrastructure.rendering.framebuffer import EPD_BUF_SIZE, Framebuffer
+from app.infrastructure.rendering.partial_refresh import RefreshMode, RefreshPlan, RefreshPlanner
+from app.infrastructure.rendering.render_farm import RenderFarm, RenderStatus
+from app.infrastructure.rendering.screen_renderer import FramebufferScreenRenderer
+
+__all__ = [
+    "EPD_BUF_SIZE",
+    "Framebuffer",
+    "FramebufferScreenRenderer",
+    "RefreshMode",
+    "RefreshPlan",
+    "RefreshPlanner",
+    "RenderFarm",
+    "RenderStatus",
+]
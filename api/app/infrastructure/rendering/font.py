@@ -0,0 +1,110 @@
+"""5x7 bitmap font — byte-for-byte copy of font_5x7 in src/epd_font.h.
+
+ASCII 32-126, column-major: each glyph = 5 bytes, each byte = one column,
+LSB = top pixel, bit 6 = bottom pixel. Keep in sync with the firmware header.
+"""
+
+FONT_WIDTH = 5
+FONT_HEIGHT = 7
+FIRST_CHAR = 32
+LAST_CHAR = 126
+
+# fmt: off
+FONT_5X7: tuple[bytes, ...] = (
+    bytes((0x00, 0x00, 0x00, 0x00, 0x00)),  # 32 ' '
+    bytes((0x00, 0x00, 0x5F, 0x00, 0x00)),  # 33 '!'
+    bytes((0x00, 0x07, 0x00, 0x07, 0x00)),  # 34 '"'
+    bytes((0x14, 0x7F, 0x14, 0x7F, 0x14)),  # 35 '#'
+    bytes((0x24, 0x2A, 0x7F, 0x2A, 0x12)),  # 36 '$'
+    bytes((0x23, 0x13, 0x08, 0x64, 0x62)),  # 37 '%'
+    bytes((0x36, 0x49, 0x55, 0x22, 0x50)),  # 38 '&'
+    bytes((0x00, 0x05, 0x03, 0x00, 0x00)),  # 39 "'"
+    bytes((0x00, 0x1C, 0x22, 0x41, 0x00)),  # 40 '('
+    bytes((0x00, 0x41, 0x22, 0x1C, 0x00)),  # 41 ')'
+    bytes((0x08, 0x2A, 0x1C, 0x2A, 0x08)),  # 42 '*'
+    bytes((0x08, 0x08, 0x3E, 0x08, 0x08)),  # 43 '+'
+    bytes((0x00, 0x50, 0x30, 0x00, 0x00)),  # 44 ','
+    bytes((0x08, 0x08, 0x08, 0x08, 0x08)),  # 45 '-'
+    bytes((0x00, 0x60, 0x60, 0x00, 0x00)),  # 46 '.'
+    bytes((0x20, 0x10, 0x08, 0x04, 0x02)),  # 47 '/'
+    bytes((0x3E, 0x51, 0x49, 0x45, 0x3E)),  # 48 '0'
+    bytes((0x00, 0x42, 0x7F, 0x40, 0x00)),  # 49 '1'
+    bytes((0x42, 0x61, 0x51, 0x49, 0x46)),  # 50 '2'
+    bytes((0x21, 0x41, 0x45, 0x4B, 0x31)),  # 51 '3'
+    bytes((0x18, 0x14, 0x12, 0x7F, 0x10)),  # 52 '4'
+    bytes((0x27, 0x45, 0x45, 0x45, 0x39)),  # 53 '5'
+    bytes((0x3C, 0x4A, 0x49, 0x49, 0x30)),  # 54 '6'
+    bytes((0x01, 0x71, 0x09, 0x05, 0x03)),  # 55 '7'
+    bytes((0x36, 0x49, 0x49, 0x49, 0x36)),  # 56 '8'
+    bytes((0x06, 0x49, 0x49, 0x29, 0x1E)),  # 57 '9'
+    bytes((0x00, 0x36, 0x36, 0x00, 0x00)),  # 58 ':'
+    bytes((0x00, 0x56, 0x36, 0x00, 0x00)),  # 59 ';'
+    bytes((0x00, 0x08, 0x14, 0x22, 0x41)),  # 60 '<'
+    bytes((0x14, 0x14, 0x14, 0x14, 0x14)),  # 61 '='
+    bytes((0x41, 0x22, 0x14, 0x08, 0x00)),  # 62 '>'
+    bytes((0x02, 0x01, 0x51, 0x09, 0x06)),  # 63 '?'
+    bytes((0x32, 0x49, 0x79, 0x41, 0x3E)),  # 64 '@'
+    bytes((0x7E, 0x11, 0x11, 0x11, 0x7E)),  # 65 'A'
+    bytes((0x7F, 0x49, 0x49, 0x49, 0x36)),  # 66 'B'
+    bytes((0x3E, 0x41, 0x41, 0x41, 0x22)),  # 67 'C'
+    bytes((0x7F, 0x41, 0x41, 0x22, 0x1C)),  # 68 'D'
+    bytes((0x7F, 0x49, 0x49, 0x49, 0x41)),  # 69 'E'
+    bytes((0x7F, 0x09, 0x09, 0x01, 0x01)),  # 70 'F'
+    bytes((0x3E, 0x41, 0x41, 0x51, 0x32)),  # 71 'G'
+    bytes((0x7F, 0x08, 0x08, 0x08, 0x7F)),  # 72 'H'
+    bytes((0x00, 0x41, 0x7F, 0x41, 0x00)),  # 73 'I'
+    bytes((0x20, 0x40, 0x41, 0x3F, 0x01)),  # 74 'J'
+    bytes((0x7F, 0x08, 0x14, 0x22, 0x41)),  # 75 'K'
+    bytes((0x7F, 0x40, 0x40, 0x40, 0x40)),  # 76 'L'
+    bytes((0x7F, 0x02, 0x04, 0x02, 0x7F)),  # 77 'M'
+    bytes((0x7F, 0x04, 0x08, 0x10, 0x7F)),  # 78 'N'
+    bytes((0x3E, 0x41, 0x41, 0x41, 0x3E)),  # 79 'O'
+    bytes((0x7F, 0x09, 0x09, 0x09, 0x06)),  # 80 'P'
+    bytes((0x3E, 0x41, 0x51, 0x21, 0x5E)),  # 81 'Q'
+    bytes((0x7F, 0x09, 0x19, 0x29, 0x46)),  # 82 'R'
+    bytes((0x46, 0x49, 0x49, 0x49, 0x31)),  # 83 'S'
+    bytes((0x01, 0x01, 0x7F, 0x01, 0x01)),  # 84 'T'
+    bytes((0x3F, 0x40, 0x40, 0x40, 0x3F)),  # 85 'U'
+    bytes((0x1F, 0x20, 0x40, 0x20, 0x1F)),  # 86 'V'
+    bytes((0x7F, 0x20, 0x18, 0x20, 0x7F)),  # 87 'W'
+    bytes((0x63, 0x14, 0x08, 0x14, 0x63)),  # 88 'X'
+    bytes((0x03, 0x04, 0x78, 0x04, 0x03)),  # 89 'Y'
+    bytes((0x61, 0x51, 0x49, 0x45, 0x43)),  # 90 'Z'
+    bytes((0x00, 0x00, 0x7F, 0x41, 0x41)),  # 91 '['
+    bytes((0x02, 0x04, 0x08, 0x10, 0x20)),  # 92 '\\'
+    bytes((0x41, 0x41, 0x7F, 0x00, 0x00)),  # 93 ']'
+    bytes((0x04, 0x02, 0x01, 0x02, 0x04)),  # 94 '^'
+    bytes((0x40, 0x40, 0x40, 0x40, 0x40)),  # 95 '_'
+    bytes((0x00, 0x01, 0x02, 0x04, 0x00)),  # 96 '`'
+    bytes((0x20, 0x54, 0x54, 0x54, 0x78)),  # 97 'a'
+    bytes((0x7F, 0x48, 0x44, 0x44, 0x38)),  # 98 'b'
+    bytes((0x38, 0x44, 0x44, 0x44, 0x20)),  # 99 'c'
+    bytes((0x38, 0x44, 0x44, 0x48, 0x7F)),  # 100 'd'
+    bytes((0x38, 0x54, 0x54, 0x54, 0x18)),  # 101 'e'
+    bytes((0x08, 0x7E, 0x09, 0x01, 0x02)),  # 102 'f'
+    bytes((0x08, 0x14, 0x54, 0x54, 0x3C)),  # 103 'g'
+    bytes((0x7F, 0x08, 0x04, 0x04, 0x78)),  # 104 'h'
+    bytes((0x00, 0x44, 0x7D, 0x40, 0x00)),  # 105 'i'
+    bytes((0x20, 0x40, 0x44, 0x3D, 0x00)),  # 106 'j'
+    bytes((0x00, 0x7F, 0x10, 0x28, 0x44)),  # 107 'k'
+    bytes((0x00, 0x41, 0x7F, 0x40, 0x00)),  # 108 'l'
+    bytes((0x7C, 0x04, 0x18, 0x04, 0x78)),  # 109 'm'
+    bytes((0x7C, 0x08, 0x04, 0x04, 0x78)),  # 110 'n'
+    bytes((0x38, 0x44, 0x44, 0x44, 0x38)),  # 111 'o'
+    bytes((0x7C, 0x14, 0x14, 0x14, 0x08)),  # 112 'p'
+    bytes((0x08, 0x14, 0x14, 0x18, 0x7C)),  # 113 'q'
+    bytes((0x7C, 0x08, 0x04, 0x04, 0x08)),  # 114 'r'
+    bytes((0x48, 0x54, 0x54, 0x54, 0x20)),  # 115 's'
+    bytes((0x04, 0x3F, 0x44, 0x40, 0x20)),  # 116 't'
+    bytes((0x3C, 0x40, 0x40, 0x20, 0x7C)),  # 117 'u'
+    bytes((0x1C, 0x20, 0x40, 0x20, 0x1C)),  # 118 'v'
+    bytes((0x3C, 0x40, 0x30, 0x40, 0x3C)),  # 119 'w'
+    bytes((0x44, 0x28, 0x10, 0x28, 0x44)),  # 120 'x'
+    bytes((0x0C, 0x50, 0x50, 0x50, 0x3C)),  # 121 'y'
+    bytes((0x44, 0x64, 0x54, 0x4C, 0x44)),  # 122 'z'
+    bytes((0x00, 0x08, 0x36, 0x41, 0x00)),  # 123 '{'
+    bytes((0x00, 0x00, 0x7F, 0x00, 0x00)),  # 124 '|'
+    bytes((0x00, 0x41, 0x36, 0x08, 0x00)),  # 125 '}'
+    bytes((0x08, 0x04, 0x08, 0x10, 0x08)),  # 126 '~'
+)
+# fmt: on
@@ -0,0 +1,77 @@
+"""Framebuffer — NumPy port of src/epd_gfx.c for the 200x200 SSD1681 panel.
+
+Pixels are held unpacked (one bool per pixel, True = black) and packed on demand into
+the panel layout used by the firmware:
+    byte [y * 25 + x / 8], bit (0x80 >> (x % 8)) = pixel (x, y), 1 = white, 0 = black.
+Drawing semantics (clipping, glyph spacing, '?' for unknown chars) match epd_gfx.c, so
+a buffer drawn here is byte-identical to the same calls made on the device. Text is
+blitted as whole-line masks from the glyph atlas (see text_layout).
+"""
+
+import numpy as np
+
+from app.infrastructure.rendering.font import FONT_HEIGHT, FONT_WIDTH
+from app.infrastructure.rendering.text_layout import ATLAS, glyph_indices
+
+EPD_WIDTH = 200
+EPD_HEIGHT = 200
+EPD_BUF_SIZE = EPD_WIDTH // 8 * EPD_HEIGHT  # 5000 bytes
+
+EPD_WHITE = 1
+EPD_BLACK = 0
+
+
+def string_width(text: str, scale: int = 1) -> int:
+    if not text:
+        return 0
+    return len(text) * (FONT_WIDTH + 1) * scale - scale
+
+
+def string_height(scale: int = 1) -> int:
+    return FONT_HEIGHT * scale
+
+
+class Framebuffer:
+    def __init__(self, color: int = EPD_WHITE) -> None:
+        self.pixels = np.empty((EPD_HEIGHT, EPD_WIDTH), dtype=bool)
+        self.fill(color)
+
+    def fill(self, color: int) -> None:
+        self.pixels[:] = color == EPD_BLACK
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: int) -> None:
+        x0, x1 = max(x, 0), min(x + w, EPD_WIDTH)
+        y0, y1 = max(y, 0), min(y + h, EPD_HEIGHT)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = color == EPD_BLACK
+
+    def draw_rect(self, x: int, y: int, w: int, h: int, color: int) -> None:
+        self.fill_rect(x, y, w, 1, color)
+        self.fill_rect(x, y + h - 1, w, 1, color)
+        self.fill_rect(x, y, 1, h, color)
+        self.fill_rect(x + w - 1, y, 1, h, color)
+
+    def draw_char(self, x: int, y: int, char: str, color: int, scale: int = 1) -> None:
+        glyph = ATLAS.glyphs(scale)[glyph_indices(char[:1])[0]]
+        self.blit(x, y, glyph, color)
+
+    def draw_string(self, x: int, y: int, text: str, color: int, scale: int = 1) -> None:
+        self.blit(x, y, ATLAS.line(text, scale), color)
+
+    def blit(self, x: int, y: int, mask: np.ndarray, color: int) -> None:
+        """Set pixels where `mask` is True to `color`; others are left untouched."""
+        h, w = mask.shape
+        x0, x1 = max(x, 0), min(x + w, EPD_WIDTH)
+        y0, y1 = max(y, 0), min(y + h, EPD_HEIGHT)
+        if x0 >= x1 or y0 >= y1:
+            return
+        clipped = mask[y0 - y : y1 - y, x0 - x : x1 - x]
+        region = self.pixels[y0:y1, x0:x1]
+        if color == EPD_BLACK:
+            region |= clipped
+        else:
+            region &= ~clipped
+
+    def pack(self) -> bytes:
+        """Packed 1bpp buffer, EPD_BUF_SIZE bytes, ready for SSD1681_WRITE_BW_RAM."""
+        return np.packbits(~self.pixels, axis=1).tobytes()
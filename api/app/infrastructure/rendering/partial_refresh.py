@@ -0,0 +1,138 @@
+"""Partial refresh — framebuffer diffs encoded as SSD1681 RAM windows.
+
+A device reports the hash of the buffer it displays (X-Framebuffer-Hash from its last
+download). If the server still knows that buffer, it XORs old against new and sends
+only the changed windows. Each window maps 1:1 onto the panel commands used by
+epd_set_ram_area() in src/ssd1681.c (data entry mode 0x03, X and Y increment):
+
+    SET_RAM_X  x_start, x_end              (byte addresses, inclusive)
+    SET_RAM_Y  y_start (u16), y_end (u16)  (rows, inclusive)
+    WRITE_BW_RAM  (x_end - x_start + 1) * (y_end - y_start + 1) bytes, row-major
+
+Patch payload (little-endian):
+    u8 window_count, then per window:
+    u8 x_start, u8 x_end, u16 y_start, u16 y_end, window bytes
+"""
+
+import hashlib
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+
+import numpy as np
+
+from app.infrastructure.rendering.framebuffer import EPD_BUF_SIZE, EPD_HEIGHT, EPD_WIDTH
+
+ROW_BYTES = EPD_WIDTH // 8
+WINDOW_HEADER = struct.Struct("<BBHH")
+
+
+class RefreshMode(StrEnum):
+    NONE = "none"
+    PARTIAL = "partial"
+    FULL = "full"
+
+
+@dataclass(frozen=True)
+class Window:
+    x_start: int  # byte column, inclusive
+    x_end: int  # byte column, inclusive
+    y_start: int  # row, inclusive
+    y_end: int  # row, inclusive
+
+
+@dataclass(frozen=True)
+class RefreshPlan:
+    mode: RefreshMode
+    framebuffer_hash: str
+    payload: bytes
+
+
+def framebuffer_hash(framebuffer: bytes) -> str:
+    return hashlib.blake2b(framebuffer, digest_size=8).hexdigest()
+
+
+def diff_windows(old: bytes, new: bytes, merge_gap: int = 8) -> list[Window]:
+    """Bounding windows of changed bytes.
+
+    Changed rows are grouped into bands; bands separated by fewer than `merge_gap`
+    unchanged rows are merged, since every window costs a command sequence on the
+    device. Each band's column range is the span of changed bytes within it.
+    """
+    diff = np.frombuffer(old, dtype=np.uint8) ^ np.frombuffer(new, dtype=np.uint8)
+    diff = diff.reshape(EPD_HEIGHT, ROW_BYTES)
+    changed_rows = np.flatnonzero(diff.any(axis=1))
+    if changed_rows.size == 0:
+        return []
+
+    breaks = np.flatnonzero(np.diff(changed_rows) > merge_gap)
+    starts = changed_rows[np.concatenate(([0], breaks + 1))]
+    ends = changed_rows[np.concatenate((breaks, [changed_rows.size - 1]))]
+
+    windows = []
+    for y_start, y_end in zip(starts.tolist(), ends.tolist(), strict=True):
+        changed_cols = np.flatnonzero(diff[y_start : y_end + 1].any(axis=0))
+        windows.append(Window(int(changed_cols[0]), int(changed_cols[-1]), y_start, y_end))
+    return windows
+
+
+def encode_windows(framebuffer: bytes, windows: list[Window]) -> bytes:
+    pixels = np.frombuffer(framebuffer, dtype=np.uint8).reshape(EPD_HEIGHT, ROW_BYTES)
+    parts = [bytes((len(windows),))]
+    for w in windows:
+        parts.append(WINDOW_HEADER.pack(w.x_start, w.x_end, w.y_start, w.y_end))
+        parts.append(pixels[w.y_start : w.y_end + 1, w.x_start : w.x_end + 1].tobytes())
+    return b"".join(parts)
+
+
+class RefreshPlanner:
+    """Decides between no-op, partial and full refresh per device.
+
+    Keeps the last `history_size` framebuffers by hash (to diff against what a device
+    shows) and counts consecutive partial refreshes per device: after
+    `max_partial_refreshes` the next update is forced full to clear ghosting.
+
+    Device ids come from the client, so the counts are an LRU of the `max_devices`
+    most recently seen devices. A device evicted from it starts counting from zero.
+    """
+
+    def __init__(
+        self, history_size: int = 64, max_partial_refreshes: int = 10, max_devices: int = 10_000
+    ) -> None:
+        self._history: OrderedDict[str, bytes] = OrderedDict()
+        self._history_size = history_size
+        self._max_partial = max_partial_refreshes
+        self._partial_counts: OrderedDict[str, int] = OrderedDict()
+        self._max_devices = max_devices
+
+    def remember(self, framebuffer: bytes) -> str:
+        digest = framebuffer_hash(framebuffer)
+        self._history[digest] = framebuffer
+        self._history.move_to_end(digest)
+        while len(self._history) > self._history_size:
+            self._history.popitem(last=False)
+        return digest
+
+    def plan(self, device_id: str, base_hash: str | None, framebuffer: bytes) -> RefreshPlan:
+        digest = self.remember(framebuffer)
+        if base_hash == digest:
+            return RefreshPlan(RefreshMode.NONE, digest, b"")
+
+        base = self._history.get(base_hash) if base_hash else None
+        partials = self._partial_counts.get(device_id, 0)
+        if base is not None and partials < self._max_partial:
+            payload = encode_windows(framebuffer, diff_windows(base, framebuffer))
+            # A patch close to the full buffer buys nothing over a clean full refresh.
+            if len(payload) < EPD_BUF_SIZE // 2:
+                self._count_partials(device_id, partials + 1)
+                return RefreshPlan(RefreshMode.PARTIAL, digest, payload)
+
+        self._count_partials(device_id, 0)
+        return RefreshPlan(RefreshMode.FULL, digest, framebuffer)
+
+    def _count_partials(self, device_id: str, partials: int) -> None:
+        self._partial_counts[device_id] = partials
+        self._partial_counts.move_to_end(device_id)
+        while len(self._partial_counts) > self._max_devices:
+            self._partial_counts.popitem(last=False)
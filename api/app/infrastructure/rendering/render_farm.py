@@ -0,0 +1,184 @@
+"""RenderFarm — renders screens in a process pool, off the asyncio event loop.
+
+Screen changes are submitted by a CommitSubscriber; device reads only ever look up
+the render cache (keyed by screen id + a hash of what is drawn) and get RenderStatus.RENDERING
+while a render is pending. Pending renders are coalesced per screen and sent to the
+pool in batches, split across workers, so a burst of edits costs one round-trip per
+worker instead of one per edit.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
+from uuid import UUID
+
+from app.domain.models.screen import Screen
+from app.domain.ports.screen_renderer import ScreenRenderer
+
+logger = logging.getLogger(__name__)
+
+RenderKey = tuple[UUID, str]
+
+
+class RenderStatus(StrEnum):
+    RENDERING = "rendering"
+
+
+def render_key(screen: Screen) -> RenderKey:
+    """Screen id + digest of the rendered fields.
+
+    Not updated_at: two edits within the timestamp resolution of the database
+    (a second on SQLite) would share a key and the second one would never render.
+    """
+    content = repr((str(screen.screen_type), screen.title, screen.content))
+    return screen.id, hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _render_batch(renderer: ScreenRenderer, screens: list[Screen]) -> list[tuple[bytes, float]]:
+    """Runs in a worker process: (framebuffer, seconds spent) per screen."""
+    results = []
+    for screen in screens:
+        started = time.perf_counter()
+        framebuffer = renderer.render(screen)
+        results.append((framebuffer, time.perf_counter() - started))
+    return results
+
+
+class RenderFarm:
+    def __init__(
+        self,
+        renderer: ScreenRenderer,
+        workers: int = 2,
+        batch_size: int = 16,
+        batch_delay: float = 0.05,
+        cache_size: int = 256,
+    ) -> None:
+        self._renderer = renderer
+        self._workers = workers
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+        self._cache_size = cache_size
+        self._cache: OrderedDict[RenderKey, bytes] = OrderedDict()
+        self._pending: dict[RenderKey, Screen] = {}
+        self._in_flight: set[RenderKey] = set()
+        self._wakeup = asyncio.Event()
+        self._executor: ProcessPoolExecutor | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._batch: asyncio.Task[None] | None = None
+        self.rendered = 0
+        self.failed = 0
+        self.batches = 0
+        self.render_seconds_total = 0.0
+        self.last_batch_seconds = 0.0
+
+    async def start(self) -> None:
+        # spawn, not fork: forking a process that runs an event loop and DB pool is unsafe.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._task = asyncio.create_task(self._run(), name="render-farm")
+
+    async def stop(self) -> None:
+        """Stop taking batches; the batch being rendered finishes and is cached."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._batch is not None:
+            await self._batch
+            self._batch = None
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+            self._executor = None
+
+    def submit(self, screen: Screen) -> None:
+        """Queue a render unless this screen version is cached or already queued."""
+        key = render_key(screen)
+        if key in self._cache or key in self._in_flight:
+            return
+        self._pending[key] = screen
+        self._wakeup.set()
+
+    def get(self, screen: Screen) -> bytes | RenderStatus:
+        """Rendered buffer for this screen version; queues the render on a miss."""
+        key = render_key(screen)
+        framebuffer = self._cache.get(key)
+        if framebuffer is not None:
+            self._cache.move_to_end(key)
+            return framebuffer
+        self.submit(screen)
+        return RenderStatus.RENDERING
+
+    def stats(self) -> dict[str, int | float]:
+        avg_seconds = self.render_seconds_total / self.rendered if self.rendered else 0.0
+        return {
+            "queue_depth": len(self._pending),
+            "in_flight": len(self._in_flight),
+            "cached": len(self._cache),
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "batches": self.batches,
+            "render_seconds_total": self.render_seconds_total,
+            "avg_render_ms": 1000 * avg_seconds,
+            "last_batch_ms": 1000 * self.last_batch_seconds,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Let a burst of edits land in the same batch.
+            await asyncio.sleep(self._batch_delay)
+            self._wakeup.clear()
+            batch = self._take_batch()
+            if self._pending:
+                self._wakeup.set()
+            if batch:
+                # Shielded: stop() cancels this loop, then waits for the batch.
+                self._batch = asyncio.create_task(self._render(batch))
+                await asyncio.shield(self._batch)
+                self._batch = None
+
+    def _take_batch(self) -> list[Screen]:
+        batch = []
+        for key in list(self._pending)[: self._batch_size]:
+            batch.append(self._pending.pop(key))
+            self._in_flight.add(key)
+        return batch
+
+    async def _render(self, batch: list[Screen]) -> None:
+        loop = asyncio.get_running_loop()
+        chunk = -(-len(batch) // self._workers)
+        chunks = [batch[i : i + chunk] for i in range(0, len(batch), chunk)]
+        started = time.perf_counter()
+        futures = [
+            loop.run_in_executor(self._executor, _render_batch, self._renderer, screens)
+            for screens in chunks
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        self.last_batch_seconds = time.perf_counter() - started
+        self.batches += 1
+
+        for screens, result in zip(chunks, results, strict=True):
+            keys = [render_key(s) for s in screens]
+            self._in_flight.difference_update(keys)
+            if isinstance(result, BaseException):
+                self.failed += len(screens)
+                logger.error("Render batch failed", exc_info=result)
+                continue
+            for key, (framebuffer, seconds) in zip(keys, result, strict=True):
+                self._store(key, framebuffer)
+                self.rendered += 1
+                self.render_seconds_total += seconds
+
+    def _store(self, key: RenderKey, framebuffer: bytes) -> None:
+        self._cache[key] = framebuffer
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
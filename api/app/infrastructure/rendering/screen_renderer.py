@@ -0,0 +1,60 @@
+"""Outbound adapter: renders a Screen into the packed SSD1681 framebuffer.
+
+Layout (200x200):
+    border, title (scale 2, centred), separator, content (scale 1, word-wrapped).
+Renders are memoized by content, so a screen is rasterized once per version; word
+wrapping is memoized separately in text_layout.wrap().
+"""
+
+import functools
+import unicodedata
+
+from app.domain.models.screen import Screen
+from app.domain.ports.screen_renderer import ScreenRenderer
+from app.infrastructure.rendering.font import FONT_WIDTH
+from app.infrastructure.rendering.framebuffer import (
+    EPD_BLACK,
+    EPD_HEIGHT,
+    EPD_WIDTH,
+    Framebuffer,
+    string_height,
+    string_width,
+)
+from app.infrastructure.rendering.text_layout import DEFAULT_FONT, text_block, wrap
+
+MARGIN = 8
+TITLE_SCALE = 2
+TITLE_Y = 8
+SEPARATOR_Y = TITLE_Y + string_height(TITLE_SCALE) + 4
+CONTENT_Y = SEPARATOR_Y + 6
+LINE_HEIGHT = string_height() + 2
+CONTENT_WIDTH = EPD_WIDTH - 2 * MARGIN
+CONTENT_ROWS = (EPD_HEIGHT - MARGIN - CONTENT_Y + 2) // LINE_HEIGHT
+TITLE_COLUMNS = (EPD_WIDTH - 2 * MARGIN + TITLE_SCALE) // ((FONT_WIDTH + 1) * TITLE_SCALE)
+
+
+def to_panel_text(text: str) -> str:
+    """Fold diacritics (ą -> a) so fewer characters end up as the font's '?'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@functools.lru_cache(maxsize=256)
+def render_text_screen(title: str, content: str) -> bytes:
+    fb = Framebuffer()
+    fb.draw_rect(2, 2, EPD_WIDTH - 4, EPD_HEIGHT - 4, EPD_BLACK)
+
+    title = to_panel_text(title)[:TITLE_COLUMNS]
+    x = (EPD_WIDTH - string_width(title, TITLE_SCALE)) // 2
+    fb.draw_string(x, TITLE_Y, title, EPD_BLACK, TITLE_SCALE)
+    fb.fill_rect(MARGIN, SEPARATOR_Y, EPD_WIDTH - 2 * MARGIN, 1, EPD_BLACK)
+
+    lines = wrap(to_panel_text(content), DEFAULT_FONT, CONTENT_WIDTH)[:CONTENT_ROWS]
+    fb.blit(MARGIN, CONTENT_Y, text_block(lines, LINE_HEIGHT), EPD_BLACK)
+
+    return fb.pack()
+
+
+class FramebufferScreenRenderer(ScreenRenderer):
+    def render(self, screen: Screen) -> bytes:
+        return render_text_screen(screen.title, screen.content)
@@ -0,0 +1,99 @@
+"""Text layout — glyph atlas, memoized word wrap and whole-line rasterization.
+
+The font table is unpacked once into a NumPy atlas (glyph, row, col) whose glyphs
+already carry the 1-pixel spacing column. A line of text is then a single fancy-index
++ reshape (no per-pixel or per-glyph loop), and a block of lines is stacked into one
+mask so a whole screen of text is blitted with one slice assignment.
+"""
+
+import functools
+import textwrap
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.infrastructure.rendering.font import (
+    FIRST_CHAR,
+    FONT_5X7,
+    FONT_HEIGHT,
+    FONT_WIDTH,
+    LAST_CHAR,
+)
+
+
+@dataclass(frozen=True)
+class Font:
+    name: str
+    glyph_width: int
+    glyph_height: int
+
+    @property
+    def advance(self) -> int:
+        """Horizontal step per character at scale 1 (glyph + 1 spacing column)."""
+        return self.glyph_width + 1
+
+
+DEFAULT_FONT = Font("5x7", FONT_WIDTH, FONT_HEIGHT)
+
+
+class GlyphAtlas:
+    def __init__(self, font: Font, table: tuple[bytes, ...]) -> None:
+        self.font = font
+        columns = np.frombuffer(b"".join(table), dtype=np.uint8).reshape(-1, font.glyph_width)
+        rows = np.arange(font.glyph_height, dtype=np.uint8)
+        glyphs = ((columns[:, None, :] >> rows[None, :, None]) & 1).astype(bool)
+        # Append the blank spacing column: every glyph is `advance` columns wide.
+        self._scaled = {1: np.pad(glyphs, ((0, 0), (0, 0), (0, 1)))}
+
+    def glyphs(self, scale: int = 1) -> np.ndarray:
+        """(glyph, row, col) atlas at `scale`, including the spacing column."""
+        atlas = self._scaled.get(scale)
+        if atlas is None:
+            atlas = self._scaled[1].repeat(scale, axis=1).repeat(scale, axis=2)
+            self._scaled[scale] = atlas
+        return atlas
+
+    def line(self, text: str, scale: int = 1) -> np.ndarray:
+        """Mask (height, width) of `text` with epd_gfx.c metrics; unknown chars -> '?'."""
+        glyphs = self.glyphs(scale)[glyph_indices(text)]
+        count, height, advance = glyphs.shape
+        line = glyphs.transpose(1, 0, 2).reshape(height, count * advance)
+        return line[:, : max(count * advance - scale, 0)]
+
+
+def glyph_indices(text: str) -> np.ndarray:
+    codes = np.frombuffer(text.encode("ascii", errors="replace"), dtype=np.uint8)
+    codes = np.where((codes < FIRST_CHAR) | (codes > LAST_CHAR), ord("?"), codes)
+    return codes - FIRST_CHAR
+
+
+ATLAS = GlyphAtlas(DEFAULT_FONT, FONT_5X7)
+
+
+@functools.lru_cache(maxsize=4096)
+def wrap(text: str, font: Font, width: int, scale: int = 1) -> tuple[str, ...]:
+    """Greedy word wrap of `text` into lines at most `width` pixels wide.
+
+    Paragraphs (newlines) are kept; empty paragraphs become empty lines.
+    """
+    columns = max((width + scale) // (font.advance * scale), 1)
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        lines.extend(textwrap.wrap(paragraph, width=columns) or [""])
+    return tuple(lines)
+
+
+def text_block(lines: tuple[str, ...], line_height: int, scale: int = 1) -> np.ndarray:
+    """Single mask holding `lines` stacked every `line_height` pixels.
+
+    Lines are space-padded to equal length so the whole block is one atlas lookup.
+    """
+    columns = max((len(line) for line in lines), default=0)
+    if columns == 0:
+        return np.zeros((0, 0), dtype=bool)
+    indices = glyph_indices("".join(line.ljust(columns) for line in lines))
+    glyphs = ATLAS.glyphs(scale)[indices.reshape(len(lines), columns)]
+    rows, _, glyph_height, advance = glyphs.shape
+    block = np.zeros((rows, max(line_height, glyph_height), columns * advance), dtype=bool)
+    block[:, :glyph_height] = glyphs.transpose(0, 2, 1, 3).reshape(rows, glyph_height, -1)
+    return block.reshape(-1, columns * advance)
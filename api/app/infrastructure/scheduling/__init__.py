@@ -0,0 +1,4 @@
+from app.infrastructure.scheduling.alarm_scheduler import AlarmScheduler, ScheduledAlarm
+from app.infrastructure.scheduling.wake_index import WakeIndex
+
+__all__ = ["AlarmScheduler", "ScheduledAlarm", "WakeIndex"]
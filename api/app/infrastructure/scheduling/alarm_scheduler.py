@@ -0,0 +1,198 @@
+"""AlarmScheduler — in-process min-heap of the next occurrence of every active alarm.
+
+Creating, updating or deleting an alarm is O(log n): the new occurrence is pushed and
+the old heap entry simply goes stale (an entry is live only while it matches
+_next_fire). The run loop sleeps until the heap top comes due, or until an earlier
+alarm is scheduled, and then calls `on_due`. That reads the due alarms with due(),
+records the firing and, once it has committed, calls advance() per alarm: repeating
+alarms are rescheduled, one-shot alarms drop out of the heap. A firing that fails to
+commit leaves the schedule as it was, so the same occurrences come due again.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from itertools import islice, takewhile
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from app.domain.models.alarm import Alarm
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on one sleep of the run loop, so clock jumps are picked up eventually.
+MAX_IDLE_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class ScheduledAlarm:
+    alarm: Alarm
+    fires_at: datetime  # aware, UTC
+
+
+class AlarmScheduler:
+    def __init__(self, tz: str = "UTC") -> None:
+        self._tz = ZoneInfo(tz)
+        self._alarms: dict[UUID, Alarm] = {}
+        self._next_fire: dict[UUID, datetime] = {}
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.fired = 0
+
+    async def start(self, on_due: Callable[[], Awaitable[object]]) -> None:
+        """Call `on_due` (which should call due()) whenever an alarm comes due."""
+        self._task = asyncio.create_task(self._run(on_due), name="alarm-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def load(self, alarms: Iterable[Alarm], now: datetime | None = None) -> list[Alarm]:
+        """Replace the schedule; occurrences missed while the process was down are skipped.
+
+        A stored `next_fire_at` still in the future is used as is. Returns the alarms
+        whose `next_fire_at` had to be recomputed, so the caller can persist it.
+        """
+        now = now or datetime.now(UTC)
+        self._alarms.clear()
+        self._next_fire.clear()
+        self._heap.clear()
+        recomputed = []
+        for alarm in alarms:
+            self._alarms[alarm.id] = alarm
+            stored = alarm.next_fire_at.replace(tzinfo=UTC) if alarm.next_fire_at else None
+            if stored is not None and stored > now:
+                at: datetime | None = stored
+                self._next_fire[alarm.id] = stored
+            else:
+                at = self._schedule(alarm, now)
+                recomputed.append(alarm)
+            if at is not None:
+                self._heap.append((at, alarm.id))
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+        return recomputed
+
+    def set(self, alarm: Alarm) -> None:
+        """Schedule (or reschedule) `alarm` from its current definition."""
+        self._alarms[alarm.id] = alarm
+        previous = self._next_fire.get(alarm.id)
+        at = self._schedule(alarm, datetime.now(UTC))
+        if at is not None and at != previous:
+            heapq.heappush(self._heap, (at, alarm.id))
+            if self._heap[0][1] == alarm.id:
+                self._wakeup.set()
+        self._compact()
+
+    def remove(self, alarm_id: UUID) -> None:
+        self._alarms.pop(alarm_id, None)
+        self._next_fire.pop(alarm_id, None)
+        self._compact()
+
+    def peek(self) -> datetime | None:
+        """Earliest scheduled occurrence (aware UTC), possibly already due."""
+        while self._heap:
+            at, alarm_id = self._heap[0]
+            if self._next_fire.get(alarm_id) == at:
+                return at
+            heapq.heappop(self._heap)
+        return None
+
+    def due(self, now: datetime | None = None) -> list[ScheduledAlarm]:
+        """Every occurrence at or before `now`, in firing order; the heap is not changed."""
+        now = now or datetime.now(UTC)
+        return list(takewhile(lambda scheduled: scheduled.fires_at <= now, self._in_order()))
+
+    def next_fire_at(self, alarm: Alarm, now: datetime) -> datetime | None:
+        """`alarm.next_fire_at` (naive UTC) once its occurrence due at `now` has fired.
+
+        From `now`, not from the occurrence: a late loop fires each alarm once, not
+        once per missed occurrence.
+        """
+        return replace(alarm).reschedule(now, self._tz)
+
+    def advance(self, alarm_id: UUID, now: datetime | None = None) -> None:
+        """The due occurrence of `alarm_id` fired and was committed: schedule the next.
+
+        No-op unless the alarm's scheduled occurrence is still due, e.g. when it was
+        edited or deleted in the meantime.
+        """
+        now = now or datetime.now(UTC)
+        at = self._next_fire.get(alarm_id)
+        if at is None or at > now:
+            return
+        next_at = self._schedule(self._alarms[alarm_id], now)
+        if next_at is not None:
+            heapq.heappush(self._heap, (next_at, alarm_id))
+        self.fired += 1
+
+    def upcoming(self, limit: int) -> list[ScheduledAlarm]:
+        """The `limit` earliest occurrences, in firing order, without popping the heap."""
+        return list(islice(self._in_order(), limit))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "alarms": len(self._alarms),
+            "scheduled": len(self._next_fire),
+            "heap": len(self._heap),
+            "fired": self.fired,
+        }
+
+    async def _run(self, on_due: Callable[[], Awaitable[object]]) -> None:
+        while True:
+            self._wakeup.clear()
+            at = self.peek()
+            if at is not None and at <= datetime.now(UTC):
+                try:
+                    await on_due()
+                except Exception:
+                    logger.exception("Alarm scheduler tick failed")
+                if self.peek() == at:
+                    # Nothing advanced (the firing failed to commit): retry shortly.
+                    await asyncio.sleep(1.0)
+                continue
+            timeout = MAX_IDLE_SECONDS
+            if at is not None:
+                timeout = min((at - datetime.now(UTC)).total_seconds(), timeout)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), max(timeout, 0.0))
+
+    def _in_order(self) -> Iterator[ScheduledAlarm]:
+        """Live entries in firing order, without popping the heap.
+
+        Walks the heap as a tree with a small frontier heap: O(k log k) for k entries
+        visited, instead of sorting all n alarms.
+        """
+        heap = self._heap
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            (at, alarm_id), index = heapq.heappop(frontier)
+            if self._next_fire.get(alarm_id) == at:
+                yield ScheduledAlarm(self._alarms[alarm_id], at)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def _schedule(self, alarm: Alarm, after: datetime) -> datetime | None:
+        """Advance `alarm.next_fire_at` past `after`; the caller adds the heap entry."""
+        next_fire_at = alarm.reschedule(after, self._tz)
+        if next_fire_at is None:
+            self._next_fire.pop(alarm.id, None)
+            return None
+        at = next_fire_at.replace(tzinfo=UTC)
+        self._next_fire[alarm.id] = at
+        return at
+
+    def _compact(self) -> None:
+        # Stale entries are dropped lazily at the top; rebuild when they dominate.
+        if len(self._heap) > 2 * len(self._next_fire) + 1024:
+            self._heap = [(at, alarm_id) for alarm_id, at in self._next_fire.items()]
+            heapq.heapify(self._heap)
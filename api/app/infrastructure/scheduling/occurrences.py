@@ -0,0 +1,156 @@
+"""Alarm occurrence expansion for calendar views — the whole alarm set in one NumPy pass.
+
+Active alarms are packed once into columns ordered by time of day, plus — per
+weekday — the indices of the alarms that fire on it. Expanding a range is then one
+concatenation of those per-weekday arrays, wall-clock to UTC conversion through a
+per-local-hour offset table (so DST days are exact) and a range filter; nothing
+loops per alarm. The result is already in order except around DST changes and for
+one-shot alarms, so the final stable sort is close to linear.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta, tzinfo
+from uuid import UUID
+
+import numpy as np
+
+from app.domain.models.alarm import Alarm, AlarmStatus
+
+DAY = 86400
+NO_FIRE = np.iinfo(np.int64).min
+
+
+def _unix(at: datetime) -> int:
+    """Naive datetimes are UTC, as stored."""
+    return int((at if at.tzinfo else at.replace(tzinfo=UTC)).timestamp())
+
+
+def _seconds_of_day(at: time) -> int:
+    return at.hour * 3600 + at.minute * 60 + at.second
+
+
+def _utcoffset(at: datetime) -> int:
+    return int(at.utcoffset().total_seconds())  # type: ignore[union-attr]
+
+
+@dataclass(frozen=True)
+class AlarmTable:
+    """Columns of the active alarms, ordered by trigger time of day."""
+
+    alarm_ids: list[UUID]
+    names: list[str]
+    trigger_seconds: np.ndarray  # int64, seconds after local midnight
+    weekday_mask: np.ndarray  # uint8, bit d set = fires on weekday d (0 = Monday)
+    fire_once_at: np.ndarray  # int64 unix seconds of a one-shot's next_fire_at, else NO_FIRE
+    by_weekday: tuple[np.ndarray, ...]  # alarm indices firing on weekday 0..6, in time order
+
+    @classmethod
+    def from_alarms(cls, alarms: list[Alarm]) -> "AlarmTable":
+        active = sorted(
+            (a for a in alarms if a.status is AlarmStatus.ACTIVE), key=lambda a: a.trigger_time
+        )
+        masks = np.array(
+            [sum(1 << d for d in set(a.repeat_days) if 0 <= d <= 6) for a in active],
+            dtype=np.uint8,
+        )
+        return cls(
+            alarm_ids=[a.id for a in active],
+            names=[a.name for a in active],
+            trigger_seconds=np.array(
+                [_seconds_of_day(a.trigger_time) for a in active], dtype=np.int64
+            ),
+            weekday_mask=masks,
+            fire_once_at=np.array(
+                [
+                    _unix(a.next_fire_at) if not a.repeat_days and a.next_fire_at else NO_FIRE
+                    for a in active
+                ],
+                dtype=np.int64,
+            ),
+            by_weekday=tuple(np.flatnonzero((masks >> d) & 1) for d in range(7)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.alarm_ids)
+
+
+@dataclass(frozen=True)
+class Occurrences:
+    """Occurrences sorted by time: alarm_index[i] (into the AlarmTable) fires at at[i]."""
+
+    table: AlarmTable
+    alarm_index: np.ndarray  # int64
+    at: np.ndarray  # int64 unix seconds
+
+    def __len__(self) -> int:
+        return int(self.at.size)
+
+    def ndjson(self, chunk_size: int = 4096) -> Iterator[bytes]:
+        """`{"alarm_id", "name", "at"}` per line, `chunk_size` lines per yielded block.
+
+        The per-alarm JSON prefix is encoded once; timestamps are formatted vectorized.
+        """
+        prefixes = [
+            f'{{"alarm_id":"{alarm_id}","name":{json.dumps(name)},"at":"'
+            for alarm_id, name in zip(self.table.alarm_ids, self.table.names, strict=True)
+        ]
+        for offset in range(0, len(self), chunk_size):
+            index = self.alarm_index[offset : offset + chunk_size].tolist()
+            stamps = np.datetime_as_string(
+                self.at[offset : offset + chunk_size].astype("datetime64[s]")
+            ).tolist()
+            yield "".join(
+                f'{prefixes[i]}{stamp}Z"}}\n' for i, stamp in zip(index, stamps, strict=True)
+            ).encode()
+
+
+def _hourly_offsets(first_day: date, days: int, tz: tzinfo) -> np.ndarray:
+    """UTC offset in seconds of every local wall-clock hour from `first_day` on.
+
+    Only days whose offset changes between midnight and the next midnight are resolved
+    hour by hour; every other day is a single zoneinfo lookup.
+    """
+    midnights = [
+        datetime.combine(first_day + timedelta(days=d), time(), tz) for d in range(days + 1)
+    ]
+    day_offsets = [_utcoffset(m) for m in midnights]
+    offsets = np.repeat(np.array(day_offsets[:-1], dtype=np.int64), 24)
+    for d in range(days):
+        if day_offsets[d] != day_offsets[d + 1]:
+            for hour in range(24):
+                # Wall-clock arithmetic: same tzinfo, so this is local midnight + hour.
+                offsets[d * 24 + hour] = _utcoffset(midnights[d] + timedelta(hours=hour))
+    return offsets
+
+
+def expand(table: AlarmTable, start: datetime, end: datetime, tz: tzinfo) -> Occurrences:
+    """Every occurrence with start <= at < end (naive UTC or aware), sorted by time.
+
+    Wall-clock semantics match Alarm.next_occurrence: `trigger_time` is local time in
+    `tz`; repeating alarms fire on their weekdays, one-shots at their next_fire_at.
+    """
+    start_ts, end_ts = _unix(start), _unix(end)
+    # One spare local day on each side covers any UTC offset.
+    first_day = datetime.fromtimestamp(start_ts, tz).date() - timedelta(days=1)
+    days = (datetime.fromtimestamp(end_ts, tz).date() - first_day).days + 2
+    first_local = datetime.combine(first_day, time(), UTC)
+    local_midnights = int(first_local.timestamp()) + DAY * np.arange(days, dtype=np.int64)
+    weekdays = (first_day.weekday() + np.arange(days)) % 7
+
+    # Day by day, each day's alarms in time-of-day order.
+    alarm_index = np.concatenate([table.by_weekday[w] for w in weekdays])
+    counts = np.array([table.by_weekday[w].size for w in weekdays])
+    local = np.repeat(local_midnights, counts) + table.trigger_seconds[alarm_index]
+    offsets = _hourly_offsets(first_day, days, tz)
+    at = local - offsets[(local - local_midnights[0]) // 3600]
+
+    once = np.flatnonzero(table.fire_once_at != NO_FIRE)
+    alarm_index = np.concatenate([alarm_index.astype(np.int64), once])
+    at = np.concatenate([at, table.fire_once_at[once]])
+
+    order = np.argsort(at, kind="stable")
+    alarm_index, at = alarm_index[order], at[order]
+    first, last = np.searchsorted(at, [start_ts, end_ts])
+    return Occurrences(table, alarm_index[first:last], at[first:last])
@@ -0,0 +1,59 @@
+"""WakeIndex — precomputed "when could anything change next" for sleeping devices.
+
+Devices wake on a fixed cycle. next_wake_at() tells them how long they may sleep:
+until shortly before the next alarm occurrence, the next playlist rotation, or a
+short interval while screens are being edited. It reads a heap top and a few fields,
+so it can run on every device request. Alarm occurrences come from the
+AlarmScheduler heap; the screen side is kept current by subscribers of screen events.
+"""
+
+import math
+from datetime import UTC, datetime, timedelta
+
+from app.infrastructure.scheduling.alarm_scheduler import AlarmScheduler
+
+
+class WakeIndex:
+    def __init__(
+        self,
+        alarm_scheduler: AlarmScheduler,
+        min_sleep: float = 60.0,
+        max_sleep: float = 6 * 3600.0,
+        alarm_lead: float = 30.0,
+        active_window: float = 600.0,
+        playlist_dwell: float = 300.0,
+    ) -> None:
+        self._alarm_scheduler = alarm_scheduler
+        self._min_sleep = timedelta(seconds=min_sleep)
+        self._max_sleep = timedelta(seconds=max_sleep)
+        self._alarm_lead = timedelta(seconds=alarm_lead)
+        self._active_window = timedelta(seconds=active_window)
+        self._playlist_dwell = playlist_dwell
+        self._active_screens = 0
+        self._last_edit: datetime | None = None
+
+    def load(self, active_screens: int) -> None:
+        self._active_screens = active_screens
+
+    def screens_changed(self, active_screens: int) -> None:
+        self._active_screens = active_screens
+        self._last_edit = datetime.now(UTC)
+
+    def next_wake_at(self, now: datetime | None = None) -> datetime:
+        """Aware UTC time by which the device should next check in."""
+        now = now or datetime.now(UTC)
+        candidates = [now + self._max_sleep]
+        alarm_at = self._alarm_scheduler.peek()
+        if alarm_at is not None:
+            candidates.append(alarm_at - self._alarm_lead)
+        if self._active_screens > 1:
+            dwell = self._playlist_dwell
+            candidates.append(
+                datetime.fromtimestamp(math.floor(now.timestamp() / dwell + 1) * dwell, UTC)
+            )
+        if self._last_edit is not None and now - self._last_edit < self._active_window:
+            candidates.append(now)
+        return max(min(candidates), now + self._min_sleep).astimezone(UTC)
+
+    def stats(self) -> dict[str, int]:
+        return {"active_screens": self._active_screens}
@@ -0,0 +1,5 @@
+from app.infrastructure.streaming.change import Change
+from app.infrastructure.streaming.change_feed import ChangeFeed, ChangeFeedClient
+from app.infrastructure.streaming.topic_hub import HubConnection, TopicHub
+
+__all__ = ["Change", "ChangeFeed", "ChangeFeedClient", "HubConnection", "TopicHub"]
@@ -0,0 +1,32 @@
+"""Change — a committed domain event as pushed to live clients.
+
+The wire payload is encoded once per change and shared by every connection that
+receives it, however many clients are listening.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Change:
+    type: str  # e.g. "screen.updated"
+    topic: str  # "screens", "alarms" or "device:<device_id>"
+    id: str  # id of the changed entity
+    occurred_on: datetime
+    payload: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        body = {
+            "type": self.type,
+            "topic": self.topic,
+            "id": self.id,
+            "occurred_on": self.occurred_on.isoformat(),
+        }
+        object.__setattr__(self, "payload", json.dumps(body, separators=(",", ":")).encode())
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Coalescing key: a newer change with the same key supersedes an unsent one."""
+        return self.type, self.id
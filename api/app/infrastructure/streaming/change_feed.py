@@ -0,0 +1,104 @@
+"""ChangeFeed — fan-out of committed changes to Server-Sent Events clients.
+
+Every client owns a bounded buffer. A change whose key (type + entity id) is still
+buffered is replaced and moves to the back of the queue, so a slow client sees the
+latest state once instead of every intermediate edit. Moving it keeps an entity's
+last change last: device.offline, .online, .offline still ends with .offline.
+When the buffer is full anyway the oldest change is dropped and the client is sent
+a `resync` event telling it to refetch.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from app.infrastructure.streaming.change import Change
+
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+def sse_frame(seq: int, change: Change) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (seq, change.type.encode(), change.payload)
+
+
+class ChangeFeedClient:
+    def __init__(self, topics: frozenset[str] | None, maxsize: int) -> None:
+        self.topics = topics
+        self._maxsize = maxsize
+        self._buffer: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._lost = False
+        self.coalesced = 0
+        self.dropped = 0
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def wants(self, change: Change) -> bool:
+        return self.topics is None or change.topic in self.topics
+
+    def put(self, change: Change, frame: bytes) -> None:
+        if change.key in self._buffer:
+            self._buffer[change.key] = frame
+            self._buffer.move_to_end(change.key)
+            self.coalesced += 1
+        else:
+            if len(self._buffer) >= self._maxsize:
+                self._buffer.popitem(last=False)
+                self.dropped += 1
+                self._lost = True
+            self._buffer[change.key] = frame
+        self._wakeup.set()
+
+    async def next_frame(self, timeout: float) -> bytes:
+        """Next frame to write; a heartbeat comment if nothing happened in `timeout`."""
+        if not self._buffer and not self._lost:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                return HEARTBEAT_FRAME
+        if self._lost:
+            # The client missed changes: make it refetch, then continue from here.
+            self._lost = False
+            self._buffer.clear()
+            return RESYNC_FRAME
+        _, frame = self._buffer.popitem(last=False)
+        return frame
+
+
+class ChangeFeed:
+    def __init__(self, client_buffer_size: int = 256) -> None:
+        self._client_buffer_size = client_buffer_size
+        self._clients: set[ChangeFeedClient] = set()
+        self._seq = 0
+        self.published = 0
+
+    def connect(self, topics: Iterable[str] | None = None) -> ChangeFeedClient:
+        """Register a client for `topics` (all topics when empty)."""
+        wanted = frozenset(t.strip() for t in topics or () if t.strip())
+        client = ChangeFeedClient(wanted or None, self._client_buffer_size)
+        self._clients.add(client)
+        return client
+
+    def disconnect(self, client: ChangeFeedClient) -> None:
+        self._clients.discard(client)
+
+    def publish(self, change: Change) -> None:
+        self._seq += 1
+        self.published += 1
+        frame = sse_frame(self._seq, change)
+        for client in self._clients:
+            if client.wants(change):
+                client.put(change, frame)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "clients": len(self._clients),
+            "published": self.published,
+            "buffered": sum(c.buffered for c in self._clients),
+            "coalesced": sum(c.coalesced for c in self._clients),
+            "dropped": sum(c.dropped for c in self._clients),
+        }
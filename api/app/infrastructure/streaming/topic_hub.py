@@ -0,0 +1,110 @@
+"""TopicHub — WebSocket fan-out of committed changes by topic.
+
+Connections subscribe to topics ("screens", "alarms", "device:<id>"). A change is
+serialized once and the same frame object is appended to the send buffer of every
+subscriber of its topic; nothing is encoded per connection.
+
+Each connection is drained by its own writer. If a client reads slower than changes
+arrive, its buffer grows past `high_water` bytes and the hub closes the connection
+instead of buffering without bound; the client reconnects and refetches.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+
+from app.infrastructure.streaming.change import Change
+
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "try again later"
+
+
+class HubConnection:
+    def __init__(self, high_water: int) -> None:
+        self.topics: set[str] = set()
+        self._high_water = high_water
+        self._frames: deque[str] = deque()
+        self._buffered = 0
+        self._wakeup = asyncio.Event()
+        self.overflowed = False
+
+    @property
+    def buffered(self) -> int:
+        return self._buffered
+
+    def send(self, frame: str) -> bool:
+        """Buffer `frame`; False (and the connection marked overflowed) past high water."""
+        if self.overflowed:
+            return False
+        self._frames.append(frame)
+        self._buffered += len(frame)
+        if self._buffered > self._high_water:
+            self.overflowed = True
+            self._frames.clear()
+            self._buffered = 0
+        self._wakeup.set()
+        return not self.overflowed
+
+    async def drain(self) -> list[str]:
+        """Wait for and take everything buffered; empty list once overflowed."""
+        while not self._frames and not self.overflowed:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        frames = list(self._frames)
+        self._frames.clear()
+        self._buffered = 0
+        return frames
+
+
+class TopicHub:
+    def __init__(self, high_water: int = 256 * 1024) -> None:
+        self._high_water = high_water
+        self._topics: dict[str, set[HubConnection]] = {}
+        self._connections: set[HubConnection] = set()
+        self.published = 0
+        self.delivered = 0
+        self.slow_disconnects = 0
+
+    def connect(self) -> HubConnection:
+        connection = HubConnection(self._high_water)
+        self._connections.add(connection)
+        return connection
+
+    def disconnect(self, connection: HubConnection) -> None:
+        self.unsubscribe(connection, list(connection.topics))
+        self._connections.discard(connection)
+
+    def subscribe(self, connection: HubConnection, topics: Iterable[str]) -> None:
+        for topic in topics:
+            connection.topics.add(topic)
+            self._topics.setdefault(topic, set()).add(connection)
+
+    def unsubscribe(self, connection: HubConnection, topics: Iterable[str]) -> None:
+        for topic in topics:
+            connection.topics.discard(topic)
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self._topics[topic]
+
+    def publish(self, change: Change) -> None:
+        subscribers = self._topics.get(change.topic)
+        self.published += 1
+        if not subscribers:
+            return
+        frame = change.payload.decode()
+        overflowed = [c for c in subscribers if not c.send(frame)]
+        self.delivered += len(subscribers) - len(overflowed)
+        for connection in overflowed:
+            # The writer closes the socket; stop feeding it right away.
+            self.disconnect(connection)
+            self.slow_disconnects += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": len(self._connections),
+            "topics": len(self._topics),
+            "published": self.published,
+            "delivered": self.delivered,
+            "slow_disconnects": self.slow_disconnects,
+        }
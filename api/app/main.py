@@ -4,52 +4,221 @@ prepare() — initializes IoC container and registers event subscribers.
 create_app() — builds and returns the FastAPI application.
 """
 
-from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
-from app.adapters.inbound.api.routers import alarms, device, screens
-from app.application.subscribers.device_subscribers import LogHeartbeatSubscriber
-from app.application.subscribers.screen_subscribers import LogScreenCreatedSubscriber
-from app.domain.events.device import DeviceHeartbeatReceivedEvent
-from app.domain.events.screen import ScreenCreatedEvent
-from app.infrastructure.container import init_container
-from app.infrastructure.persistence.database import async_session_factory, engine
+from app.adapters.inbound.api.middleware import ClientMiddleware
+from app.adapters.inbound.api.routers import alarms, bulk, device, events, screens
+from app.adapters.inbound.api.schemas.common import utc_isoformat
+from app.application.commands.alarm_commands import (
+    FireDueAlarmsCommand,
+    LoadAlarmSchedulerCommand,
+)
+from app.application.commands.device_commands import (
+    ExpireOfflineDevicesCommand,
+    LoadFleetRegistryCommand,
+)
+from app.application.commands.screen_commands import LoadWakeIndexCommand
+from app.application.subscribers.alarm_subscribers import (
+    AdvanceAlarmScheduleSubscriber,
+    LogAlarmTriggeredSubscriber,
+    RefreshAlarmScheduleSubscriber,
+    ReloadAlarmScheduleSubscriber,
+)
+from app.application.subscribers.change_feed_subscribers import (
+    PublishAlarmCreatedSubscriber,
+    PublishAlarmTriggeredSubscriber,
+    PublishDeviceOfflineSubscriber,
+    PublishDeviceOnlineSubscriber,
+    PublishHeartbeatSubscriber,
+    PublishScreenCreatedSubscriber,
+    PublishScreenDeletedSubscriber,
+    PublishScreenUpdatedSubscriber,
+)
+from app.application.subscribers.device_subscribers import (
+    LogHeartbeatSubscriber,
+    RecordTelemetrySubscriber,
+    ReloadFleetRegistrySubscriber,
+    TrackHeartbeatSubscriber,
+)
+from app.application.subscribers.screen_subscribers import (
+    BumpScreensVersionSubscriber,
+    LogScreenCreatedSubscriber,
+    RefreshWakeScreensSubscriber,
+    ScheduleScreenRenderSubscriber,
+)
+from app.domain.events.alarm import (
+    AlarmCreatedEvent,
+    AlarmDeletedEvent,
+    AlarmsImportedEvent,
+    AlarmTriggeredEvent,
+    AlarmUpdatedEvent,
+)
+from app.domain.events.device import (
+    DeviceHeartbeatReceivedEvent,
+    DeviceOfflineEvent,
+    DeviceOnlineEvent,
+    DevicesImportedEvent,
+)
+from app.domain.events.screen import (
+    ScreenCreatedEvent,
+    ScreenDeletedEvent,
+    ScreensImportedEvent,
+    ScreenUpdatedEvent,
+)
+from app.infrastructure.command_bus import SimpleCommandBus
+from app.infrastructure.container import get_container, init_container
+from app.infrastructure.persistence.database import (
+    async_session_factory,
+    engine,
+    read_engine,
+    read_router,
+)
 from app.infrastructure.persistence.repositories import (
     SqlAlarmRepository,
     SqlDeviceRepository,
     SqlScreenRepository,
+    SqlTelemetryRepository,
 )
+from app.infrastructure.rendering import FramebufferScreenRenderer
 
 
 def prepare() -> None:
     """Initialize IoC container and register event subscribers."""
     container = init_container(
         session_factory=async_session_factory,
+        read_router=read_router,
         screen_repo_cls=SqlScreenRepository,
         alarm_repo_cls=SqlAlarmRepository,
         device_repo_cls=SqlDeviceRepository,
+        telemetry_repo_cls=SqlTelemetryRepository,
+        screen_renderer=FramebufferScreenRenderer(),
     )
 
     event_bus = container.event_bus
 
     event_bus.subscribe(
         event=ScreenCreatedEvent,
-        subscribers=[LogScreenCreatedSubscriber],
+        subscribers=[
+            LogScreenCreatedSubscriber,
+            BumpScreensVersionSubscriber,
+            ScheduleScreenRenderSubscriber,
+            RefreshWakeScreensSubscriber,
+            PublishScreenCreatedSubscriber,
+        ],
+    )
+
+    event_bus.subscribe(
+        event=ScreenUpdatedEvent,
+        subscribers=[
+            BumpScreensVersionSubscriber,
+            ScheduleScreenRenderSubscriber,
+            RefreshWakeScreensSubscriber,
+            PublishScreenUpdatedSubscriber,
+        ],
+    )
+
+    event_bus.subscribe(
+        event=ScreenDeletedEvent,
+        subscribers=[
+            BumpScreensVersionSubscriber,
+            RefreshWakeScreensSubscriber,
+            PublishScreenDeletedSubscriber,
+        ],
+    )
+
+    event_bus.subscribe(
+        event=ScreensImportedEvent,
+        subscribers=[BumpScreensVersionSubscriber, RefreshWakeScreensSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=AlarmCreatedEvent,
+        subscribers=[RefreshAlarmScheduleSubscriber, PublishAlarmCreatedSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=AlarmUpdatedEvent,
+        subscribers=[RefreshAlarmScheduleSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=AlarmDeletedEvent,
+        subscribers=[RefreshAlarmScheduleSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=AlarmTriggeredEvent,
+        subscribers=[
+            LogAlarmTriggeredSubscriber,
+            AdvanceAlarmScheduleSubscriber,
+            PublishAlarmTriggeredSubscriber,
+        ],
+    )
+
+    event_bus.subscribe(
+        event=AlarmsImportedEvent,
+        subscribers=[ReloadAlarmScheduleSubscriber],
     )
 
     event_bus.subscribe(
         event=DeviceHeartbeatReceivedEvent,
-        subscribers=[LogHeartbeatSubscriber],
+        subscribers=[
+            LogHeartbeatSubscriber,
+            TrackHeartbeatSubscriber,
+            PublishHeartbeatSubscriber,
+            RecordTelemetrySubscriber,
+        ],
+    )
+
+    event_bus.subscribe(
+        event=DeviceOnlineEvent,
+        subscribers=[PublishDeviceOnlineSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=DeviceOfflineEvent,
+        subscribers=[PublishDeviceOfflineSubscriber],
+    )
+
+    event_bus.subscribe(
+        event=DevicesImportedEvent,
+        subscribers=[ReloadFleetRegistrySubscriber],
     )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     prepare()
+    container = get_container()
+    await container.read_router.start()
+    await container.render_farm.start()
+    await container.async_subscribers.start()
+    await container.outbox.start()
+    await container.heartbeat_buffer.start()
+    await container.telemetry_recorder.start()
+    bus = SimpleCommandBus(container)
+    await bus.execute(LoadFleetRegistryCommand)
+    await bus.execute(LoadAlarmSchedulerCommand)
+    await bus.execute(LoadWakeIndexCommand)
+    await container.alarm_scheduler.start(on_due=lambda: bus.execute(FireDueAlarmsCommand))
+    await container.fleet_registry.start(on_tick=lambda: bus.execute(ExpireOfflineDevicesCommand))
     yield
+    await container.alarm_scheduler.stop()
+    await container.fleet_registry.stop()
+    # Undelivered outbox messages stay stored; jobs already handed out may finish.
+    await container.outbox.stop()
+    await container.async_subscribers.stop()
+    # Flush heartbeats and telemetry still pending before the engine goes away.
+    await container.heartbeat_buffer.stop()
+    await container.telemetry_recorder.stop()
+    await container.render_farm.stop()
+    await read_router.stop()
     await engine.dispose()
+    await read_engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -60,14 +229,73 @@ def create_app() -> FastAPI:
         root_path="/api",
     )
 
+    app.add_middleware(ClientMiddleware)
+
     app.include_router(screens.router, prefix="/v1")
     app.include_router(alarms.router, prefix="/v1")
     app.include_router(device.router, prefix="/v1")
+    app.include_router(events.router, prefix="/v1")
+    app.include_router(bulk.router, prefix="/v1")
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics() -> PlainTextResponse:
+        container = get_container()
+        return PlainTextResponse(
+            container.metrics.render(container.event_bus),
+            media_type="text/plain; version=0.0.4",
+        )
 
     @app.get("/health")
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/health/database")
+    async def database_stats() -> dict[str, int | dict[str, dict[str, int | bool]]]:
+        return get_container().read_router.stats()
+
+    @app.get("/health/cache")
+    async def cache_stats() -> dict[str, int]:
+        return get_container().result_cache.stats()
+
+    @app.get("/health/render")
+    async def render_stats() -> dict[str, int | float]:
+        return get_container().render_farm.stats()
+
+    @app.get("/health/heartbeats")
+    async def heartbeat_stats() -> dict[str, dict[str, int]]:
+        container = get_container()
+        return {
+            "buffer": container.heartbeat_buffer.stats(),
+            "telemetry": container.telemetry_recorder.stats(),
+        }
+
+    @app.get("/health/fleet")
+    async def fleet_stats() -> dict[str, int]:
+        return get_container().fleet_registry.stats()
+
+    @app.get("/health/alarms")
+    async def alarm_stats() -> dict[str, int]:
+        return get_container().alarm_scheduler.stats()
+
+    @app.get("/health/wake")
+    async def wake_stats() -> dict[str, int | str]:
+        wake_index = get_container().wake_index
+        return {**wake_index.stats(), "next_wake_at": utc_isoformat(wake_index.next_wake_at())}
+
+    @app.get("/health/subscribers")
+    async def subscriber_stats() -> dict[str, int | dict[str, dict[str, int]]]:
+        return get_container().async_subscribers.stats()
+
+    @app.get("/health/outbox")
+    async def outbox_stats() -> dict[str, int | float]:
+        outbox = get_container().outbox
+        return {**outbox.stats(), **await outbox.backlog()}
+
+    @app.get("/health/stream")
+    async def stream_stats() -> dict[str, dict[str, int]]:
+        container = get_container()
+        return {"sse": container.change_feed.stats(), "ws": container.topic_hub.stats()}
+
     return app
 
 
@@ -0,0 +1 @@
+"""Microbenchmarks. Run from api/, e.g. `python -m benchmarks.bench_text_layout`."""
@@ -0,0 +1,86 @@
+"""Calendar expansion of 10k alarms over 90 days: AlarmTable vs next_occurrence per alarm.
+
+The per-alarm loop walks Alarm.next_occurrence from occurrence to occurrence, the way a
+calendar view would without the table; both must produce the same occurrences. The
+range crosses a DST change in Europe/Berlin.
+
+    python -m benchmarks.bench_alarm_occurrences
+"""
+
+import random
+import timeit
+from datetime import UTC, datetime, time, timedelta
+from functools import partial
+from zoneinfo import ZoneInfo
+
+from app.domain.models.alarm import Alarm
+from app.infrastructure.scheduling.occurrences import AlarmTable, Occurrences, expand
+
+TZ = ZoneInfo("Europe/Berlin")
+START = datetime(2026, 3, 1)
+END = START + timedelta(days=90)
+ALARMS = 10_000
+
+
+def make_alarms(count: int) -> list[Alarm]:
+    rng = random.Random(17)
+    alarms = []
+    for i in range(count):
+        repeat_days = sorted(rng.sample(range(7), rng.randint(0, 7)))
+        alarm = Alarm(
+            name=f"alarm {i}",
+            trigger_time=time(rng.randrange(24), rng.randrange(60)),
+            repeat_days=repeat_days,
+            updated_at=START + timedelta(days=rng.randrange(30), seconds=rng.randrange(86400)),
+        )
+        alarm.reschedule(START.replace(tzinfo=UTC), TZ)
+        alarms.append(alarm)
+    return alarms
+
+
+def expand_per_alarm(alarms: list[Alarm]) -> list[tuple[int, int]]:
+    start, end = START.replace(tzinfo=UTC), END.replace(tzinfo=UTC)
+    occurrences = []
+    for index, alarm in enumerate(alarms):
+        at = alarm.next_occurrence(start - timedelta(seconds=1), TZ)
+        while at is not None and at < end:
+            occurrences.append((int(at.timestamp()), index))
+            at = alarm.next_occurrence(at, TZ) if alarm.repeat_days else None
+    occurrences.sort()
+    return occurrences
+
+
+def expand_table(alarms: list[Alarm]) -> int:
+    return len(expand(AlarmTable.from_alarms(alarms), START, END, TZ))
+
+
+def ndjson_size(occurrences: Occurrences) -> int:
+    return sum(map(len, occurrences.ndjson()))
+
+
+def main() -> None:
+    alarms = make_alarms(ALARMS)
+    table = AlarmTable.from_alarms(alarms)
+    occurrences = expand(table, START, END, TZ)
+    position = {alarm_id: i for i, alarm_id in enumerate(a.id for a in alarms)}
+    vectorized = sorted(
+        (at, position[table.alarm_ids[i]])
+        for i, at in zip(occurrences.alarm_index.tolist(), occurrences.at.tolist(), strict=True)
+    )
+    assert vectorized == expand_per_alarm(alarms)
+    print(f"{ALARMS} alarms, {len(occurrences)} occurrences in 90 days, best of 5 runs")
+
+    cases = (
+        ("per alarm", partial(expand_per_alarm, alarms), 1),
+        ("table build", partial(AlarmTable.from_alarms, alarms), 10),
+        ("expand", partial(expand, table, START, END, TZ), 10),
+        ("build + expand", partial(expand_table, alarms), 10),
+        ("ndjson", partial(ndjson_size, occurrences), 3),
+    )
+    for name, run, number in cases:
+        best = min(timeit.repeat(run, number=number, repeat=5))
+        print(f"{name:>15}: {1000 * best / number:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
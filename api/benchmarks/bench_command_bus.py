@@ -0,0 +1,158 @@
+"""CommandBus.execute and event dispatch with precomputed plans vs. resolving per call.
+
+The "per call" rows clear the Container's injection plans and the EventBus's dispatch
+tables and parameter plans before every run, so each run resolves annotations and
+subscribers again, as the bus did before the plans were kept.
+
+A no-DB command with 7 injected dependencies (2 repositories); an event with 4 no-op
+subscribers (2 sync, 2 commit) whose commands take one event field and one dependency.
+
+    python -m benchmarks.bench_command_bus
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.events.base import Event
+from app.domain.ports.alarm_repository import AlarmRepository
+from app.domain.ports.screen_repository import ScreenRepository
+from app.infrastructure.cache.versions import ResourceVersions
+from app.infrastructure.command_bus import SimpleCommandBus
+from app.infrastructure.commands import BaseCommand, SubscriberCommand
+from app.infrastructure.container import Container, init_container
+from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.events.subscriber import CommitSubscriber, SyncSubscriber
+from app.infrastructure.fleet.fleet_registry import FleetRegistry
+from app.infrastructure.persistence.database import ReadOnlySession
+from app.infrastructure.persistence.read_routing import ReadRouter
+from app.infrastructure.persistence.repositories import (
+    SqlAlarmRepository,
+    SqlDeviceRepository,
+    SqlScreenRepository,
+    SqlTelemetryRepository,
+)
+from app.infrastructure.rendering import FramebufferScreenRenderer
+from app.infrastructure.rendering.partial_refresh import RefreshPlanner
+from app.infrastructure.scheduling.wake_index import WakeIndex
+
+RUNS = 20_000
+
+
+class PingCommand(BaseCommand):
+    screen_repository: ScreenRepository
+    alarm_repository: AlarmRepository
+    event_bus: EventBus
+    resource_versions: ResourceVersions
+    refresh_planner: RefreshPlanner
+    fleet_registry: FleetRegistry
+    wake_index: WakeIndex
+
+    value: int = 0
+
+    async def handle(self) -> int:
+        return self.value
+
+
+@dataclass(frozen=True)
+class PingedEvent(Event):
+    value: int = 0
+    note: str = ""
+
+
+class NoOpCommand(SubscriberCommand):
+    resource_versions: ResourceVersions
+
+    value: int
+
+    async def handle(self) -> None:
+        pass
+
+
+class SyncNoOp(SyncSubscriber):
+    command = NoOpCommand
+
+
+class OtherSyncNoOp(SyncSubscriber):
+    command = NoOpCommand
+
+
+class CommitNoOp(CommitSubscriber):
+    command = NoOpCommand
+
+
+class OtherCommitNoOp(CommitSubscriber):
+    command = NoOpCommand
+
+
+def make_container() -> Container:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    read_factory = async_sessionmaker(
+        engine, class_=AsyncSession, sync_session_class=ReadOnlySession
+    )
+    container = init_container(
+        session_factory=async_sessionmaker(engine, class_=AsyncSession),
+        read_router=ReadRouter(read_factory, []),
+        screen_repo_cls=SqlScreenRepository,
+        alarm_repo_cls=SqlAlarmRepository,
+        device_repo_cls=SqlDeviceRepository,
+        telemetry_repo_cls=SqlTelemetryRepository,
+        screen_renderer=FramebufferScreenRenderer(),
+    )
+    container.event_bus.subscribe(
+        PingedEvent, [SyncNoOp, OtherSyncNoOp, CommitNoOp, OtherCommitNoOp]
+    )
+    return container
+
+
+async def best_of(run: Callable[[], Awaitable[object]], repeat: int = 5) -> float:
+    """Best mean time per run, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(RUNS):
+            await run()
+        best = min(best, time.perf_counter() - started)
+    return 1e6 * best / RUNS
+
+
+async def main() -> None:
+    container = make_container()
+    bus = SimpleCommandBus(container)
+    event_bus = container.event_bus
+    params = {"value": 1}
+
+    async def execute() -> int:
+        return await bus.execute(PingCommand, params)
+
+    async def execute_unplanned() -> int:
+        container._injection_plans.clear()
+        return await bus.execute(PingCommand, params)
+
+    async def dispatch() -> None:
+        with event_bus.scope():
+            event_bus.publish(PingedEvent(value=1))
+            await event_bus.dispatch(container=container)
+            await event_bus.dispatch_committed(container=container)
+
+    async def dispatch_unplanned() -> None:
+        event_bus._tables.clear()
+        event_bus._param_plans.clear()
+        await dispatch()
+
+    assert await execute() == await execute_unplanned() == 1
+    print(f"{RUNS} runs each, best of 5")
+    for name, run in (
+        ("execute, per call", execute_unplanned),
+        ("execute, planned", execute),
+        ("dispatch, per call", dispatch_unplanned),
+        ("dispatch, planned", dispatch),
+    ):
+        print(f"{name:>20}: {await best_of(run):7.2f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""Read commands through CommandBus.execute: read-only unit of work vs. @transactional.
+
+Each read-only command is compared with a subclass whose handle() does the same work
+under plain @transactional (flush, dispatch and commit on the primary session).
+SQLite file database, so the difference on SQLite is the COMMIT and the unit-of-work
+bookkeeping; on Postgres the autocommit read also saves the BEGIN round trip.
+
+    python -m benchmarks.bench_readonly_commands
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.commands.device_commands import GetDeviceStatusCommand
+from app.application.commands.screen_commands import CreateScreenCommand, GetScreenCommand
+from app.domain.models.device import DeviceStatus
+from app.domain.models.screen import Screen
+from app.infrastructure.command_bus import SimpleCommandBus
+from app.infrastructure.commands import BaseCommand
+from app.infrastructure.container import init_container
+from app.infrastructure.decorators import transactional
+from app.infrastructure.persistence.database import Base, ReadOnlySession
+from app.infrastructure.persistence.read_routing import ReadRouter
+from app.infrastructure.persistence.repositories import (
+    SqlAlarmRepository,
+    SqlDeviceRepository,
+    SqlScreenRepository,
+    SqlTelemetryRepository,
+)
+from app.infrastructure.rendering import FramebufferScreenRenderer
+
+RUNS = 2000
+
+
+class GetScreenInTransactionCommand(GetScreenCommand):
+    @transactional
+    async def handle(self) -> Screen | None:
+        return await self.screen_repository.get_by_id(self.screen_id)
+
+
+class GetDeviceStatusInTransactionCommand(GetDeviceStatusCommand):
+    @transactional
+    async def handle(self) -> DeviceStatus | None:
+        return await GetDeviceStatusCommand.handle.__wrapped__(self)
+
+
+async def best_of(
+    bus: SimpleCommandBus, command: type[BaseCommand], params: dict[str, Any], repeat: int = 5
+) -> float:
+    """Best mean time per execute, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(RUNS):
+            await bus.execute(command, params)
+        best = min(best, time.perf_counter() - started)
+    return 1e6 * best / RUNS
+
+
+async def main(path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    # A separate autocommit engine, as database.read_engine.
+    read_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", isolation_level="AUTOCOMMIT")
+    read_factory = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+    )
+    container = init_container(
+        session_factory=async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        read_router=ReadRouter(read_factory, []),
+        screen_repo_cls=SqlScreenRepository,
+        alarm_repo_cls=SqlAlarmRepository,
+        device_repo_cls=SqlDeviceRepository,
+        telemetry_repo_cls=SqlTelemetryRepository,
+        screen_renderer=FramebufferScreenRenderer(),
+    )
+    bus = SimpleCommandBus(container)
+    screen = await bus.execute(CreateScreenCommand, {"title": "Hello", "content": "World"})
+    pending = container.heartbeat_buffer.add(DeviceStatus(device_id="epd-1", battery_level=80))
+    container.heartbeat_buffer.remember(pending)
+
+    print(f"{RUNS} runs each, best of 5")
+    for name, readonly, transactional_cmd, params in (
+        (
+            "GetScreen (SQLite)",
+            GetScreenCommand,
+            GetScreenInTransactionCommand,
+            {"screen_id": screen.id},
+        ),
+        (
+            "GetDeviceStatus (buffer)",
+            GetDeviceStatusCommand,
+            GetDeviceStatusInTransactionCommand,
+            {"device_id": "epd-1"},
+        ),
+    ):
+        assert await bus.execute(readonly, params) == await bus.execute(transactional_cmd, params)
+        before = await best_of(bus, transactional_cmd, params)
+        after = await best_of(bus, readonly, params)
+        print(f"{name:>25}: {before:8.1f} us @transactional, {after:8.1f} us readonly")
+    await engine.dispose()
+    await read_engine.dispose()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(main(Path(directory) / "bench.db"))
@@ -0,0 +1,72 @@
+"""Uncached TEXT screen render: glyph atlas + text_block vs one blit per glyph.
+
+The per-glyph renderer is the drawing loop used before the glyph atlas; both must
+produce the same bytes.
+
+    python -m benchmarks.bench_text_layout
+"""
+
+import timeit
+from functools import partial
+
+from app.infrastructure.rendering.font import FONT_WIDTH
+from app.infrastructure.rendering.framebuffer import EPD_BLACK, EPD_HEIGHT, EPD_WIDTH, Framebuffer
+from app.infrastructure.rendering.screen_renderer import (
+    CONTENT_ROWS,
+    CONTENT_WIDTH,
+    CONTENT_Y,
+    LINE_HEIGHT,
+    MARGIN,
+    SEPARATOR_Y,
+    TITLE_COLUMNS,
+    TITLE_SCALE,
+    TITLE_Y,
+    render_text_screen,
+    to_panel_text,
+)
+from app.infrastructure.rendering.text_layout import ATLAS, DEFAULT_FONT, glyph_indices, wrap
+
+TITLE = "Shopping list"
+CONTENT = " ".join(["milk eggs bread butter cheese apples coffee"] * 12)  # fills all rows
+
+
+def render_per_glyph(title: str, content: str) -> bytes:
+    fb = Framebuffer()
+    fb.draw_rect(2, 2, EPD_WIDTH - 4, EPD_HEIGHT - 4, EPD_BLACK)
+
+    def draw_string(x: int, y: int, text: str, scale: int) -> None:
+        glyphs = ATLAS.glyphs(1)[:, :, :FONT_WIDTH]
+        for index in glyph_indices(text).tolist():
+            glyph = glyphs[index]
+            if scale > 1:
+                glyph = glyph.repeat(scale, axis=0).repeat(scale, axis=1)
+            fb.blit(x, y, glyph, EPD_BLACK)
+            x += (FONT_WIDTH + 1) * scale
+
+    title = to_panel_text(title)[:TITLE_COLUMNS]
+    x = (EPD_WIDTH - (len(title) * (FONT_WIDTH + 1) * TITLE_SCALE - TITLE_SCALE)) // 2
+    draw_string(x, TITLE_Y, title, TITLE_SCALE)
+    fb.fill_rect(MARGIN, SEPARATOR_Y, EPD_WIDTH - 2 * MARGIN, 1, EPD_BLACK)
+    lines = wrap.__wrapped__(to_panel_text(content), DEFAULT_FONT, CONTENT_WIDTH)
+    for row, line in enumerate(lines[:CONTENT_ROWS]):
+        draw_string(MARGIN, CONTENT_Y + row * LINE_HEIGHT, line, 1)
+    return fb.pack()
+
+
+def render_atlas(title: str, content: str) -> bytes:
+    wrap.cache_clear()
+    return render_text_screen.__wrapped__(title, content)
+
+
+def main() -> None:
+    assert render_per_glyph(TITLE, CONTENT) == render_atlas(TITLE, CONTENT)
+    lines = len(wrap(to_panel_text(CONTENT), DEFAULT_FONT, CONTENT_WIDTH)[:CONTENT_ROWS])
+    print(f"{lines} content lines, {len(CONTENT)} chars, best of 5 runs")
+    for name, render in (("per-glyph blit", render_per_glyph), ("atlas", render_atlas)):
+        number = 200
+        best = min(timeit.repeat(partial(render, TITLE, CONTENT), number=number, repeat=5))
+        print(f"{name:>15}: {1000 * best / number:7.3f} ms per render")
+
+
+if __name__ == "__main__":
+    main()
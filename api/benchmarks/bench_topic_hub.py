@@ -0,0 +1,70 @@
+"""TopicHub fan-out: one change published to N connections subscribed to its topic.
+
+`publish` is the hub's own work (one encode, one shared frame appended per
+connection). `publish + drain` also runs one writer task per connection, as the
+WebSocket endpoint does, and stops when every writer has taken the frame.
+
+    python -m benchmarks.bench_topic_hub [connections ...]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from app.infrastructure.streaming.change import Change
+from app.infrastructure.streaming.topic_hub import HubConnection, TopicHub
+
+ROUNDS = 50
+
+
+async def writer(connection: HubConnection, received: list[int]) -> None:
+    while True:
+        frames = await connection.drain()
+        received[0] += len(frames)
+
+
+async def bench(connections: int) -> None:
+    hub = TopicHub()
+    subscribed = [hub.connect() for _ in range(connections)]
+    for connection in subscribed:
+        hub.subscribe(connection, ["screens", f"device:{id(connection)}"])
+    changes = [
+        Change("screen.updated", "screens", str(i), datetime(2026, 1, 1)) for i in range(ROUNDS)
+    ]
+
+    publish_only = 0.0
+    for change in changes:
+        t0 = time.perf_counter()
+        hub.publish(change)
+        publish_only += time.perf_counter() - t0
+        for connection in subscribed:  # keep buffers below high water
+            await connection.drain()
+
+    received = [0]
+    writers = [asyncio.create_task(writer(c, received)) for c in subscribed]
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    for change in changes:
+        hub.publish(change)
+        target = received[0] + connections
+        while received[0] < target:
+            await asyncio.sleep(0)
+    drained = time.perf_counter() - started
+    for task in writers:
+        task.cancel()
+    await asyncio.gather(*writers, return_exceptions=True)
+
+    print(
+        f"{connections:>7} connections: publish {1000 * publish_only / ROUNDS:7.3f} ms, "
+        f"publish + drain {1000 * drained / ROUNDS:7.3f} ms per change"
+    )
+
+
+def main() -> None:
+    for connections in [int(n) for n in sys.argv[1:]] or [100, 1_000, 10_000]:
+        asyncio.run(bench(connections))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Shared fixtures: a SQLite file per test stands in for PostgreSQL."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.command_bus import SimpleCommandBus
+from app.infrastructure.container import Container, init_container
+from app.infrastructure.persistence.database import Base, ReadOnlySession
+from app.infrastructure.persistence.read_routing import ReadRouter
+from app.infrastructure.persistence.repositories import (
+    SqlAlarmRepository,
+    SqlDeviceRepository,
+    SqlScreenRepository,
+    SqlTelemetryRepository,
+)
+from app.infrastructure.rendering import FramebufferScreenRenderer
+
+
+@pytest.fixture
+async def session_factory(tmp_path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Primary database with the full schema."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def container(session_factory: async_sessionmaker[AsyncSession]) -> Container:
+    """Container as prepare() builds it, minus subscribers and background services."""
+    read_factory = async_sessionmaker(
+        session_factory.kw["bind"].execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+    )
+    return init_container(
+        session_factory=session_factory,
+        read_router=ReadRouter(read_factory, []),
+        screen_repo_cls=SqlScreenRepository,
+        alarm_repo_cls=SqlAlarmRepository,
+        device_repo_cls=SqlDeviceRepository,
+        telemetry_repo_cls=SqlTelemetryRepository,
+        screen_renderer=FramebufferScreenRenderer(),
+    )
+
+
+@pytest.fixture
+def bus(container: Container) -> SimpleCommandBus:
+    return SimpleCommandBus(container)
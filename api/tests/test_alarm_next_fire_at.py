@@ -0,0 +1,160 @@
+"""next_fire_at maintenance and the "firing soon" range query (settings.timezone is UTC)."""
+
+from datetime import UTC, datetime, time, timedelta
+
+from pydantic import TypeAdapter
+from sqlalchemy import text, update
+
+from app.application.commands.alarm_commands import (
+    CreateAlarmCommand,
+    FireDueAlarmsCommand,
+    GetAlarmsFiringSoonCommand,
+    UpdateAlarmCommand,
+)
+from app.application.commands.bulk_commands import ImportResourceCommand
+from app.application.subscribers.alarm_subscribers import (
+    AdvanceAlarmScheduleSubscriber,
+    ReloadAlarmScheduleSubscriber,
+)
+from app.domain.events.alarm import AlarmsImportedEvent, AlarmTriggeredEvent
+from app.domain.models.alarm import Alarm, AlarmStatus
+from app.infrastructure.persistence.bulk_transfer import BulkResource
+from app.infrastructure.persistence.models.alarm import AlarmORM
+from app.infrastructure.persistence.repositories import SqlAlarmRepository
+
+EVERY_DAY = list(range(7))
+
+
+def _in(minutes: float) -> time:
+    return (datetime.utcnow() + timedelta(minutes=minutes)).time().replace(microsecond=0)
+
+
+async def _stored(session_factory, alarm_id):
+    async with session_factory() as session:
+        return await SqlAlarmRepository(session).get_by_id(alarm_id)
+
+
+async def test_create_stores_next_occurrence(bus, session_factory) -> None:
+    before = datetime.utcnow()
+    once = await bus.execute(CreateAlarmCommand, {"name": "once", "trigger_time": _in(-30)})
+    daily = await bus.execute(
+        CreateAlarmCommand, {"name": "daily", "trigger_time": _in(90), "repeat_days": EVERY_DAY}
+    )
+
+    for alarm in (once, daily):
+        stored = await _stored(session_factory, alarm.id)
+        assert stored.next_fire_at == alarm.next_fire_at
+        assert before < stored.next_fire_at <= before + timedelta(days=1)
+        assert stored.next_fire_at.time() == alarm.trigger_time
+    # Half an hour ago today has passed: a one-shot alarm fires tomorrow.
+    assert once.next_fire_at - before > timedelta(hours=23)
+
+
+async def test_update_recomputes_next_fire_at(bus, session_factory) -> None:
+    alarm = await bus.execute(
+        CreateAlarmCommand, {"name": "a", "trigger_time": _in(60), "repeat_days": EVERY_DAY}
+    )
+
+    moved = await bus.execute(UpdateAlarmCommand, {"alarm_id": alarm.id, "trigger_time": _in(5)})
+    assert moved.next_fire_at.time() == moved.trigger_time
+    assert moved.next_fire_at < alarm.next_fire_at
+    assert (await _stored(session_factory, alarm.id)).next_fire_at == moved.next_fire_at
+
+    disabled = await bus.execute(
+        UpdateAlarmCommand, {"alarm_id": alarm.id, "status": AlarmStatus.DISABLED.value}
+    )
+    assert disabled.next_fire_at is None
+    assert (await _stored(session_factory, alarm.id)).next_fire_at is None
+
+
+async def test_firing_rolls_over_repeating_and_retires_one_shot(
+    bus, container, session_factory
+) -> None:
+    container.event_bus.subscribe(AlarmTriggeredEvent, [AdvanceAlarmScheduleSubscriber])
+    trigger_time = _in(-1)
+    daily = await bus.execute(
+        CreateAlarmCommand, {"name": "d", "trigger_time": trigger_time, "repeat_days": EVERY_DAY}
+    )
+    once = await bus.execute(CreateAlarmCommand, {"name": "o", "trigger_time": trigger_time})
+    # Both were due a minute ago, as if the one-shot alarm had been set ten minutes ago.
+    now = datetime.utcnow()
+    due_at = datetime.combine(now.date(), trigger_time)
+    if due_at > now:
+        due_at -= timedelta(days=1)
+    async with session_factory() as session:
+        await session.execute(
+            update(AlarmORM).values(next_fire_at=due_at, updated_at=due_at - timedelta(minutes=9))
+        )
+        await session.commit()
+        alarms = await SqlAlarmRepository(session).get_active()
+    container.alarm_scheduler.load(alarms, now=due_at.replace(tzinfo=UTC) - timedelta(minutes=5))
+    assert len(container.alarm_scheduler.due()) == 2
+
+    await bus.execute(FireDueAlarmsCommand)
+
+    rolled = await _stored(session_factory, daily.id)
+    assert rolled.status is AlarmStatus.ACTIVE
+    assert rolled.next_fire_at == due_at + timedelta(days=1)
+    retired = await _stored(session_factory, once.id)
+    assert retired.status is AlarmStatus.TRIGGERED
+    assert retired.next_fire_at is None
+    # The in-memory schedule advanced with the committed rows.
+    assert container.alarm_scheduler.due() == []
+    assert container.alarm_scheduler.peek() == rolled.next_fire_at.replace(tzinfo=UTC)
+
+
+async def test_firing_soon_is_a_range_query_over_active_alarms(bus, session_factory) -> None:
+    soon = await bus.execute(
+        CreateAlarmCommand, {"name": "soon", "trigger_time": _in(5), "repeat_days": EVERY_DAY}
+    )
+    also_soon = await bus.execute(CreateAlarmCommand, {"name": "also", "trigger_time": _in(9)})
+    await bus.execute(
+        CreateAlarmCommand, {"name": "later", "trigger_time": _in(30), "repeat_days": EVERY_DAY}
+    )
+    disabled = await bus.execute(CreateAlarmCommand, {"name": "off", "trigger_time": _in(3)})
+    await bus.execute(
+        UpdateAlarmCommand, {"alarm_id": disabled.id, "status": AlarmStatus.DISABLED.value}
+    )
+
+    firing = await bus.execute(GetAlarmsFiringSoonCommand, {"within_seconds": 600})
+
+    assert [a.id for a in firing] == [soon.id, also_soon.id]
+    async with session_factory() as session:
+        plan = await session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM alarms WHERE status = 'active' "
+                "AND next_fire_at >= :start AND next_fire_at < :end"
+            ),
+            {"start": datetime.utcnow(), "end": datetime.utcnow() + timedelta(minutes=10)},
+        )
+        assert "ix_alarms_next_fire_at_active" in " ".join(row[-1] for row in plan)
+
+
+async def test_import_reload_stores_recomputed_next_fire_at(
+    bus, container, session_factory
+) -> None:
+    container.event_bus.subscribe(AlarmsImportedEvent, [ReloadAlarmScheduleSubscriber])
+    stale = datetime.utcnow().replace(microsecond=0) - timedelta(days=2)
+    alarm = Alarm(
+        name="imported", trigger_time=stale.time(), repeat_days=EVERY_DAY, next_fire_at=stale
+    )
+
+    async def body():
+        yield TypeAdapter(Alarm).dump_json(alarm) + b"\n"
+
+    report = await bus.execute(
+        ImportResourceCommand, {"resource": BulkResource.ALARMS, "body": body()}
+    )
+    assert report.imported == 1
+    assert (await _stored(session_factory, alarm.id)).next_fire_at == stale
+
+    await container.async_subscribers.start()
+    try:
+        assert await container.outbox.relay_once() == 1
+    finally:
+        await container.async_subscribers.stop()
+
+    stored = await _stored(session_factory, alarm.id)
+    assert datetime.utcnow() < stored.next_fire_at <= datetime.utcnow() + timedelta(days=1)
+    assert stored.next_fire_at.time() == alarm.trigger_time
+    assert container.alarm_scheduler.peek() == stored.next_fire_at.replace(tzinfo=UTC)
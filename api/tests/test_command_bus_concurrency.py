@@ -0,0 +1,131 @@
+"""Concurrent CommandBus.execute calls never share a session or an event queue."""
+
+import asyncio
+import random
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.events.base import Event
+from app.infrastructure.commands import BaseCommand, SubscriberCommand
+from app.infrastructure.container import get_container
+from app.infrastructure.decorators import transactional
+from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.events.subscriber import CommitSubscriber, SyncSubscriber
+from app.infrastructure.persistence.database import ReadOnlySession
+
+EVENTS_PER_COMMAND = 3
+
+
+@dataclass(frozen=True)
+class TaggedEvent(Event):
+    tag: int = 0
+    seq: int = 0
+
+
+# (subscriber kind, tag, seq, session the subscriber ran in)
+seen: list[tuple[str, int, int, object]] = []
+
+
+async def _yield() -> None:
+    for _ in range(random.randint(0, 3)):
+        await asyncio.sleep(0)
+
+
+class RecordInTransactionCommand(SubscriberCommand):
+    tag: int
+    seq: int
+
+    async def handle(self) -> None:
+        await _yield()
+        seen.append(("sync", self.tag, self.seq, get_container().session()))
+
+
+class RecordAfterCommitCommand(SubscriberCommand):
+    tag: int
+    seq: int
+
+    async def handle(self) -> None:
+        await _yield()
+        seen.append(("commit", self.tag, self.seq, None))
+
+
+class RecordInTransaction(SyncSubscriber):
+    command = RecordInTransactionCommand
+
+
+class RecordAfterCommit(CommitSubscriber):
+    command = RecordAfterCommitCommand
+
+
+class PublishTaggedCommand(BaseCommand):
+    event_bus: EventBus
+
+    tag: int
+    fail: bool = False
+
+    @transactional
+    async def handle(self) -> object:
+        session = get_container().session()
+        for seq in range(EVENTS_PER_COMMAND):
+            await session.execute(select(1))
+            self.event_bus.publish(TaggedEvent(tag=self.tag, seq=seq))
+            await _yield()
+            assert get_container().session() is session
+        if self.fail:
+            raise RuntimeError(f"command {self.tag} failed")
+        return session
+
+
+class ReadSessionCommand(BaseCommand):
+    event_bus: EventBus
+
+    @transactional(readonly=True)
+    async def handle(self) -> object:
+        session = get_container().session()
+        await session.execute(select(1))
+        await _yield()
+        with pytest.raises(RuntimeError, match="Read-only"):
+            self.event_bus.publish(TaggedEvent(tag=-1))
+        assert get_container().session() is session
+        return session
+
+
+async def test_concurrent_commands_keep_their_own_session_and_events(bus, container) -> None:
+    container.event_bus.subscribe(TaggedEvent, [RecordInTransaction, RecordAfterCommit])
+    seen.clear()
+    random.seed(20)
+    commands = 300
+    failing = set(range(0, commands, 7))
+    readers = set(range(3, commands, 5)) - failing
+    writers = set(range(commands)) - failing - readers
+
+    def run(tag: int):
+        if tag in readers:
+            return bus.execute(ReadSessionCommand)
+        return bus.execute(PublishTaggedCommand, {"tag": tag, "fail": tag in failing})
+
+    results = await asyncio.gather(*(run(tag) for tag in range(commands)), return_exceptions=True)
+
+    sessions = {tag: result for tag, result in enumerate(results)}
+    for tag in failing:
+        assert isinstance(sessions[tag], RuntimeError)
+    for tag in readers:
+        assert isinstance(sessions[tag].sync_session, ReadOnlySession)
+    # Every command had a session of its own (all are still referenced here).
+    assert len({id(sessions[tag]) for tag in readers | writers}) == len(readers | writers)
+
+    by_tag: dict[tuple[str, int], list[tuple[int, object]]] = {}
+    for kind, tag, seq, session in seen:
+        by_tag.setdefault((kind, tag), []).append((seq, session))
+    # Exactly the events each successful writer published, each once, in its own
+    # transaction; nothing from failed or read-only commands.
+    assert set(by_tag) == {(kind, tag) for kind in ("sync", "commit") for tag in writers}
+    for tag in writers:
+        assert by_tag["sync", tag] == [(seq, sessions[tag]) for seq in range(EVENTS_PER_COMMAND)]
+        assert [seq for seq, _ in by_tag["commit", tag]] == list(range(EVENTS_PER_COMMAND))
+
+    # Nothing leaked into the bus-wide queues.
+    event_bus = container.event_bus
+    assert not event_bus._default.published and not event_bus._default.dispatched
@@ -0,0 +1,122 @@
+"""TimingWheel deadlines, FleetRegistry offline detection and heartbeat tracking."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.application.commands.device_commands import (
+    ExpireOfflineDevicesCommand,
+    RecordHeartbeatCommand,
+)
+from app.application.subscribers.device_subscribers import TrackHeartbeatSubscriber
+from app.config import settings
+from app.domain.events.device import DeviceHeartbeatReceivedEvent, DeviceOnlineEvent
+from app.infrastructure.commands import SubscriberCommand
+from app.infrastructure.events.subscriber import CommitSubscriber, SyncSubscriber
+from app.infrastructure.fleet import FleetRegistry, TimingWheel
+
+
+def test_wheel_reports_items_scheduled_before_the_first_advance() -> None:
+    wheel = TimingWheel(horizon=10)
+    wheel.schedule(1, 100.5)
+    wheel.schedule(2, 103.2)
+    wheel.schedule(3, 108.0)
+
+    assert wheel.advance(104.0) == [1, 2]
+    assert wheel.advance(107.9) == []
+    assert wheel.advance(108.0) == [3]
+    assert wheel.scheduled == 0
+
+
+def test_wheel_clamps_late_schedules_to_the_next_tick() -> None:
+    wheel = TimingWheel(horizon=10)
+    assert wheel.advance(50.0) == []
+    wheel.schedule(1, 40.0)
+
+    assert wheel.advance(50.9) == []
+    assert wheel.advance(51.0) == [1]
+
+
+def test_loaded_device_goes_offline_at_its_deadline() -> None:
+    now = datetime(2026, 3, 1, 12, 0)
+    registry = FleetRegistry(offline_after=10, tick_seconds=1)
+    registry.load(
+        [
+            ("due-soon", now - timedelta(seconds=9.5)),
+            ("due-later", now - timedelta(seconds=2)),
+            ("already-offline", now - timedelta(seconds=30)),
+        ],
+        now=now,
+    )
+    assert registry.stats()["online"] == 2
+
+    reported = {}
+    for second in range(1, 13):
+        at = now + timedelta(seconds=second)
+        for entry in registry.expire(at):
+            reported[entry.device_id] = second
+
+    assert reported == {"due-soon": 1, "due-later": 8}
+    assert registry.stats() == {"devices": 3, "online": 0, "offline": 3, "wheel_entries": 0}
+
+
+def test_heartbeat_postpones_offline_and_reports_coming_back() -> None:
+    now = datetime(2026, 3, 1, 12, 0)
+    registry = FleetRegistry(offline_after=10, tick_seconds=1)
+
+    assert registry.seen("dev", now) is True
+    assert registry.seen("dev", now + timedelta(seconds=5)) is False
+    assert registry.expire(now + timedelta(seconds=11)) == []
+    [entry] = registry.expire(now + timedelta(seconds=15))
+    assert (entry.device_id, entry.online) == ("dev", False)
+    assert registry.seen("dev", now + timedelta(seconds=20)) is True
+
+
+class RejectHeartbeatCommand(SubscriberCommand):
+    """Fails the transaction of heartbeats reporting an empty battery."""
+
+    battery_level: int | None
+
+    async def handle(self) -> None:
+        if self.battery_level == 0:
+            raise RuntimeError("rejected")
+
+
+class RejectHeartbeatSubscriber(SyncSubscriber):
+    command = RejectHeartbeatCommand
+
+
+came_online: list[str] = []
+
+
+class CollectOnlineCommand(SubscriberCommand):
+    device_id: str
+
+    async def handle(self) -> None:
+        came_online.append(self.device_id)
+
+
+class CollectOnlineSubscriber(CommitSubscriber):
+    command = CollectOnlineCommand
+
+
+async def test_rolled_back_heartbeat_does_not_mark_the_device_online(
+    bus, container, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "heartbeat_write_behind", False)
+    came_online.clear()
+    container.event_bus.subscribe(
+        DeviceHeartbeatReceivedEvent, [TrackHeartbeatSubscriber, RejectHeartbeatSubscriber]
+    )
+    container.event_bus.subscribe(DeviceOnlineEvent, [CollectOnlineSubscriber])
+
+    with pytest.raises(RuntimeError):
+        await bus.execute(RecordHeartbeatCommand, {"device_id": "dev", "battery_level": 0})
+    await bus.execute(ExpireOfflineDevicesCommand)
+    assert container.fleet_registry.get("dev") is None
+    assert came_online == []
+
+    await bus.execute(RecordHeartbeatCommand, {"device_id": "dev", "battery_level": 80})
+    await bus.execute(ExpireOfflineDevicesCommand)
+    assert container.fleet_registry.get("dev").online
+    assert came_online == ["dev"]
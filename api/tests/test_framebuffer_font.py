@@ -0,0 +1,94 @@
+"""The server-side framebuffer must match what the firmware draws, byte for byte."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.rendering.font import FIRST_CHAR, FONT_5X7, FONT_HEIGHT, FONT_WIDTH
+from app.infrastructure.rendering.framebuffer import (
+    EPD_BLACK,
+    EPD_BUF_SIZE,
+    EPD_HEIGHT,
+    EPD_WHITE,
+    EPD_WIDTH,
+    Framebuffer,
+)
+
+FIRMWARE = Path(__file__).resolve().parents[2] / "src"
+
+
+def _c_font() -> list[bytes]:
+    """Rows of `font_5x7` in src/epd_font.h."""
+    header = (FIRMWARE / "epd_font.h").read_text()
+    table = re.search(r"font_5x7\[\]\[FONT_WIDTH\]\s*=\s*\{(.*?)\n\};", header, re.S)
+    assert table is not None
+    body = re.sub(r"/\*.*?\*/", "", table.group(1), flags=re.S)
+    return [
+        bytes(int(value, 16) for value in row.split(","))
+        for row in re.findall(r"\{([^{}]*)\}", body)
+    ]
+
+
+class _CFramebuffer:
+    """Line-by-line transcription of gfx_set_pixel/gfx_draw_char/gfx_draw_string."""
+
+    def __init__(self, font: list[bytes]) -> None:
+        self.font = font
+        self.buf = bytearray(b"\xff" * EPD_BUF_SIZE)  # gfx_fill(buf, EPD_WHITE)
+
+    def set_pixel(self, x: int, y: int, color: int) -> None:
+        if x < 0 or x >= EPD_WIDTH or y < 0 or y >= EPD_HEIGHT:
+            return
+        idx = y * (EPD_WIDTH // 8) + x // 8
+        mask = 0x80 >> (x % 8)
+        if color == EPD_WHITE:
+            self.buf[idx] |= mask
+        else:
+            self.buf[idx] &= ~mask & 0xFF
+
+    def draw_char(self, x: int, y: int, c: str, color: int, scale: int) -> None:
+        code = ord(c) if 32 <= ord(c) <= 126 else ord("?")
+        glyph = self.font[code - 32]
+        for col in range(FONT_WIDTH):
+            for row in range(FONT_HEIGHT):
+                if glyph[col] & (1 << row):
+                    for sy in range(scale):
+                        for sx in range(scale):
+                            self.set_pixel(x + col * scale + sx, y + row * scale + sy, color)
+
+    def draw_string(self, x: int, y: int, text: str, color: int, scale: int) -> None:
+        for c in text:
+            self.draw_char(x, y, c, color, scale)
+            x += (FONT_WIDTH + 1) * scale
+
+
+def test_font_matches_firmware_header() -> None:
+    c_font = _c_font()
+    assert len(c_font) == 95
+    assert all(len(glyph) == FONT_WIDTH for glyph in c_font)
+    assert b"".join(FONT_5X7) == b"".join(c_font)
+    assert FONT_5X7[ord("A") - FIRST_CHAR] == bytes([0x7E, 0x11, 0x11, 0x11, 0x7E])
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "text", "scale"),
+    [
+        (0, 0, "".join(map(chr, range(32, 127))), 1),
+        (3, 17, "Hello, World! 0123456789", 2),
+        (-4, 190, "Clipped \x01é edges", 3),
+        (150, -9, "~{|}", 4),
+    ],
+)
+def test_rendered_buffer_matches_firmware(x: int, y: int, text: str, scale: int) -> None:
+    expected = _CFramebuffer(_c_font())
+    expected.draw_string(x, y, text, EPD_BLACK, scale)
+    expected.draw_string(x + 1, y + 1, text[:3], EPD_WHITE, scale)
+
+    framebuffer = Framebuffer()
+    framebuffer.draw_string(x, y, text, EPD_BLACK, scale)
+    framebuffer.draw_string(x + 1, y + 1, text[:3], EPD_WHITE, scale)
+    packed = framebuffer.pack()
+
+    assert len(packed) == EPD_BUF_SIZE
+    assert packed == bytes(expected.buf)
@@ -0,0 +1,55 @@
+"""Phase timings of @transactional commands, failed runs included."""
+
+import pytest
+
+from app.infrastructure.commands import BaseCommand
+from app.infrastructure.decorators import transactional
+from app.infrastructure.metrics import PHASES
+
+
+class WorkCommand(BaseCommand):
+    fail: bool = False
+
+    @transactional
+    async def handle(self) -> None:
+        if self.fail:
+            raise ValueError("handler failed")
+
+
+class ReadCommand(BaseCommand):
+    fail: bool = False
+
+    @transactional(readonly=True)
+    async def handle(self) -> None:
+        if self.fail:
+            raise ValueError("handler failed")
+
+
+def _observed(container, command) -> dict[str, int]:
+    timings = container.metrics.timings(command)
+    return {phase: sum(getattr(timings, phase).counts) for phase in PHASES}
+
+
+async def test_failed_runs_record_the_phases_they_reached(bus, container) -> None:
+    await bus.execute(WorkCommand)
+    with pytest.raises(ValueError):
+        await bus.execute(WorkCommand, {"fail": True})
+
+    assert _observed(container, WorkCommand) == {
+        "handler": 2,
+        "flush": 1,
+        "dispatch": 1,
+        "commit": 1,
+    }
+    assert container.metrics.timings(WorkCommand).errors == 1
+
+
+async def test_failed_read_only_runs_record_the_handler(bus, container) -> None:
+    await bus.execute(ReadCommand)
+    with pytest.raises(ValueError):
+        await bus.execute(ReadCommand, {"fail": True})
+
+    assert _observed(container, ReadCommand)["handler"] == 2
+    assert 'command="ReadCommand",phase="handler"' in container.metrics.render(
+        container.event_bus
+    )
@@ -0,0 +1,121 @@
+"""Outbox delivery: one message per subscriber, retried alone; leases outlive slow jobs."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+
+from app.domain.events.base import Event
+from app.infrastructure.commands import BaseCommand, SubscriberCommand
+from app.infrastructure.decorators import transactional
+from app.infrastructure.events.event_bus import EventBus
+from app.infrastructure.events.outbox import Outbox
+from app.infrastructure.events.subscriber import AsyncSubscriber
+from app.infrastructure.persistence.models.outbox import OutboxMessageORM
+
+runs: Counter[str] = Counter()
+release = asyncio.Event()
+
+
+@dataclass(frozen=True)
+class ThingHappenedEvent(Event):
+    name: str = ""
+
+
+class PublishThingCommand(BaseCommand):
+    event_bus: EventBus
+
+    name: str
+
+    @transactional
+    async def handle(self) -> None:
+        self.event_bus.publish(ThingHappenedEvent(name=self.name))
+
+
+class CountCommand(SubscriberCommand):
+    name: str
+
+    async def handle(self) -> None:
+        runs[f"count:{self.name}"] += 1
+
+
+class FlakyCommand(SubscriberCommand):
+    name: str
+
+    async def handle(self) -> None:
+        runs[f"flaky:{self.name}"] += 1
+        if runs[f"flaky:{self.name}"] < 3:
+            raise RuntimeError("not yet")
+
+
+class SlowCommand(SubscriberCommand):
+    name: str
+
+    async def handle(self) -> None:
+        runs[f"slow:{self.name}"] += 1
+        await release.wait()
+
+
+class Count(AsyncSubscriber):
+    command = CountCommand
+
+
+class Flaky(AsyncSubscriber):
+    command = FlakyCommand
+
+
+class Slow(AsyncSubscriber):
+    command = SlowCommand
+
+
+async def _stored(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(OutboxMessageORM))
+
+
+async def _relay(container, session_factory, subscribers, **outbox_options):
+    runs.clear()
+    container.event_bus.subscribe(ThingHappenedEvent, subscribers)
+    container.outbox = Outbox(
+        session_factory, container.session, container._deliver_outbox, **outbox_options
+    )
+    await container.async_subscribers.start()
+    return container.outbox
+
+
+async def test_failed_subscriber_is_retried_alone(bus, container, session_factory) -> None:
+    outbox = await _relay(container, session_factory, [Count, Flaky], retry_delay=0)
+    try:
+        await bus.execute(PublishThingCommand, {"name": "a"})
+        assert await _stored(session_factory) == 2
+
+        for _ in range(3):
+            await outbox.relay_once()
+    finally:
+        await container.async_subscribers.stop()
+
+    assert runs == {"count:a": 1, "flaky:a": 3}
+    assert outbox.stats()["retried"] == 2
+    assert outbox.stats()["delivered"] == 2
+    assert await _stored(session_factory) == 0
+
+
+async def test_lease_is_renewed_while_delivery_waits(bus, container, session_factory) -> None:
+    outbox = await _relay(container, session_factory, [Slow], lease_seconds=0.3)
+    release.clear()
+    try:
+        await bus.execute(PublishThingCommand, {"name": "b"})
+        first = asyncio.create_task(outbox.relay_once())
+        await asyncio.sleep(0.7)  # two lease lengths
+
+        # Still leased by the first relay (reclaimed, it would wait on `release` too).
+        assert await asyncio.wait_for(outbox.relay_once(), 1) == 0
+        release.set()
+        assert await first == 1
+    finally:
+        release.set()
+        await container.async_subscribers.stop()
+
+    assert runs == {"slow:b": 1}
+    assert await _stored(session_factory) == 0
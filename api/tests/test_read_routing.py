@@ -0,0 +1,120 @@
+"""Read routing with a primary and a replica: two SQLite files, replication never happens."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.commands.screen_commands import (
+    CreateScreenCommand,
+    DeleteScreenCommand,
+    GetScreenCommand,
+    ListScreensCommand,
+)
+from app.infrastructure.persistence.database import Base, ReadOnlySession
+from app.infrastructure.persistence.read_routing import (
+    ReadRouter,
+    Replica,
+    current_client,
+    session_wrote,
+)
+
+
+def _replica(path) -> Replica:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", isolation_level="AUTOCOMMIT")
+    return Replica(
+        name=path.name,
+        engine=engine,
+        session_factory=async_sessionmaker(
+            engine, class_=AsyncSession, sync_session_class=ReadOnlySession
+        ),
+    )
+
+
+@pytest.fixture
+async def replica(tmp_path) -> Replica:
+    replica = _replica(tmp_path / "replica.db")
+    async with replica.engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield replica
+    await replica.engine.dispose()
+
+
+@pytest.fixture
+def router(container, replica) -> ReadRouter:
+    container.read_router = ReadRouter(container.read_router.primary, [replica])
+    return container.read_router
+
+
+@contextmanager
+def client(name: str | None) -> Iterator[None]:
+    token = current_client.set(name)
+    try:
+        yield
+    finally:
+        current_client.reset(token)
+
+
+async def test_reads_go_to_the_replica_until_the_client_writes(bus, router, replica) -> None:
+    with client("alice"):
+        screen = await bus.execute(CreateScreenCommand, {"title": "t", "content": "c"})
+        # Read-your-writes: alice reads the primary for a while.
+        assert await bus.execute(GetScreenCommand, {"screen_id": screen.id}) == screen
+    with client("bob"):
+        # The replica has not seen the row.
+        assert await bus.execute(GetScreenCommand, {"screen_id": screen.id}) is None
+        # Cached reads always come from the primary.
+        assert [s.id for s in await bus.execute(ListScreensCommand)] == [screen.id]
+
+    assert router.sticky_reads == 1
+    assert replica.reads == 1
+
+
+async def test_transaction_that_only_read_does_not_stick(bus, router, replica) -> None:
+    with client(None):
+        screen = await bus.execute(CreateScreenCommand, {"title": "t", "content": "c"})
+    with client("carol"):
+        assert await bus.execute(DeleteScreenCommand, {"screen_id": uuid4()}) is False
+        assert await bus.execute(GetScreenCommand, {"screen_id": screen.id}) is None
+
+    assert router.sticky_reads == 0
+    assert replica.reads == 1
+
+
+async def test_unhealthy_replica_falls_back_to_the_primary(bus, container, tmp_path) -> None:
+    down = _replica(tmp_path / "missing" / "replica.db")
+    container.read_router = router = ReadRouter(container.read_router.primary, [down])
+    with client(None):
+        screen = await bus.execute(CreateScreenCommand, {"title": "t", "content": "c"})
+        await router.check()
+        assert await bus.execute(GetScreenCommand, {"screen_id": screen.id}) == screen
+
+    assert not down.healthy
+    assert router.primary_reads == 1
+    await down.engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "INSERT INTO screens SELECT * FROM screens WHERE 0",
+        "  -- comment\n  update screens SET title = 't'",
+        "/* comment */ DELETE FROM screens",
+        "WITH gone AS (SELECT id FROM screens) DELETE FROM screens WHERE id IN gone",
+    ],
+)
+async def test_text_writes_are_refused_and_tracked(container, session_factory, statement) -> None:
+    async with container.read_router.primary() as session:
+        with pytest.raises(RuntimeError, match="write statement"):
+            await session.execute(text(statement))
+        await session.execute(text("SELECT title FROM screens WHERE title = 'update'"))
+
+    async with session_factory() as session:
+        await session.execute(text("SELECT updated_at FROM screens"))
+        assert not session_wrote(session)
+        await session.execute(text(statement))
+        assert session_wrote(session)
+        assert not session_wrote(session)  # reset by the first call
@@ -0,0 +1,65 @@
+"""ResultCache invalidation against writes that commit while a result is computed."""
+
+import asyncio
+from dataclasses import dataclass
+
+from app.domain.events.base import Event
+from app.infrastructure.cache.result_cache import cached
+from app.infrastructure.commands import BaseCommand
+from app.infrastructure.decorators import transactional
+from app.infrastructure.events.event_bus import EventBus
+
+
+@dataclass(frozen=True)
+class CounterChangedEvent(Event):
+    pass
+
+
+# Counter value, and the events a slow read signals and waits on (set per test).
+_counter: dict = {"value": 0}
+
+
+@cached(ttl=60, invalidate_on=[CounterChangedEvent])
+class ReadCounterCommand(BaseCommand):
+    slow: bool = False
+
+    async def handle(self) -> int:
+        value = _counter["value"]
+        if self.slow:
+            _counter["reading"].set()
+            await _counter["release"].wait()
+        return value
+
+
+class IncrementCounterCommand(BaseCommand):
+    event_bus: EventBus
+
+    @transactional
+    async def handle(self) -> None:
+        _counter["value"] += 1
+        self.event_bus.publish(CounterChangedEvent())
+
+
+async def test_write_committed_during_first_miss_is_not_cached(bus, container) -> None:
+    _counter.update(value=0, reading=asyncio.Event(), release=asyncio.Event())
+    params = {"slow": True}
+
+    first_read = asyncio.create_task(bus.execute(ReadCounterCommand, params))
+    await _counter["reading"].wait()
+    await bus.execute(IncrementCounterCommand)
+    _counter["release"].set()
+
+    assert await first_read == 0
+    assert await bus.execute(ReadCounterCommand, params) == 1
+    assert container.result_cache.stats()["misses"] == 2
+
+
+async def test_commit_evicts_stored_results(bus, container) -> None:
+    _counter["value"] = 0
+
+    assert await bus.execute(ReadCounterCommand) == 0
+    await bus.execute(IncrementCounterCommand)
+    assert await bus.execute(ReadCounterCommand) == 1
+    assert await bus.execute(ReadCounterCommand) == 1
+    stats = container.result_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
@@ -0,0 +1,136 @@
+"""Telemetry segment codec, rollups, and compaction through the TelemetryRecorder."""
+
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+
+from app.domain.models.telemetry import HeartbeatSample, TelemetryResolution
+from app.infrastructure.persistence.models.telemetry import TelemetryRollupORM, TelemetrySegmentORM
+from app.infrastructure.persistence.repositories import SqlTelemetryRepository
+from app.infrastructure.persistence.telemetry_codec import NO_BATTERY, decode, encode, rollup
+from app.infrastructure.persistence.telemetry_recorder import TelemetryRecorder
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 1000])
+def test_codec_round_trip(count: int) -> None:
+    rng = np.random.default_rng(count)
+    timestamps = 1_767_225_600 + np.cumsum(rng.integers(0, 4000, count), dtype=np.int64)
+    battery = rng.integers(NO_BATTERY, 101, count).astype(np.int16)
+    battery[: min(count, 4)] = [100, NO_BATTERY, 100, 0][: min(count, 4)]  # extreme steps
+
+    decoded_ts, decoded_battery = decode(encode(timestamps, battery))
+
+    assert decoded_ts.dtype == np.int64
+    assert np.array_equal(decoded_ts, timestamps)
+    assert np.array_equal(decoded_battery, battery)
+
+
+def test_codec_is_compact_for_periodic_heartbeats() -> None:
+    timestamps = 1_767_225_600 + 60 * np.arange(1440, dtype=np.int64)
+    battery = np.repeat(np.arange(100, 76, -1, dtype=np.int16), 60)
+    assert len(encode(timestamps, battery)) < 100
+
+
+def test_rollup_matches_per_bucket_reference() -> None:
+    rng = np.random.default_rng(7)
+    timestamps = np.sort(1_767_225_600 + rng.integers(0, 86_400, 500)).astype(np.int64)
+    battery = rng.integers(NO_BATTERY, 101, 500).astype(np.int16)
+
+    buckets: dict[int, list[int]] = defaultdict(list)
+    for i, ts in enumerate(timestamps.tolist()):
+        buckets[ts - ts % 3600].append(i)
+    expected = []
+    for start, indices in buckets.items():
+        known = [int(battery[i]) for i in indices if battery[i] != NO_BATTERY]
+        gaps = [int(timestamps[i] - timestamps[max(i - 1, 0)]) for i in indices]
+        expected.append(
+            (
+                start,
+                len(indices),
+                min(known) if known else None,
+                max(known) if known else None,
+                sum(known) / len(known) if known else None,
+                max(gaps),
+            )
+        )
+
+    assert rollup(timestamps, battery, 3600) == pytest.approx(expected)
+
+
+def _samples(device_id: str, start: datetime, hours: int) -> list[HeartbeatSample]:
+    """A heartbeat every 5 minutes; every seventh one without a battery reading."""
+    return [
+        HeartbeatSample(
+            device_id, start + timedelta(minutes=5 * i), None if i % 7 == 3 else 100 - i // 30
+        )
+        for i in range(hours * 12)
+    ]
+
+
+async def test_compaction_stores_rollups_and_survives_raw_retention(session_factory) -> None:
+    @asynccontextmanager
+    async def scope():
+        async with session_factory() as session:
+            yield SqlTelemetryRepository(session)
+            await session.commit()
+
+    async def points(resolution: TelemetryResolution, start: datetime, end: datetime):
+        async with scope() as repository:
+            return await repository.get_points("dev-1", resolution, start, end)
+
+    now = datetime(2026, 3, 10, 12, 0)
+    first_day = datetime(2026, 3, 8)
+    recorder = TelemetryRecorder(
+        scope,
+        retention_days={
+            TelemetryResolution.RAW: 1,
+            TelemetryResolution.HOUR: 90,
+            TelemetryResolution.DAY: 730,
+        },
+        min_sample_interval=0,
+    )
+    samples = _samples("dev-1", first_day, hours=58) + _samples("dev-2", first_day, hours=10)
+    # Three flushes: the first two days end up split over several segments each.
+    for chunk in (samples[:200], samples[200:500], samples[500:]):
+        for sample in chunk:
+            recorder.record(sample)
+        await recorder.flush()
+
+    window = (first_day, now)
+    raw_before = await points(TelemetryResolution.RAW, *window)
+    hourly_before = await points(TelemetryResolution.HOUR, *window)
+    daily_before = await points(TelemetryResolution.DAY, *window)
+    assert len(raw_before) == 58 * 12
+    assert len(hourly_before) == 58
+    assert [p.samples for p in daily_before] == [288, 288, 120]
+
+    await recorder.maintain(now=now)
+
+    assert recorder.compacted == 3  # dev-1 on both closed days, dev-2 on the first
+    async with session_factory() as session:
+        segments = (
+            await session.execute(
+                select(TelemetrySegmentORM.day, TelemetrySegmentORM.compacted).order_by(
+                    TelemetrySegmentORM.day
+                )
+            )
+        ).all()
+        rollups = await session.scalar(select(func.count()).select_from(TelemetryRollupORM))
+    # RAW retention is one day: 2026-03-08 is gone, 03-09 is compacted, 03-10 is live.
+    assert [(str(day), compacted) for day, compacted in segments] == [
+        ("2026-03-09", True),
+        ("2026-03-10", False),
+    ]
+    assert rollups == 48 + 10 + 3
+
+    assert await points(TelemetryResolution.HOUR, *window) == hourly_before
+    assert await points(TelemetryResolution.DAY, *window) == daily_before
+    raw_after = await points(TelemetryResolution.RAW, *window)
+    # Same samples; only the gap of the first one changes, its predecessor was pruned.
+    assert [(p.at, p.battery_min) for p in raw_after] == [
+        (p.at, p.battery_min) for p in raw_before[288:]
+    ]